@@ -1,15 +1,33 @@
+import os
 import json
 import zipfile
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict
+from concurrent.futures import ThreadPoolExecutor
 from file_operations import FileOperations   # reuse your existing helper
 from notification_system import NotificationManager
 from dataclasses import dataclass, asdict
 
 logger = logging.getLogger(__name__)
 
+# Incremental index, kept in the backup destination
+INDEX_FILENAME = ".backup_index.json"
+
+# Hashing blocks in read(), which releases the GIL
+HASH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _stat_unchanged(entry: Dict, st: os.stat_result) -> bool:
+    """Whether an index entry's st_mtime_ns/size pair matches a stat result."""
+    return entry.get("st_mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size
+
+
+def _needs_checksum(entry: Optional[Dict], st: os.stat_result) -> bool:
+    """Whether an indexed file changed on disk and needs hashing to tell."""
+    return entry is not None and not _stat_unchanged(entry, st)
+
 @dataclass
 class BackupStats:
     total_files: int
@@ -31,48 +49,35 @@ class BackupEngine:
         self.notification_manager = notification_manager
         self.stats: Optional[BackupStats] = None
 
-   def backup_directory(
-    self,
-    source: str,
-    destination: str,
-    incremental: bool = False,
-    compression: bool = False,
-    exclude_patterns: Optional[List[str]] = None,
-    progress_callback: Optional[callable] = None
-) -> bool:
-    ...
-    files = list(source_path.rglob('*'))
-    total_files_to_process = len([f for f in files if f.is_file()])
-    processed = 0
-
-    for file_path in files:
-        if file_path.is_file():
-            rel_path = str(file_path.relative_to(source_path))
-            metadata = FileOperations.get_file_metadata(str(file_path))
-
-            # Skip unchanged files if incremental
-            if incremental and rel_path in previous_index:
-                prev_meta = previous_index[rel_path]
-                if prev_meta["checksum"] == metadata.checksum and \
-                   prev_meta["modified_time"] == metadata.modified_time:
-                    files_skipped += 1
-                    processed += 1
-                    if progress_callback:
-                        progress_callback(processed, total_files_to_process, rel_path, skipped=True)
-                    continue
-
-            # Copy file
-            dest_file = Path(destination) / rel_path
-            if FileOperations.copy_file(str(file_path), str(dest_file)):
-                total_files += 1
-                total_size += file_path.stat().st_size
-                previous_index[rel_path] = metadata.to_dict()
-            else:
-                errors += 1
+    def backup_directory(
+        self,
+        source: str,
+        destination: str,
+        incremental: bool = False,
+        compression: bool = False,
+        exclude_patterns: Optional[List[str]] = None,
+        progress_callback: Optional[callable] = None
+    ) -> bool:
+        """Backup a directory.
+
+        Incremental runs skip files whose st_mtime_ns and size match the
+        index. Only indexed files whose pair changed are hashed, in parallel,
+        and skipped if the checksum matches the stored one; files new to the
+        index are copied without hashing.
+        """
+        start_time = datetime.utcnow()
+        source_path = Path(source)
+
+        if not source_path.exists():
+            self.notification_manager.notify(
+                "Backup Failed",
+                f"Source directory does not exist: {source}",
+                "error"
+            )
+            return False
 
-            processed += 1
-            if progress_callback:
-                progress_callback(processed, total_files_to_process, rel_path, skipped=False)
+        index_file = Path(destination) / INDEX_FILENAME
+        previous_index: Dict[str, Dict] = {}
 
         # Load previous index if incremental
         if incremental and index_file.exists():
@@ -85,27 +90,62 @@ class BackupEngine:
         total_files, total_size, files_skipped, errors = 0, 0, 0, 0
 
         try:
+            files = []
             for file_path in source_path.rglob('*'):
                 if file_path.is_file():
-                    rel_path = str(file_path.relative_to(source_path))
-                    metadata = FileOperations.get_file_metadata(str(file_path))
-
-                    # Skip unchanged files if incremental
-                    if incremental and rel_path in previous_index:
-                        prev_meta = previous_index[rel_path]
-                        if prev_meta["checksum"] == metadata.checksum and \
-                           prev_meta["modified_time"] == metadata.modified_time:
-                            files_skipped += 1
-                            continue
-
-                    dest_file = Path(destination) / rel_path
-                    if FileOperations.copy_file(str(file_path), str(dest_file)):
-                        total_files += 1
-                        total_size += file_path.stat().st_size
-                        previous_index[rel_path] = metadata.to_dict()
-                    else:
-                        errors += 1
+                    if exclude_patterns and any(pattern in str(file_path) for pattern in exclude_patterns):
+                        files_skipped += 1
+                        continue
+                    files.append((file_path, str(file_path.relative_to(source_path)), file_path.stat()))
+
+            # Hash only files whose checksum decides whether they changed
+            to_hash = [
+                (rel_path, str(file_path)) for file_path, rel_path, st in files
+                if incremental and _needs_checksum(previous_index.get(rel_path), st)
+            ]
+            checksums: Dict[str, str] = {}
+            if to_hash:
+                with ThreadPoolExecutor(max_workers=HASH_WORKERS) as executor:
+                    hashed = executor.map(lambda item: FileOperations.calculate_checksum(item[1]), to_hash)
+                    checksums = {rel_path: checksum for (rel_path, _), checksum in zip(to_hash, hashed)}
+
+            total_files_to_process = len(files)
+            processed = 0
+
+            for file_path, rel_path, st in files:
+                checksum = checksums.get(rel_path, "")
+                entry = {
+                    "size": st.st_size,
+                    "st_mtime_ns": st.st_mtime_ns,
+                    "modified_time": st.st_mtime,
+                    "checksum": checksum
+                }
+                processed += 1
+
+                # Skip unchanged files if incremental
+                prev_meta = previous_index.get(rel_path) if incremental else None
+                if prev_meta is not None and (
+                    _stat_unchanged(prev_meta, st)
+                    or (checksum and prev_meta.get("checksum") == checksum)
+                ):
+                    if not _stat_unchanged(prev_meta, st):
+                        previous_index[rel_path] = entry
+                    files_skipped += 1
+                    if progress_callback:
+                        progress_callback(processed, total_files_to_process, rel_path, skipped=True)
+                    continue
 
+                # Copy file
+                dest_file = Path(destination) / rel_path
+                if FileOperations.copy_file(str(file_path), str(dest_file)):
+                    total_files += 1
+                    total_size += st.st_size
+                    previous_index[rel_path] = entry
+                else:
+                    errors += 1
+
+                if progress_callback:
+                    progress_callback(processed, total_files_to_process, rel_path, skipped=False)
             # Save updated index
             if incremental:
                 try:
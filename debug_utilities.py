@@ -9,12 +9,27 @@ import json
 import time
 import psutil
 import hashlib
+import heapq
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 
 
+# Byte-size units and platform capabilities, resolved once at import
+_GB = 1 << 30
+_MB = 1 << 20
+_HAS_LOADAVG = hasattr(os, 'getloadavg')
+_HAS_FALLOCATE = hasattr(os, 'posix_fallocate')
+
+# Directories that are never useful for migration planning
+DEFAULT_EXCLUDED_DIRS = frozenset({
+    '.git', 'node_modules', '__pycache__', '.venv', 'venv',
+    'System Volume Information', '$RECYCLE.BIN', '.Spotlight-V100', '.Trashes'
+})
+
 class SystemDiagnostics:
     """
     System diagnostics and performance monitoring for migration operations.
@@ -57,9 +72,9 @@ class SystemDiagnostics:
                 try:
                     usage = psutil.disk_usage(partition.mountpoint)
                     disk_usage[partition.device] = {
-                        'total_gb': usage.total / (1024**3),
-                        'used_gb': usage.used / (1024**3),
-                        'free_gb': usage.free / (1024**3),
+                        'total_gb': usage.total / _GB,
+                        'used_gb': usage.used / _GB,
+                        'free_gb': usage.free / _GB,
                         'percent_used': (usage.used / usage.total) * 100
                     }
                 except PermissionError:
@@ -69,13 +84,13 @@ class SystemDiagnostics:
             cpu_info = {
                 'cpu_count': psutil.cpu_count(),
                 'cpu_percent': psutil.cpu_percent(interval=1),
-                'load_average': os.getloadavg() if hasattr(os, 'getloadavg') else None
+                'load_average': os.getloadavg() if _HAS_LOADAVG else None
             }
             
             # Process information
             current_process = psutil.Process()
             process_info = {
-                'memory_mb': current_process.memory_info().rss / (1024**2),
+                'memory_mb': current_process.memory_info().rss / _MB,
                 'cpu_percent': current_process.cpu_percent(),
                 'open_files': len(current_process.open_files()),
                 'threads': current_process.num_threads()
@@ -84,9 +99,9 @@ class SystemDiagnostics:
             system_info = {
                 'timestamp': datetime.now().isoformat(),
                 'memory': {
-                    'total_gb': memory.total / (1024**3),
-                    'available_gb': memory.available / (1024**3),
-                    'used_gb': memory.used / (1024**3),
+                    'total_gb': memory.total / _GB,
+                    'available_gb': memory.available / _GB,
+                    'used_gb': memory.used / _GB,
                     'percent_used': memory.percent
                 },
                 'disk': disk_usage,
@@ -109,7 +124,7 @@ class SystemDiagnostics:
         # Memory recommendations
         if memory.percent > 85:
             recommendations.append("⚠️ High memory usage detected. Consider closing other applications.")
-        elif memory.available / (1024**3) < 2:
+        elif memory.available / _GB < 2:
             recommendations.append("⚠️ Low available memory. Migration may be slow.")
         
         # Disk recommendations
@@ -128,16 +143,27 @@ class SystemDiagnostics:
         
         return recommendations
     
-    def analyze_directory_structure(self, path: str, max_depth: int = 3) -> Dict:
+    def analyze_directory_structure(self, path: str, max_depth: int = 3,
+                                    exclude_dirs: Optional[set] = None,
+                                    skip_hidden: bool = False,
+                                    max_large_files: int = 1000,
+                                    max_deep_dirs: int = 1000,
+                                    max_problematic: int = 1000) -> Dict:
         """
         Analyze directory structure for potential migration issues.
         
         Args:
             path: Directory path to analyze
             max_depth: Maximum depth to scan
+            exclude_dirs: Directory names to skip (defaults to DEFAULT_EXCLUDED_DIRS)
+            skip_hidden: Also skip directories whose names start with '.'
+            max_large_files: Maximum number of large files to record
+            max_deep_dirs: Maximum number of deep directories to record
+            max_problematic: Maximum number of problematic names to record
             
         Returns:
-            Analysis results with recommendations
+            Analysis results with recommendations. Entries beyond the
+            evidence limits are counted in 'dropped_evidence'.
         """
         self.logger.info(f"Analyzing directory structure: {path}")
         
@@ -147,64 +173,66 @@ class SystemDiagnostics:
             'total_files': 0,
             'total_directories': 0,
             'total_size_gb': 0,
-            'file_types': {},
+            'file_types': Counter(),
             'large_files': [],
             'deep_directories': [],
             'problematic_names': [],
+            'dropped_evidence': Counter(),
             'recommendations': []
         }
         
+        if exclude_dirs is None:
+            exclude_dirs = DEFAULT_EXCLUDED_DIRS
+        
+        limits = {
+            'large_files': max_large_files,
+            'deep_directories': max_deep_dirs,
+            'problematic_names': max_problematic
+        }
+        
         try:
-            for root, dirs, files in os.walk(path):
-                # Check depth
-                depth = root.replace(path, '').count(os.sep)
-                if depth > max_depth:
-                    dirs.clear()  # Don't go deeper
-                    continue
-                
-                analysis['total_directories'] += len(dirs)
-                analysis['total_files'] += len(files)
-                
-                # Check for deep directory structures
-                if depth > 8:
-                    analysis['deep_directories'].append({
-                        'path': root,
-                        'depth': depth
-                    })
+            # Scan the top level here and fan the immediate subtrees out to
+            # worker threads; readdir/stat release the GIL, so independent
+            # subtrees can be listed concurrently.
+            root_scan, top_dirs = self._scan_subtree(
+                path, 0, max_depth, exclude_dirs, skip_hidden, limits, recurse=False
+            )
+            partials = [root_scan]
+            
+            if top_dirs and max_depth >= 1:
+                max_workers = min(32, (os.cpu_count() or 1) * 4, len(top_dirs))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [
+                        executor.submit(self._scan_subtree, top, 1, max_depth,
+                                        exclude_dirs, skip_hidden, limits)
+                        for top in top_dirs
+                    ]
+                    # A failed subtree loses only its own results
+                    for top, future in zip(top_dirs, futures):
+                        try:
+                            partials.append(future.result()[0])
+                        except Exception as e:
+                            analysis['error'] = str(e)
+                            self.logger.error(f"Error analyzing directory {top}: {e}")
+            
+            # Merge partial results (single-threaded, so no locking required)
+            total_bytes = 0
+            dropped = analysis['dropped_evidence']
+            for partial in partials:
+                analysis['total_files'] += partial['total_files']
+                analysis['total_directories'] += partial['total_directories']
+                total_bytes += partial['total_bytes']
+                analysis['file_types'].update(partial['file_types'])
+                dropped.update(partial['dropped_evidence'])
                 
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    
-                    try:
-                        # File size analysis
-                        file_size = os.path.getsize(file_path)
-                        analysis['total_size_gb'] += file_size / (1024**3)
-                        
-                        # Track large files (>1GB)
-                        if file_size > 1024**3:
-                            analysis['large_files'].append({
-                                'path': file_path,
-                                'size_gb': file_size / (1024**3)
-                            })
-                        
-                        # File type analysis
-                        ext = Path(file).suffix.lower()
-                        if ext:
-                            analysis['file_types'][ext] = analysis['file_types'].get(ext, 0) + 1
-                        else:
-                            analysis['file_types']['no_extension'] = analysis['file_types'].get('no_extension', 0) + 1
-                        
-                        # Check for problematic file names
-                        if any(char in file for char in ['<', '>', ':', '"', '|', '?', '*']):
-                            analysis['problematic_names'].append(file_path)
-                        
-                        # Check for very long file names
-                        if len(file) > 200:
-                            analysis['problematic_names'].append(f"{file_path} (long name)")
-                    
-                    except (OSError, PermissionError) as e:
-                        self.logger.warning(f"Cannot access file {file_path}: {e}")
-                        continue
+                for key, limit in limits.items():
+                    items = analysis[key]
+                    room = max(0, limit - len(items))
+                    items.extend(partial[key][:room])
+                    if len(partial[key]) > room:
+                        dropped[key] += len(partial[key]) - room
+            
+            analysis['total_size_gb'] = total_bytes / _GB
         
         except Exception as e:
             analysis['error'] = str(e)
@@ -216,6 +244,119 @@ class SystemDiagnostics:
         self.diagnostics_data['directory_analysis'] = analysis
         return analysis
     
+    def _scan_subtree(self, top: str, base_depth: int, max_depth: int,
+                      exclude_dirs: frozenset = DEFAULT_EXCLUDED_DIRS,
+                      skip_hidden: bool = False,
+                      limits: Optional[Dict[str, int]] = None,
+                      recurse: bool = True) -> Tuple[Dict, List[str]]:
+        """
+        Scan a single subtree for analyze_directory_structure.
+        
+        Args:
+            top: Directory to walk
+            base_depth: Depth of ``top`` relative to the analyzed root
+            max_depth: Maximum depth to scan
+            exclude_dirs: Directory names to prune from the walk
+            skip_hidden: Also prune directories whose names start with '.'
+            limits: Maximum number of entries to keep per evidence list
+            recurse: If False, only the files directly inside ``top`` are scanned
+            
+        Returns:
+            Tuple of (partial analysis, immediate subdirectory paths of ``top``)
+        """
+        total_files = 0
+        total_directories = 0
+        total_bytes = 0
+        file_types = Counter()
+        large_files = []
+        deep_directories = []
+        problematic_names = []
+        dropped = Counter()
+        top_dirs = []
+        limits = limits or {}
+        getsize = os.path.getsize
+        splitext = os.path.splitext
+        
+        def record(key: str, items: List, item) -> None:
+            # Keep evidence lists bounded; only count what doesn't fit
+            if len(items) < limits.get(key, 1000):
+                items.append(item)
+            else:
+                dropped[key] += 1
+        
+        for root, dirs, files in os.walk(top):
+            # Check depth
+            depth = base_depth + root[len(top):].count(os.sep)
+            if depth > max_depth:
+                dirs.clear()  # Don't go deeper
+                continue
+            
+            # Prune excluded directories in place so os.walk never descends
+            dirs[:] = [
+                d for d in dirs
+                if d not in exclude_dirs and not (skip_hidden and d.startswith('.'))
+            ]
+            
+            total_directories += len(dirs)
+            total_files += len(files)
+            
+            # Check for deep directory structures
+            if depth > 8:
+                record('deep_directories', deep_directories, {
+                    'path': root,
+                    'depth': depth
+                })
+            
+            root_prefix = root if root.endswith(os.sep) else root + os.sep
+            for file in files:
+                file_path = root_prefix + file
+                
+                try:
+                    # File size analysis
+                    file_size = getsize(file_path)
+                    total_bytes += file_size
+                    
+                    # Track large files (>1GB)
+                    if file_size > _GB:
+                        record('large_files', large_files, {
+                            'path': file_path,
+                            'size_gb': file_size / _GB
+                        })
+                    
+                    # File type analysis
+                    ext = splitext(file)[1].lower()
+                    file_types[ext if len(ext) > 1 else 'no_extension'] += 1
+                    
+                    # Check for problematic file names
+                    if any(char in file for char in ['<', '>', ':', '"', '|', '?', '*']):
+                        record('problematic_names', problematic_names, file_path)
+                    
+                    # Check for very long file names
+                    if len(file) > 200:
+                        record('problematic_names', problematic_names, f"{file_path} (long name)")
+                
+                except (OSError, PermissionError) as e:
+                    self.logger.warning(f"Cannot access file {file_path}: {e}")
+                    continue
+            
+            if not recurse:
+                # os.walk does not follow symlinked directories, so neither
+                # do the workers
+                top_dirs = [root_prefix + d for d in dirs if not os.path.islink(root_prefix + d)]
+                break
+        
+        partial = {
+            'total_files': total_files,
+            'total_directories': total_directories,
+            'total_bytes': total_bytes,
+            'file_types': file_types,
+            'large_files': large_files,
+            'deep_directories': deep_directories,
+            'problematic_names': problematic_names,
+            'dropped_evidence': dropped
+        }
+        return partial, top_dirs
+    
     def _generate_directory_recommendations(self, analysis: Dict) -> List[str]:
         """Generate recommendations based on directory analysis."""
         recommendations = []
@@ -232,17 +373,23 @@ class SystemDiagnostics:
         elif analysis['total_size_gb'] > 100:
             recommendations.append("💡 Large data set (>100GB). Monitor progress during migration.")
         
+        # Evidence lists are capped, so include anything that was dropped
+        dropped = analysis.get('dropped_evidence', {})
+        large_count = len(analysis['large_files']) + dropped.get('large_files', 0)
+        deep_count = len(analysis['deep_directories']) + dropped.get('deep_directories', 0)
+        problematic_count = len(analysis['problematic_names']) + dropped.get('problematic_names', 0)
+        
         # Large files
-        if len(analysis['large_files']) > 0:
-            recommendations.append(f"📁 {len(analysis['large_files'])} files >1GB detected. These may take longer to process.")
+        if large_count > 0:
+            recommendations.append(f"📁 {large_count} files >1GB detected. These may take longer to process.")
         
         # Deep directories
-        if len(analysis['deep_directories']) > 0:
-            recommendations.append(f"📂 {len(analysis['deep_directories'])} very deep directory structures found. May cause path length issues.")
+        if deep_count > 0:
+            recommendations.append(f"📂 {deep_count} very deep directory structures found. May cause path length issues.")
         
         # Problematic names
-        if len(analysis['problematic_names']) > 0:
-            recommendations.append(f"⚠️ {len(analysis['problematic_names'])} files with problematic names. May need renaming.")
+        if problematic_count > 0:
+            recommendations.append(f"⚠️ {problematic_count} files with problematic names. May need renaming.")
         
         # File type diversity
         if len(analysis['file_types']) > 50:
@@ -264,7 +411,7 @@ class SystemDiagnostics:
         self.logger.info(f"Testing drive performance: {drive_path}")
         
         test_file = os.path.join(drive_path, f"performance_test_{int(time.time())}.tmp")
-        test_data = b'0' * (1024 * 1024)  # 1MB of data
+        test_data = b'0' * _MB  # 1MB of data
         
         performance = {
             'drive_path': drive_path,
@@ -276,20 +423,31 @@ class SystemDiagnostics:
         }
         
         try:
-            # Write test
-            write_start = time.time()
-            with open(test_file, 'wb') as f:
+            # Write test. Preallocate the file first so the timed loop measures
+            # device bandwidth rather than block-allocator metadata updates,
+            # and fsync inside the timer so page-cache staging isn't counted.
+            fd = os.open(test_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0))
+            with os.fdopen(fd, 'wb') as f:
+                if _HAS_FALLOCATE:
+                    try:
+                        os.posix_fallocate(fd, 0, test_size_mb * _MB)
+                    except OSError:
+                        pass  # Filesystem doesn't support preallocation
+                
+                write_start = time.perf_counter()
                 for _ in range(test_size_mb):
                     f.write(test_data)
-            write_time = time.time() - write_start
+                f.flush()
+                os.fsync(fd)
+                write_time = time.perf_counter() - write_start
             performance['write_speed_mbps'] = test_size_mb / write_time
             
             # Read test
-            read_start = time.time()
+            read_start = time.perf_counter()
             with open(test_file, 'rb') as f:
-                while f.read(1024 * 1024):
+                while f.read(_MB):
                     pass
-            read_time = time.time() - read_start
+            read_time = time.perf_counter() - read_start
             performance['read_speed_mbps'] = test_size_mb / read_time
             
             # Cleanup
@@ -352,14 +510,27 @@ class MigrationDebugger:
     Specialized debugging tools for migration operations.
     """
     
-    def __init__(self):
+    # Indexed by _bottleneck_index()
+    BOTTLENECK_CATEGORIES = ('large_file_io', 'slow_disk_io', 'moderate_delay', 'normal_operation')
+    
+    def __init__(self, trace_flush_threshold: int = 256, statvfs_ttl: float = 2.0):
         self.logger = self._setup_logging()
         self.debug_session = {
             'start_time': datetime.now().isoformat(),
-            'operations': [],
+            'operations': 0,
             'errors': [],
-            'warnings': []
+            'warnings': Counter()
         }
+        
+        # Traces are buffered and spilled to a newline-delimited JSON file so
+        # memory stays flat regardless of how many operations are traced
+        self._trace_buf: List[str] = []
+        self._trace_flush_threshold = trace_flush_threshold
+        # Free space on a destination rarely changes between consecutive
+        # traces, so statvfs results are reused for a short TTL
+        self._statvfs_cache: Dict[str, Tuple[float, Any]] = {}
+        self._statvfs_ttl = statvfs_ttl
+        self._trace_path = f'migration_traces_{datetime.now().strftime("%Y%m%d_%H%M%S")}_{id(self):x}.ndjson'
     
     def _setup_logging(self) -> logging.Logger:
         """Set up debug logging."""
@@ -397,15 +568,16 @@ class MigrationDebugger:
         Returns:
             Operation trace results
         """
-        trace_id = f"{operation}_{int(time.time())}"
-        trace_start = time.time()
+        start_time_ns = time.time_ns()
+        trace_id = f"{operation}_{start_time_ns // 1_000_000_000}"
+        trace_start = time.perf_counter_ns()
         
         trace_data = {
             'trace_id': trace_id,
             'operation': operation,
             'source': source,
             'destination': destination,
-            'start_time': datetime.now().isoformat(),
+            'start_time_ns': start_time_ns,
             'source_exists': os.path.exists(source) if source else False,
             'source_size': None,
             'source_permissions': None,
@@ -425,7 +597,7 @@ class MigrationDebugger:
                 trace_data['source_permissions'] = oct(stat_info.st_mode)[-3:]
                 
                 # Check for potential issues
-                if stat_info.st_size > 2 * 1024**3:  # >2GB
+                if stat_info.st_size > 2 * _GB:  # >2GB
                     trace_data['warnings'].append("Large file - operation may take time")
                 
                 if not os.access(source, os.R_OK):
@@ -435,7 +607,7 @@ class MigrationDebugger:
             if destination:
                 dest_dir = os.path.dirname(destination)
                 if os.path.exists(dest_dir):
-                    dest_stat = os.statvfs(dest_dir)
+                    dest_stat = self._cached_statvfs(dest_dir)
                     trace_data['destination_space'] = dest_stat.f_bavail * dest_stat.f_frsize
                     
                     # Check space requirements
@@ -447,23 +619,64 @@ class MigrationDebugger:
                     trace_data['warnings'].append("Destination file already exists")
             
             # Record operation
-            trace_data['operation_duration'] = time.time() - trace_start
+            trace_data['operation_duration'] = (time.perf_counter_ns() - trace_start) / 1e9
             trace_data['success'] = True
             
         except Exception as e:
             trace_data['error'] = str(e)
-            trace_data['operation_duration'] = time.time() - trace_start
+            trace_data['operation_duration'] = (time.perf_counter_ns() - trace_start) / 1e9
             self.logger.error(f"File operation trace failed: {e}")
         
-        self.debug_session['operations'].append(trace_data)
+        self.debug_session['operations'] += 1
+        self._trace_buf.append(json.dumps(trace_data))
+        if len(self._trace_buf) >= self._trace_flush_threshold:
+            self.flush_traces()
         
         if trace_data['error']:
             self.debug_session['errors'].append(trace_data)
         
         if trace_data['warnings']:
-            self.debug_session['warnings'].extend(trace_data['warnings'])
+            self.debug_session['warnings'].update(trace_data['warnings'])
+        
+        # Callers get the record with its ISO 'start_time', as before
+        return self._format_trace(trace_data)
+    
+    def _cached_statvfs(self, directory: str):
+        """Return os.statvfs(directory), reusing a result younger than the TTL."""
+        now = time.monotonic()
+        cached = self._statvfs_cache.get(directory)
+        if cached and now - cached[0] < self._statvfs_ttl:
+            return cached[1]
+        
+        # Drop expired entries so the cache can't grow without bound
+        if len(self._statvfs_cache) >= 1024:
+            self._statvfs_cache = {
+                d: entry for d, entry in self._statvfs_cache.items()
+                if now - entry[0] < self._statvfs_ttl
+            }
+        
+        result = os.statvfs(directory)
+        self._statvfs_cache[directory] = (now, result)
+        return result
+    
+    def flush_traces(self) -> None:
+        """Append buffered trace records to the session trace file."""
+        if not self._trace_buf:
+            return
+        
+        with open(self._trace_path, 'a', encoding='utf-8') as f:
+            f.write('\n'.join(self._trace_buf) + '\n')
+        self._trace_buf.clear()
+    
+    def _load_traces(self) -> List[Dict]:
+        """Read back every trace recorded in this session."""
+        self.flush_traces()
         
-        return trace_data
+        if not os.path.exists(self._trace_path):
+            return []
+        
+        with open(self._trace_path, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
     
     def analyze_migration_bottlenecks(self, migration_log: List[Dict]) -> Dict:
         """
@@ -487,52 +700,58 @@ class MigrationDebugger:
         if not migration_log:
             return analysis
         
-        # Calculate timing statistics
+        # Gather durations and bottleneck categories in a single pass
         operation_times = []
+        category_counts = [0] * len(self.BOTTLENECK_CATEGORIES)
+        bottleneck_index = self._bottleneck_index
         for op in migration_log:
-            if 'duration' in op and op['duration']:
-                operation_times.append(op['duration'])
-                analysis['total_time'] += op['duration']
+            duration = op.get('duration')
+            if duration:
+                operation_times.append(duration)
+            category_counts[bottleneck_index(duration or 0, op.get('size', 0))] += 1
         
         if operation_times:
+            analysis['total_time'] = sum(operation_times)
             analysis['average_time_per_operation'] = analysis['total_time'] / len(operation_times)
             
             # Find slowest operations (top 10% or >10 seconds)
-            slow_threshold = max(10.0, sorted(operation_times, reverse=True)[len(operation_times)//10])
+            k = len(operation_times) // 10 + 1
+            slow_threshold = max(10.0, heapq.nlargest(k, operation_times)[-1])
             
             for op in migration_log:
-                if op.get('duration', 0) > slow_threshold:
+                duration = op.get('duration', 0)
+                if duration > slow_threshold:
+                    size = op.get('size')
                     analysis['slowest_operations'].append({
                         'operation': op.get('operation', 'unknown'),
                         'file': op.get('source', 'unknown'),
-                        'duration': op['duration'],
-                        'size_mb': op.get('size', 0) / (1024**2) if op.get('size') else 0
+                        'duration': duration,
+                        'size_mb': size / _MB if size else 0
                     })
         
-        # Categorize bottlenecks
-        for op in migration_log:
-            category = self._categorize_bottleneck(op)
-            analysis['bottleneck_categories'][category] = analysis['bottleneck_categories'].get(category, 0) + 1
+        analysis['bottleneck_categories'] = {
+            category: count
+            for category, count in zip(self.BOTTLENECK_CATEGORIES, category_counts)
+            if count
+        }
         
         # Generate recommendations
         analysis['recommendations'] = self._generate_bottleneck_recommendations(analysis)
         
         return analysis
     
+    @staticmethod
+    def _bottleneck_index(duration: float, size: int) -> int:
+        """Map an operation's duration and size to an index into BOTTLENECK_CATEGORIES."""
+        if duration > 30:  # >30 seconds
+            return 0 if size > 100 * _MB else 1  # >100MB
+        return 2 if duration > 5 else 3  # 5-30 seconds
+    
     def _categorize_bottleneck(self, operation: Dict) -> str:
         """Categorize the type of bottleneck for an operation."""
-        duration = operation.get('duration', 0)
-        size = operation.get('size', 0)
-        
-        if duration > 30:  # >30 seconds
-            if size > 100 * 1024**2:  # >100MB
-                return "large_file_io"
-            else:
-                return "slow_disk_io"
-        elif duration > 5:  # 5-30 seconds
-            return "moderate_delay"
-        else:
-            return "normal_operation"
+        return self.BOTTLENECK_CATEGORIES[
+            self._bottleneck_index(operation.get('duration', 0), operation.get('size', 0))
+        ]
     
     def _generate_bottleneck_recommendations(self, analysis: Dict) -> List[str]:
         """Generate recommendations based on bottleneck analysis."""
@@ -554,11 +773,16 @@ class MigrationDebugger:
     
     def create_debug_summary(self) -> Dict:
         """Create summary of debug session."""
+        session_info = dict(self.debug_session)
+        session_info['operations'] = [self._format_trace(trace) for trace in self._load_traces()]
+        session_info['errors'] = [self._format_trace(trace) for trace in self.debug_session['errors']]
+        session_info['trace_file'] = self._trace_path
+        
         summary = {
-            'session_info': self.debug_session,
-            'total_operations': len(self.debug_session['operations']),
+            'session_info': session_info,
+            'total_operations': self.debug_session['operations'],
             'total_errors': len(self.debug_session['errors']),
-            'total_warnings': len(self.debug_session['warnings']),
+            'total_warnings': sum(self.debug_session['warnings'].values()),
             'session_duration': datetime.now().isoformat(),
             'most_common_errors': self._get_common_errors(),
             'most_common_warnings': self._get_common_warnings()
@@ -566,24 +790,32 @@ class MigrationDebugger:
         
         return summary
     
+    @staticmethod
+    def _format_ts(ns: int) -> str:
+        """Format a time.time_ns() timestamp as an ISO 8601 string."""
+        return datetime.fromtimestamp(ns / 1e9).isoformat()
+    
+    def _format_trace(self, trace: Dict) -> Dict:
+        """Return a copy of a trace record with its start timestamp formatted."""
+        formatted = dict(trace)
+        formatted['start_time'] = self._format_ts(formatted.pop('start_time_ns'))
+        return formatted
+    
     def _get_common_errors(self) -> List[Dict]:
         """Get most common error types."""
-        error_counts = {}
-        for error in self.debug_session['errors']:
-            error_type = error.get('error', 'Unknown error')
-            error_counts[error_type] = error_counts.get(error_type, 0) + 1
+        error_counts = Counter(
+            error.get('error', 'Unknown error') for error in self.debug_session['errors']
+        )
         
         return [{'error': error, 'count': count} 
-                for error, count in sorted(error_counts.items(), key=lambda x: x[1], reverse=True)]
+                for error, count in error_counts.most_common()]
     
     def _get_common_warnings(self) -> List[Dict]:
         """Get most common warning types."""
-        warning_counts = {}
-        for warning in self.debug_session['warnings']:
-            warning_counts[warning] = warning_counts.get(warning, 0) + 1
+        warning_counts = self.debug_session['warnings']
         
         return [{'warning': warning, 'count': count} 
-                for warning, count in sorted(warning_counts.items(), key=lambda x: x[1], reverse=True)]
+                for warning, count in warning_counts.most_common()]
 
 
 def main():
@@ -9,20 +9,154 @@ Classes:
     FileAnalyzer: Analyzes file properties and metadata
 """
 
+import io
 import os
 import re
+import mmap
+import bisect
+import fnmatch
+import stat
+import functools
 import mimetypes
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Union, Callable, Set
+from typing import List, Dict, Tuple, Optional, Union, Callable, Set, Iterator
 from dataclasses import dataclass
 from datetime import datetime
+from collections import defaultdict
 import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Load the MIME type map up front rather than on the first get_file_info call
+mimetypes.init()
+
+# Hashing and content scans block in read(), which releases the GIL
+DEFAULT_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Files below this size are read and decoded; larger ones are memory-mapped
+MMAP_MIN_SIZE = 4096
+
+# Checksums of files above this size are computed over mmap windows
+LARGE_HASH_THRESHOLD = 64 << 20
+HASH_WINDOW_SIZE = 16 << 20
+
+# Read size for the fallback hashing loop
+HASH_BUFFER_SIZE = io.DEFAULT_BUFFER_SIZE * 64
+
+
+def _hash_readinto(f, algorithm: str):
+    """Hash an open file by reading into one reusable buffer."""
+    hash_obj = hashlib.new(algorithm)
+    buf = bytearray(HASH_BUFFER_SIZE)
+    view = memoryview(buf)
+    while True:
+        n = f.readinto(buf)
+        if not n:
+            break
+        hash_obj.update(view[:n])
+    return hash_obj
+
+
+def _hash_mmap(f, size: int, algorithm: str):
+    """
+    Hash an open file by feeding memory-mapped windows to hashlib.
+    
+    Windows are passed as memoryview slices, so no bytes are copied into
+    Python objects before reaching the hash implementation.
+    """
+    hash_obj = hashlib.new(algorithm)
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, 'madvise'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        view = memoryview(mm)
+        try:
+            for offset in range(0, size, HASH_WINDOW_SIZE):
+                hash_obj.update(view[offset:offset + HASH_WINDOW_SIZE])
+        finally:
+            view.release()
+    return hash_obj
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(pattern: str, flags: int = 0) -> re.Pattern:
+    """Compile a regex pattern, memoized across all validators, searchers and filters."""
+    return re.compile(pattern, flags)
+
+
+# Constructs whose meaning changes between str and bytes patterns (Unicode vs
+# ASCII classes, one character vs one byte, escapes naming code points)
+_UNICODE_SENSITIVE = re.compile(r'\\[wWbBdDsSxuUN0-9]|\.|\[\^')
+
+
+def _compile_bytes(pattern: str, flags: int = 0) -> Optional[re.Pattern]:
+    """
+    Compile a bytes equivalent of a str pattern for scanning mmapped files.
+    
+    Returns None when the pattern is not ASCII-only or uses a construct that
+    matches differently on bytes; such patterns must be run on decoded text.
+    """
+    if not pattern.isascii() or _UNICODE_SENSITIVE.search(pattern):
+        return None
+    try:
+        return re.compile(pattern.encode('ascii'), flags)
+    except re.error:
+        return None
+
+
+def _name_ext(name: str) -> str:
+    """
+    Get the extension of a bare file name, without the dot.
+    
+    Equivalent to os.path.splitext(name)[1].lstrip('.') for a name with no
+    directory part, using a single right-to-left scan.
+    """
+    i = name.rfind('.')
+    if i <= 0 or (name[0] == '.' and not name[:i].lstrip('.')):
+        return ''
+    return name[i + 1:]
+
+
+def _ext(path: str) -> str:
+    """Get a path's extension without the dot, as os.path.splitext would."""
+    i = path.rfind(os.sep)
+    if os.altsep:
+        i = max(i, path.rfind(os.altsep))
+    return _name_ext(path[i + 1:])
+
+
+def _iter_files(root: str, recursive: bool = True) -> Iterator[os.DirEntry]:
+    """
+    Yield a DirEntry for every file under root.
+    
+    Uses os.scandir so callers can rely on the cached DirEntry.is_file()
+    and DirEntry.stat() results instead of issuing extra stat() calls.
+    Unreadable directories are skipped, matching Path.glob behavior.
+    
+    Args:
+        root: Directory to walk
+        recursive: Whether to descend into subdirectories
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
 
 @dataclass
 class FileInfo:
@@ -68,31 +202,40 @@ class FileValidator:
         self.max_file_size = max_file_size
         self.min_file_size = min_file_size
     
-    def validate_file_exists(self, file_path: str) -> Tuple[bool, str]:
+    def validate_file_exists(self, file_path: str,
+                             stat_result: Optional[os.stat_result] = None) -> Tuple[bool, str]:
         """
         Validate if file exists.
         
         Args:
             file_path: Path to the file
+            stat_result: Prefetched os.stat() result for file_path, if available
             
         Returns:
             Tuple of (is_valid, message)
         """
-        if not os.path.exists(file_path):
+        if stat_result is None and not os.path.exists(file_path):
             return False, f"File does not exist: {file_path}"
         return True, "File exists"
     
-    def validate_is_file(self, file_path: str) -> Tuple[bool, str]:
+    def validate_is_file(self, file_path: str,
+                         stat_result: Optional[os.stat_result] = None) -> Tuple[bool, str]:
         """
         Validate if path points to a file (not directory).
         
         Args:
             file_path: Path to validate
+            stat_result: Prefetched os.stat() result for file_path, if available
             
         Returns:
             Tuple of (is_valid, message)
         """
-        if not os.path.isfile(file_path):
+        if stat_result is not None:
+            is_file = stat.S_ISREG(stat_result.st_mode)
+        else:
+            is_file = os.path.isfile(file_path)
+        
+        if not is_file:
             return False, f"Path is not a file: {file_path}"
         return True, "Path is a valid file"
     
@@ -109,27 +252,31 @@ class FileValidator:
         if not self.allowed_extensions:
             return True, "No extension restrictions"
         
-        _, ext = os.path.splitext(file_path)
-        ext = ext.lstrip('.').lower()
+        ext = _ext(file_path).lower()
         
         if ext not in self.allowed_extensions:
             return False, f"Extension '{ext}' not allowed. Allowed: {self.allowed_extensions}"
         return True, f"Extension '{ext}' is valid"
     
-    def validate_file_size(self, file_path: str) -> Tuple[bool, str]:
+    def validate_file_size(self, file_path: str,
+                           stat_result: Optional[os.stat_result] = None) -> Tuple[bool, str]:
         """
         Validate file size constraints.
         
         Args:
             file_path: Path to the file
+            stat_result: Prefetched os.stat() result for file_path, if available
             
         Returns:
             Tuple of (is_valid, message)
         """
-        try:
-            file_size = os.path.getsize(file_path)
-        except OSError as e:
-            return False, f"Cannot read file size: {e}"
+        if stat_result is not None:
+            file_size = stat_result.st_size
+        else:
+            try:
+                file_size = os.path.getsize(file_path)
+            except OSError as e:
+                return False, f"Cannot read file size: {e}"
         
         if file_size < self.min_file_size:
             return False, f"File size ({file_size} bytes) is below minimum ({self.min_file_size} bytes)"
@@ -179,7 +326,7 @@ class FileValidator:
             Tuple of (is_valid, message)
         """
         try:
-            if re.match(pattern, file_path):
+            if _compile(pattern).match(file_path):
                 return True, f"Path matches pattern: {pattern}"
             return False, f"Path does not match pattern: {pattern}"
         except re.error as e:
@@ -199,10 +346,15 @@ class FileValidator:
             Tuple of (is_valid, message)
         """
         try:
-            hash_obj = hashlib.new(algorithm)
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b''):
-                    hash_obj.update(chunk)
+            with open(file_path, 'rb', buffering=0) as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > LARGE_HASH_THRESHOLD:
+                    hash_obj = _hash_mmap(f, size, algorithm)
+                elif hasattr(hashlib, 'file_digest'):
+                    # Python 3.11+: read/update loop runs in C
+                    hash_obj = hashlib.file_digest(f, algorithm)
+                else:
+                    hash_obj = _hash_readinto(f, algorithm)
             actual_checksum = hash_obj.hexdigest()
             
             if actual_checksum == expected_checksum:
@@ -211,6 +363,28 @@ class FileValidator:
         except Exception as e:
             return False, f"Error validating checksum: {e}"
     
+    def validate_checksums_many(self, expected_checksums: Dict[str, str],
+                                algorithm: str = 'md5',
+                                max_workers: Optional[int] = None) -> Dict[str, Tuple[bool, str]]:
+        """
+        Validate checksums for many files concurrently.
+        
+        Args:
+            expected_checksums: Mapping of file path to expected checksum
+            algorithm: Hash algorithm (md5, sha1, sha256)
+            max_workers: Number of worker threads (defaults to DEFAULT_IO_WORKERS)
+            
+        Returns:
+            Dictionary mapping each file path to its (is_valid, message) result
+        """
+        paths = list(expected_checksums)
+        with ThreadPoolExecutor(max_workers=max_workers or DEFAULT_IO_WORKERS) as executor:
+            results = executor.map(
+                lambda path: self.validate_checksum(path, expected_checksums[path], algorithm),
+                paths
+            )
+            return dict(zip(paths, results))
+    
     def validate_complete(self, file_path: str, check_readability: bool = True,
                          check_writable: bool = False) -> Dict[str, Tuple[bool, str]]:
         """
@@ -224,11 +398,18 @@ class FileValidator:
         Returns:
             Dictionary of validation results
         """
+        # Stat once and share the result; if it fails, the individual
+        # validators re-probe to report their usual messages
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            st = None
+        
         results = {
-            'exists': self.validate_file_exists(file_path),
-            'is_file': self.validate_is_file(file_path),
+            'exists': self.validate_file_exists(file_path, st),
+            'is_file': self.validate_is_file(file_path, st),
             'extension': self.validate_extension(file_path),
-            'size': self.validate_file_size(file_path),
+            'size': self.validate_file_size(file_path, st),
         }
         
         if check_readability:
@@ -260,6 +441,103 @@ class FileSearcher:
         self.root_path = root_path
         if not os.path.isdir(root_path):
             raise ValueError(f"Root path must be a directory: {root_path}")
+        
+        # (root mtime, [(name, path), ...]) per recursive flag, reused by
+        # name/extension searches until the root directory changes
+        self._file_cache: Dict[bool, Tuple[int, List[Tuple[str, str]]]] = {}
+    
+    def _all_files(self, recursive: bool = True) -> List[Tuple[str, str]]:
+        """
+        Get (name, path) pairs for every file under the root.
+        
+        The listing is cached and only rebuilt when the root directory's
+        mtime changes, so repeated name searches don't rewalk the tree.
+        Changes confined to subdirectories are not detected.
+        """
+        stamp = os.stat(self.root_path).st_mtime_ns
+        cached = self._file_cache.get(recursive)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        
+        files = [(entry.name, entry.path) for entry in _iter_files(self.root_path, recursive)]
+        self._file_cache[recursive] = (stamp, files)
+        return files
+    
+    def search(self, min_size: int = 0, max_size: Optional[int] = None,
+               modified_after: Optional[float] = None, name_pattern: Optional[str] = None,
+               regex: Optional[str] = None, recursive: bool = True) -> List[str]:
+        """
+        Search files matching all of the given criteria in one directory pass.
+        
+        Args:
+            min_size: Minimum file size in bytes
+            max_size: Maximum file size in bytes
+            modified_after: Only include files modified after this Unix timestamp
+            name_pattern: Glob pattern matched against file names
+            regex: Regex pattern searched in file names
+            recursive: Whether to search recursively
+            
+        Returns:
+            List of matching file paths
+        """
+        return [entry.path for entry in self.search_entries(
+            min_size, max_size, modified_after, name_pattern, regex, recursive
+        )]
+    
+    def search_entries(self, min_size: int = 0, max_size: Optional[int] = None,
+                       modified_after: Optional[float] = None, name_pattern: Optional[str] = None,
+                       regex: Optional[str] = None, recursive: bool = True) -> List[os.DirEntry]:
+        """
+        Search files matching all of the given criteria, returning DirEntry objects.
+        
+        Name checks run before any stat() call, and each entry is stat()ed
+        at most once (DirEntry caches the result). Walks the tree afresh so
+        the entries' cached stat() results are current; pass them to
+        FileAnalyzer.analyze_multiple to avoid a second stat per file.
+        
+        Args:
+            min_size: Minimum file size in bytes
+            max_size: Maximum file size in bytes
+            modified_after: Only include files modified after this Unix timestamp
+            name_pattern: Glob pattern matched against file names
+            regex: Regex pattern searched in file names
+            recursive: Whether to search recursively
+            
+        Returns:
+            List of matching DirEntry objects
+        """
+        results = []
+        try:
+            name_matcher = None
+            if name_pattern is not None:
+                flags = re.IGNORECASE if os.name == 'nt' else 0
+                name_matcher = _compile(fnmatch.translate(name_pattern), flags).match
+            regex_search = _compile(regex).search if regex is not None else None
+            needs_stat = min_size > 0 or max_size is not None or modified_after is not None
+            
+            for entry in _iter_files(self.root_path, recursive):
+                name = entry.name
+                if name_matcher and not name_matcher(name):
+                    continue
+                if regex_search and not regex_search(name):
+                    continue
+                
+                if needs_stat:
+                    st = entry.stat()
+                    if st.st_size < min_size:
+                        continue
+                    if max_size is not None and st.st_size > max_size:
+                        continue
+                    if modified_after is not None and st.st_mtime <= modified_after:
+                        continue
+                
+                results.append(entry)
+        except re.error as e:
+            logger.error(f"Invalid regex pattern: {e}")
+        except Exception as e:
+            logger.error(f"Error searching files: {e}")
+        
+        return results
     
     def search_by_name(self, name_pattern: str, recursive: bool = True) -> List[str]:
         """
@@ -274,15 +552,38 @@ class FileSearcher:
         """
         results = []
         try:
-            if recursive:
-                results = list(Path(self.root_path).rglob(name_pattern))
-            else:
-                results = list(Path(self.root_path).glob(name_pattern))
-            return [str(p) for p in results if p.is_file()]
+            if '/' in name_pattern or os.sep in name_pattern:
+                # Path-style patterns still need pathlib's segment matching
+                if recursive:
+                    results = list(Path(self.root_path).rglob(name_pattern))
+                else:
+                    results = list(Path(self.root_path).glob(name_pattern))
+                return [str(p) for p in results if p.is_file()]
+            
+            flags = re.IGNORECASE if os.name == 'nt' else 0
+            matcher = _compile(fnmatch.translate(name_pattern), flags).match
+            return [path for name, path in self._all_files(recursive) if matcher(name)]
         except Exception as e:
             logger.error(f"Error searching by name: {e}")
             return []
     
+    def search_by_name_entries(self, name_pattern: str, recursive: bool = True) -> List[os.DirEntry]:
+        """
+        Search files by name pattern, returning DirEntry objects.
+        
+        Walks the tree afresh so the entries' cached stat() results are
+        current; pass them to FileAnalyzer.analyze_multiple to avoid a
+        second stat per file.
+        
+        Args:
+            name_pattern: Glob pattern or exact name (matched against file names)
+            recursive: Whether to search recursively
+            
+        Returns:
+            List of matching DirEntry objects
+        """
+        return self.search_entries(name_pattern=name_pattern, recursive=recursive)
+    
     def search_by_extension(self, extension: str, recursive: bool = True) -> List[str]:
         """
         Search files by extension.
@@ -297,8 +598,14 @@ class FileSearcher:
         if not extension.startswith('.'):
             extension = '.' + extension
         
-        pattern = f"*{extension}"
-        return self.search_by_name(pattern, recursive)
+        if os.name == 'nt':
+            return self.search_by_name(f"*{extension}", recursive)
+        
+        try:
+            return [path for name, path in self._all_files(recursive) if name.endswith(extension)]
+        except Exception as e:
+            logger.error(f"Error searching by extension: {e}")
+            return []
     
     def search_by_size(self, min_size: int = 0, max_size: Optional[int] = None,
                       recursive: bool = True) -> List[str]:
@@ -313,19 +620,25 @@ class FileSearcher:
         Returns:
             List of matching file paths
         """
-        results = []
-        try:
-            pattern = "**/*" if recursive else "*"
-            for file_path in Path(self.root_path).glob(pattern):
-                if file_path.is_file():
-                    size = file_path.stat().st_size
-                    if min_size <= size:
-                        if max_size is None or size <= max_size:
-                            results.append(str(file_path))
-        except Exception as e:
-            logger.error(f"Error searching by size: {e}")
+        return [entry.path for entry in self.search_by_size_entries(min_size, max_size, recursive)]
+    
+    def search_by_size_entries(self, min_size: int = 0, max_size: Optional[int] = None,
+                               recursive: bool = True) -> List[os.DirEntry]:
+        """
+        Search files by size, returning DirEntry objects.
         
-        return results
+        The entries carry their cached stat() result, so passing them to
+        FileAnalyzer.analyze_multiple avoids a second stat per file.
+        
+        Args:
+            min_size: Minimum file size in bytes
+            max_size: Maximum file size in bytes
+            recursive: Whether to search recursively
+            
+        Returns:
+            List of matching DirEntry objects
+        """
+        return self.search_entries(min_size=min_size, max_size=max_size, recursive=recursive)
     
     def search_by_regex(self, pattern: str, recursive: bool = True) -> List[str]:
         """
@@ -335,59 +648,92 @@ class FileSearcher:
             pattern: Regex pattern to match against file names
             recursive: Whether to search recursively
             
+        Returns:
+            List of matching file paths
+        """
+        return self.search(regex=pattern, recursive=recursive)
+    
+    def search_by_content(self, content_pattern: str, extensions: Optional[List[str]] = None,
+                         recursive: bool = True, case_sensitive: bool = False,
+                         max_workers: Optional[int] = None) -> List[str]:
+        """
+        Search files by content.
+        
+        Args:
+            content_pattern: Pattern to search in file content
+            extensions: List of file extensions to search (None = all)
+            recursive: Whether to search recursively
+            case_sensitive: Whether search is case-sensitive
+            max_workers: Number of worker threads (defaults to DEFAULT_IO_WORKERS)
+            
         Returns:
             List of matching file paths
         """
         results = []
+        flags = 0 if case_sensitive else re.IGNORECASE
+        
         try:
-            compiled_pattern = re.compile(pattern)
-            glob_pattern = "**/*" if recursive else "*"
+            compiled_pattern = _compile(content_pattern, flags)
+            bytes_pattern = _compile_bytes(content_pattern, flags)
             
-            for file_path in Path(self.root_path).glob(glob_pattern):
-                if file_path.is_file() and compiled_pattern.search(file_path.name):
-                    results.append(str(file_path))
+            candidates = [
+                entry.path for entry in _iter_files(self.root_path, recursive)
+                if not extensions or _name_ext(entry.name) in extensions
+            ]
+            results = self._search_content_parallel(
+                candidates, compiled_pattern, bytes_pattern, max_workers
+            )
+        
         except re.error as e:
             logger.error(f"Invalid regex pattern: {e}")
         except Exception as e:
-            logger.error(f"Error searching by regex: {e}")
+            logger.error(f"Error searching by content: {e}")
         
         return results
     
-    def search_by_content(self, content_pattern: str, extensions: Optional[List[str]] = None,
-                         recursive: bool = True, case_sensitive: bool = False) -> List[str]:
+    def search_by_multi_content(self, content_patterns: List[str],
+                                extensions: Optional[List[str]] = None,
+                                recursive: bool = True, case_sensitive: bool = False,
+                                max_workers: Optional[int] = None) -> Dict[str, List[str]]:
         """
-        Search files by content.
+        Search files for several content patterns at once.
+        
+        Each file is opened and mapped once and every pattern is evaluated
+        against that buffer, instead of rewalking and rereading the tree
+        once per pattern.
         
         Args:
-            content_pattern: Pattern to search in file content
+            content_patterns: Patterns to search in file content
             extensions: List of file extensions to search (None = all)
             recursive: Whether to search recursively
             case_sensitive: Whether search is case-sensitive
+            max_workers: Number of worker threads (defaults to DEFAULT_IO_WORKERS)
             
         Returns:
-            List of matching file paths
+            Dictionary mapping each pattern to its list of matching file paths
         """
-        results = []
+        results = {pattern: [] for pattern in content_patterns}
         flags = 0 if case_sensitive else re.IGNORECASE
         
         try:
-            compiled_pattern = re.compile(content_pattern, flags)
-            glob_pattern = "**/*" if recursive else "*"
+            text_patterns = [_compile(pattern, flags) for pattern in content_patterns]
+            bytes_patterns = [_compile_bytes(pattern, flags) for pattern in content_patterns]
             
-            for file_path in Path(self.root_path).glob(glob_pattern):
-                if not file_path.is_file():
-                    continue
-                
-                if extensions and file_path.suffix.lstrip('.') not in extensions:
-                    continue
-                
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                        if compiled_pattern.search(content):
-                            results.append(str(file_path))
-                except Exception:
-                    pass
+            candidates = [
+                entry.path for entry in _iter_files(self.root_path, recursive)
+                if not extensions or _name_ext(entry.name) in extensions
+            ]
+            if not candidates:
+                return results
+            
+            with ThreadPoolExecutor(max_workers=max_workers or DEFAULT_IO_WORKERS) as executor:
+                matches = executor.map(
+                    lambda path: self._file_matches(path, text_patterns, bytes_patterns),
+                    candidates
+                )
+                for path, matched in zip(candidates, matches):
+                    for index in matched:
+                        results[content_patterns[index]].append(path)
         
         except re.error as e:
             logger.error(f"Invalid regex pattern: {e}")
@@ -396,6 +742,71 @@ class FileSearcher:
         
         return results
     
+    @staticmethod
+    def _file_matches(file_path: str, text_patterns: List[re.Pattern],
+                      bytes_patterns: List[Optional[re.Pattern]]) -> List[int]:
+        """
+        Return the indices of the patterns that match a file's content.
+        
+        Small files are decoded and matched with the str patterns; larger files
+        are memory-mapped and scanned in place with the equivalent bytes
+        patterns. Patterns without a bytes equivalent (None) fall back to the
+        decoded text, which is then read once for all of them.
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+                    content = f.read().decode('utf-8', errors='ignore')
+                    return [i for i, pattern in enumerate(text_patterns) if pattern.search(content)]
+                
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    matched = []
+                    content = None
+                    for i, (text_pattern, bytes_pattern) in enumerate(zip(text_patterns, bytes_patterns)):
+                        if bytes_pattern is not None:
+                            if bytes_pattern.search(mm):
+                                matched.append(i)
+                            continue
+                        if content is None:
+                            content = mm[:].decode('utf-8', errors='ignore')
+                        if text_pattern.search(content):
+                            matched.append(i)
+                    return matched
+        except Exception:
+            return []
+    
+    @staticmethod
+    def _file_contains(file_path: str, compiled_pattern: re.Pattern,
+                       bytes_pattern: Optional[re.Pattern]) -> bool:
+        """Check whether a file's content matches a pattern."""
+        return bool(FileSearcher._file_matches(file_path, [compiled_pattern], [bytes_pattern]))
+    
+    def _search_content_parallel(self, file_paths: List[str], compiled_pattern: re.Pattern,
+                                 bytes_pattern: Optional[re.Pattern],
+                                 max_workers: Optional[int] = None) -> List[str]:
+        """
+        Scan files for a pattern across a thread pool.
+        
+        Args:
+            file_paths: Candidate file paths
+            compiled_pattern: Compiled content pattern
+            bytes_pattern: The same pattern compiled for bytes, used on mmapped
+                files (None to search decoded text instead)
+            max_workers: Number of worker threads (defaults to DEFAULT_IO_WORKERS)
+            
+        Returns:
+            Matching file paths, in the order they were given
+        """
+        if not file_paths:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=max_workers or DEFAULT_IO_WORKERS) as executor:
+            matches = executor.map(
+                lambda path: self._file_contains(path, compiled_pattern, bytes_pattern),
+                file_paths
+            )
+            return [path for path, matched in zip(file_paths, matches) if matched]
+    
     def search_modified_after(self, timestamp: float, recursive: bool = True) -> List[str]:
         """
         Search files modified after timestamp.
@@ -407,16 +818,7 @@ class FileSearcher:
         Returns:
             List of matching file paths
         """
-        results = []
-        try:
-            glob_pattern = "**/*" if recursive else "*"
-            for file_path in Path(self.root_path).glob(glob_pattern):
-                if file_path.is_file() and file_path.stat().st_mtime > timestamp:
-                    results.append(str(file_path))
-        except Exception as e:
-            logger.error(f"Error searching by modification time: {e}")
-        
-        return results
+        return self.search(modified_after=timestamp, recursive=recursive)
 
 
 class FileFilter:
@@ -428,17 +830,46 @@ class FileFilter:
     - Custom filter functions
     - Chainable filters
     - Exclude patterns
+    
+    Filters are recorded as predicates and applied together in a single
+    pass over the file list when results are requested. Predicates run in
+    order of cost (string checks, then regexes, then filesystem calls), so
+    files rejected by a cheap filter never hit the filesystem.
     """
     
+    # Predicate cost classes
+    COST_STRING = 0
+    COST_REGEX = 1
+    COST_SYSCALL = 2
+    
     def __init__(self, files: List[str]):
         """
         Initialize FileFilter.
         
+        The list is held by reference rather than copied; filters never
+        mutate it, and get_results() always returns a new list.
+        
         Args:
             files: List of file paths to filter
         """
         self.original_files = files
-        self.files = files.copy()
+        self._preds: List[Tuple[int, Callable[[str], bool]]] = []
+    
+    @property
+    def files(self) -> List[str]:
+        """Files passing every filter applied so far."""
+        return list(self._iter_results())
+    
+    def _iter_results(self) -> Iterator[str]:
+        """Yield files that satisfy all recorded predicates."""
+        # Stable sort keeps insertion order within a cost class
+        preds = [pred for _, pred in sorted(self._preds, key=lambda p: p[0])]
+        for file_path in self.original_files:
+            for pred in preds:
+                if not pred(file_path):
+                    break
+            else:
+                yield file_path
     
     def filter_by_extension(self, extensions: Union[str, List[str]],
                            exclude: bool = False) -> 'FileFilter':
@@ -458,11 +889,11 @@ class FileFilter:
         extensions = {ext.lstrip('.').lower() for ext in extensions}
         
         def filter_func(file_path):
-            ext = os.path.splitext(file_path)[1].lstrip('.').lower()
+            ext = _ext(file_path).lower()
             matches = ext in extensions
             return not matches if exclude else matches
         
-        self.files = [f for f in self.files if filter_func(f)]
+        self._preds.append((self.COST_STRING, filter_func))
         return self
     
     def filter_by_size(self, min_size: int = 0, max_size: Optional[int] = None) -> 'FileFilter':
@@ -483,7 +914,7 @@ class FileFilter:
             except OSError:
                 return False
         
-        self.files = [f for f in self.files if filter_func(f)]
+        self._preds.append((self.COST_SYSCALL, filter_func))
         return self
     
     def filter_by_pattern(self, pattern: str, exclude: bool = False) -> 'FileFilter':
@@ -498,29 +929,31 @@ class FileFilter:
             Self for chaining
         """
         try:
-            compiled = re.compile(pattern)
+            compiled = _compile(pattern)
             
             def filter_func(file_path):
                 matches = bool(compiled.search(os.path.basename(file_path)))
                 return not matches if exclude else matches
             
-            self.files = [f for f in self.files if filter_func(f)]
+            self._preds.append((self.COST_REGEX, filter_func))
         except re.error as e:
             logger.error(f"Invalid regex pattern: {e}")
         
         return self
     
-    def filter_by_custom(self, func: Callable[[str], bool]) -> 'FileFilter':
+    def filter_by_custom(self, func: Callable[[str], bool],
+                         cost: int = COST_SYSCALL) -> 'FileFilter':
         """
         Filter files using custom function.
         
         Args:
             func: Function that returns True for files to keep
+            cost: Cost class used to order evaluation (assumed to touch the filesystem)
             
         Returns:
             Self for chaining
         """
-        self.files = [f for f in self.files if func(f)]
+        self._preds.append((cost, func))
         return self
     
     def filter_readable(self) -> 'FileFilter':
@@ -530,7 +963,7 @@ class FileFilter:
         Returns:
             Self for chaining
         """
-        self.files = [f for f in self.files if os.access(f, os.R_OK)]
+        self._preds.append((self.COST_SYSCALL, lambda f: os.access(f, os.R_OK)))
         return self
     
     def filter_exists(self) -> 'FileFilter':
@@ -540,17 +973,17 @@ class FileFilter:
         Returns:
             Self for chaining
         """
-        self.files = [f for f in self.files if os.path.exists(f)]
+        self._preds.append((self.COST_SYSCALL, os.path.exists))
         return self
     
     def reset(self) -> 'FileFilter':
         """
-        Reset to original file list.
+        Reset to original file list by discarding all filters.
         
         Returns:
             Self for chaining
         """
-        self.files = self.original_files.copy()
+        self._preds.clear()
         return self
     
     def get_results(self) -> List[str]:
@@ -560,11 +993,11 @@ class FileFilter:
         Returns:
             List of filtered file paths
         """
-        return self.files.copy()
+        return list(self._iter_results())
     
     def count(self) -> int:
         """Get count of filtered files."""
-        return len(self.files)
+        return sum(1 for _ in self._iter_results())
 
 
 class FileAnalyzer:
@@ -590,44 +1023,83 @@ class FileAnalyzer:
             FileInfo object or None if file doesn't exist
         """
         try:
-            if not os.path.exists(file_path):
+            # A single stat() answers existence, type and size
+            try:
+                st = os.stat(file_path)
+            except OSError:
                 return None
             
-            stat = os.stat(file_path)
-            mime_type, _ = mimetypes.guess_type(file_path)
-            
-            return FileInfo(
-                path=file_path,
-                name=os.path.basename(file_path),
-                extension=os.path.splitext(file_path)[1].lstrip('.'),
-                size=stat.st_size,
-                created_time=stat.st_ctime,
-                modified_time=stat.st_mtime,
-                mime_type=mime_type,
-                is_dir=os.path.isdir(file_path),
-                is_file=os.path.isfile(file_path),
-                exists=True,
-                readable=os.access(file_path, os.R_OK),
-                writable=os.access(file_path, os.W_OK),
-            )
+            return FileAnalyzer._build_file_info(file_path, os.path.basename(file_path), st)
         except Exception as e:
             logger.error(f"Error analyzing file {file_path}: {e}")
             return None
     
     @staticmethod
-    def analyze_multiple(file_paths: List[str]) -> List[FileInfo]:
+    def get_file_info_from_entry(entry: os.DirEntry) -> Optional[FileInfo]:
+        """
+        Get comprehensive file information from a directory entry.
+        
+        Uses the entry's cached stat() result (as produced by os.scandir or
+        the FileSearcher *_entries methods), saving one stat per file.
+        
+        Args:
+            entry: Directory entry for the file
+            
+        Returns:
+            FileInfo object or None if file doesn't exist
+        """
+        try:
+            try:
+                st = entry.stat()
+            except OSError:
+                return None
+            
+            return FileAnalyzer._build_file_info(entry.path, entry.name, st)
+        except Exception as e:
+            logger.error(f"Error analyzing file {entry.path}: {e}")
+            return None
+    
+    @staticmethod
+    def _build_file_info(file_path: str, name: str, st: os.stat_result) -> FileInfo:
+        """Build a FileInfo from an existing stat result."""
+        is_file = stat.S_ISREG(st.st_mode)
+        # MIME types are only meaningful for regular files
+        mime_type = mimetypes.guess_type(file_path)[0] if is_file else None
+        
+        return FileInfo(
+            path=file_path,
+            name=name,
+            extension=_name_ext(name),
+            size=st.st_size,
+            created_time=st.st_ctime,
+            modified_time=st.st_mtime,
+            mime_type=mime_type,
+            is_dir=stat.S_ISDIR(st.st_mode),
+            is_file=is_file,
+            exists=True,
+            readable=os.access(file_path, os.R_OK),
+            writable=os.access(file_path, os.W_OK),
+        )
+    
+    @staticmethod
+    def analyze_multiple(file_paths: List[Union[str, os.DirEntry]]) -> List[FileInfo]:
         """
         Analyze multiple files.
         
         Args:
-            file_paths: List of file paths
+            file_paths: List of file paths or DirEntry objects. DirEntry
+                objects reuse their cached stat() result, so entry lists from
+                FileSearcher cost one fewer stat per file.
             
         Returns:
             List of FileInfo objects
         """
         results = []
         for file_path in file_paths:
-            info = FileAnalyzer.get_file_info(file_path)
+            if isinstance(file_path, os.DirEntry):
+                info = FileAnalyzer.get_file_info_from_entry(file_path)
+            else:
+                info = FileAnalyzer.get_file_info(file_path)
             if info:
                 results.append(info)
         return results
@@ -657,32 +1129,39 @@ class FileAnalyzer:
             'smallest_file_size': float('inf'),
         }
         
+        total_files = 0
+        total_size = 0
+        by_extension = defaultdict(lambda: [0, 0])  # ext -> [count, size]
+        largest = (0, None)
+        smallest = (float('inf'), None)
+        
         try:
-            pattern = "**/*" if recursive else "*"
-            for file_path in Path(directory).glob(pattern):
-                if file_path.is_file():
-                    size = file_path.stat().st_size
-                    ext = file_path.suffix.lstrip('.')
-                    
-                    stats['total_files'] += 1
-                    stats['total_size'] += size
-                    
-                    if ext not in stats['by_extension']:
-                        stats['by_extension'][ext] = {'count': 0, 'size': 0}
-                    stats['by_extension'][ext]['count'] += 1
-                    stats['by_extension'][ext]['size'] += size
-                    
-                    if size > stats['largest_file_size']:
-                        stats['largest_file'] = str(file_path)
-                        stats['largest_file_size'] = size
-                    
-                    if size < stats['smallest_file_size']:
-                        stats['smallest_file'] = str(file_path)
-                        stats['smallest_file_size'] = size
+            for entry in _iter_files(directory, recursive):
+                size = entry.stat().st_size
+                
+                total_files += 1
+                total_size += size
+                
+                counts = by_extension[_name_ext(entry.name)]
+                counts[0] += 1
+                counts[1] += size
+                
+                if size > largest[0]:
+                    largest = (size, entry.path)
+                if size < smallest[0]:
+                    smallest = (size, entry.path)
         
         except Exception as e:
             logger.error(f"Error analyzing directory: {e}")
         
+        stats['total_files'] = total_files
+        stats['total_size'] = total_size
+        stats['by_extension'] = {
+            ext: {'count': count, 'size': size} for ext, (count, size) in by_extension.items()
+        }
+        stats['largest_file_size'], stats['largest_file'] = largest
+        stats['smallest_file_size'], stats['smallest_file'] = smallest
+        
         return stats
     
     @staticmethod
@@ -698,7 +1177,7 @@ class FileAnalyzer:
         """
         grouped = {}
         for file_path in file_paths:
-            ext = os.path.splitext(file_path)[1].lstrip('.')
+            ext = _ext(file_path)
             if not ext:
                 ext = 'no_extension'
             
@@ -730,19 +1209,33 @@ class FileAnalyzer:
                 (1024 * 1024 * 100, float('inf')),  # > 100 MB
             ]
         
+        keys = [f"{min_s}-{max_s}" for min_s, max_s in ranges]
+        lows = [min_s for min_s, _ in ranges]
+        
+        # Sorted, non-overlapping ranges (the default) can be searched with
+        # bisect; anything else keeps the first-match linear scan
+        disjoint = all(ranges[i][1] <= ranges[i + 1][0] for i in range(len(ranges) - 1))
+        
         grouped = {}
+        getsize = os.path.getsize
         for file_path in file_paths:
             try:
-                size = os.path.getsize(file_path)
-                for min_s, max_s in ranges:
+                size = getsize(file_path)
+            except OSError:
+                continue
+            
+            if disjoint:
+                index = bisect.bisect_right(lows, size) - 1
+                if index < 0 or size >= ranges[index][1]:
+                    continue
+            else:
+                for index, (min_s, max_s) in enumerate(ranges):
                     if min_s <= size < max_s:
-                        key = f"{min_s}-{max_s}"
-                        if key not in grouped:
-                            grouped[key] = []
-                        grouped[key].append(file_path)
                         break
-            except OSError:
-                pass
+                else:
+                    continue
+            
+            grouped.setdefault(keys[index], []).append(file_path)
         
         return grouped
 
@@ -774,3 +1267,19 @@ if __name__ == "__main__":
         print(f"MIME Type: {info.mime_type}")
         print(f"Readable: {info.readable}")
         print(f"Writable: {info.writable}")
+    
+    print("\n" + "="*60 + "\n")
+    
+    # Example: escaped non-ASCII patterns match memory-mapped files too
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        large_file = os.path.join(tmp_dir, "large.txt")
+        with open(large_file, 'w', encoding='utf-8') as f:
+            f.write('x' * MMAP_MIN_SIZE + ' café\n')
+        
+        searcher = FileSearcher(tmp_dir)
+        patterns = [r'caf\xe9', r'CAF\xc9', r'caf\N{LATIN SMALL LETTER E WITH ACUTE}']
+        found = searcher.search_by_multi_content(patterns)
+        for pattern in patterns:
+            status = "✓" if found[pattern] == [large_file] else "✗"
+            print(f"{status} {pattern}: {len(found[pattern])} match(es)")
@@ -8,16 +8,166 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import shutil
 import os
-from pathlib import Path
+import sys
+import stat
+import errno
 from datetime import datetime
+from types import MappingProxyType
 import threading
+import asyncio
+import tarfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from backup_engine import BackupEngine
+from notification_system import NotificationManager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+# Concurrent copies for migration; copying is I/O-bound, so oversubscribe the CPUs
+MIGRATION_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Bytes requested per copy_file_range call (kept within ssize_t on 32-bit builds)
+COPY_RANGE_CHUNK = 1 << 30
+_HAS_COPY_FILE_RANGE = hasattr(os, 'copy_file_range')
+
+# Linux FICLONE ioctl: share the source's extents on CoW filesystems (btrfs, XFS)
+FICLONE = 0x40049409
+_HAS_FICLONE = fcntl is not None and sys.platform.startswith('linux')
+
+# Files at least this large get page-cache hints so a bulk copy doesn't evict the cache
+FADVISE_MIN_SIZE = 64 << 20
+_HAS_FADVISE = hasattr(os, 'posix_fadvise')
+_HAS_FALLOCATE = hasattr(os, 'posix_fallocate')
+
+# "Stream small files" switches to a single tar stream for trees of at least
+# STREAM_MIN_FILES files averaging under STREAM_MAX_AVG_SIZE bytes
+STREAM_MIN_FILES = 50000
+STREAM_MAX_AVG_SIZE = 64 * 1024
+STREAM_BUF = 1 << 20
+
+# Minimum seconds between progress updates posted to Tk (~30 Hz)
+PROGRESS_INTERVAL = 1 / 30
+
+# Userspace copy buffer for the fallback path (shutil defaults to 64 KiB)
+COPY_BUF = 256 * 1024
+
+
+def _copy_fallback(src, dst):
+    """Copy a file and its metadata through a 256 KiB userspace buffer."""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        shutil.copyfileobj(fsrc, fdst, COPY_BUF)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _reflink(infd, outfd):
+    """Clone infd's data into outfd without copying; returns False if unsupported."""
+    if not _HAS_FICLONE:
+        return False
+    try:
+        fcntl.ioctl(outfd, FICLONE, infd)
+        return True
+    except OSError:
+        # EXDEV, EOPNOTSUPP, EINVAL: not a shared CoW volume
+        return False
+
+
+def _fast_copy(src, dst):
+    """Copy a file in-kernel with a reflink or copy_file_range, falling back to a buffered copy.
+    
+    On CoW filesystems a reflink makes the copy a metadata operation.
+    Otherwise copy_file_range avoids bouncing data through userspace
+    and lets NFS copy server-side, into space preallocated for the
+    whole file. Large files are hinted as sequential and dropped from
+    the page cache once copied. Metadata is copied afterwards, as
+    copy2 would.
+    """
+    if _HAS_COPY_FILE_RANGE:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                infd, outfd = fsrc.fileno(), fdst.fileno()
+                if not _reflink(infd, outfd):
+                    src_size = os.fstat(infd).st_size
+                    if _HAS_FALLOCATE and src_size:
+                        # Reserve the extents up front so the filesystem can keep them contiguous
+                        try:
+                            os.posix_fallocate(outfd, 0, src_size)
+                        except OSError:
+                            pass
+                    large = _HAS_FADVISE and src_size >= FADVISE_MIN_SIZE
+                    if large:
+                        os.posix_fadvise(infd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    while os.copy_file_range(infd, outfd, COPY_RANGE_CHUNK):
+                        pass
+                    if large:
+                        # Neither side will be read again; dirty pages must be
+                        # written back before DONTNEED can drop them
+                        os.posix_fadvise(infd, 0, 0, os.POSIX_FADV_DONTNEED)
+                        os.fsync(outfd)
+                        os.posix_fadvise(outfd, 0, 0, os.POSIX_FADV_DONTNEED)
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            # Unsupported filesystem pair or old kernel; redo it the portable way
+            pass
+    return _copy_fallback(src, dst)
+
+
+def _copy_if_changed(src, dst):
+    """Copy src to dst unless dst already has the same size and mtime.
+    
+    Same quick check as rsync: copies preserve mtime, so a repeat
+    migration only rewrites files that changed. Returns True if copied.
+    """
+    try:
+        st_dst = os.stat(dst)
+        st_src = os.stat(src)
+        if st_dst.st_size == st_src.st_size and int(st_dst.st_mtime) == int(st_src.st_mtime):
+            return False
+    except FileNotFoundError:
+        pass
+    _fast_copy(src, dst)
+    return True
+
+
+def _move_file(src, dst):
+    """Move src to dst with a rename, copying and deleting across devices.
+    
+    Returns True, so it can stand in for _copy_if_changed.
+    """
+    try:
+        os.replace(src, dst)
+        return True
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    _fast_copy(src, dst)
+    os.remove(src)
+    return True
+
+
+# Fonts, built once at import
+FONT_TITLE = ('Helvetica', 24, 'bold')
+FONT_SUBTITLE = ('Helvetica', 14, 'bold')
+FONT_REGULAR = ('Helvetica', 11)
+FONT_ACTION = ('Helvetica', 11, 'bold')
+FONT_PATH = ('Helvetica', 9)
+FONT_BTN = ('Helvetica', 10, 'bold')
+FONT_OPTION = ('Helvetica', 10)
+FONT_PETAL_BTN = ('Helvetica', 12, 'bold')
+FONT_STATUS = ('Helvetica', 11, 'bold')
 
 
 class FlowerMigrationApp:
     """Flower-shaped GUI application for file migration and backup"""
     
-    # Orange-Pink Theme Colors
-    COLORS = {
+    # Orange-Pink Theme Colors (read-only)
+    COLORS = MappingProxyType({
         'primary_orange': '#FF6B35',      # Vibrant Orange
         'light_orange': '#FFB4A2',        # Light Orange
         'deep_pink': '#E76F51',           # Deep Pink
@@ -25,6 +175,37 @@ class FlowerMigrationApp:
         'cream': '#FFF8F3',               # Cream background
         'dark_text': '#3D2817',           # Dark brown for text
         'accent': '#FF8C42',              # Accent Orange
+    })
+    
+    # ttk style table, installed in one theme_settings call by setup_styles
+    _STYLE_SPEC = {
+        'Title.TLabel': {'configure': {
+            'font': FONT_TITLE,
+            'background': COLORS['cream'],
+            'foreground': COLORS['primary_orange'],
+        }},
+        'Subtitle.TLabel': {'configure': {
+            'font': FONT_SUBTITLE,
+            'background': COLORS['cream'],
+            'foreground': COLORS['deep_pink'],
+        }},
+        'Regular.TLabel': {'configure': {
+            'font': FONT_REGULAR,
+            'background': COLORS['cream'],
+            'foreground': COLORS['dark_text'],
+        }},
+        'ActionButton.TButton': {
+            'configure': {'font': FONT_ACTION, 'padding': 10},
+            'map': {'background': [('active', COLORS['deep_pink']),
+                                   ('pressed', COLORS['primary_orange'])]},
+        },
+        'orange.Horizontal.TProgressBar': {'configure': {
+            'background': COLORS['primary_orange'],
+            'troughcolor': COLORS['cream'],
+            'bordercolor': COLORS['primary_orange'],
+            'lightcolor': COLORS['light_orange'],
+            'darkcolor': COLORS['primary_orange'],
+        }},
     }
     
     def __init__(self, root):
@@ -41,6 +222,12 @@ class FlowerMigrationApp:
         self.destination_path = tk.StringVar()
         self.is_running = False
         self.progress_value = tk.DoubleVar()
+        self._loop = None
+        # One long-lived worker runs migrations and backups off the Tk thread
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="migration")
+        self._src_stat = None
+        self._dst_stat = None
+        self._same_device = False
         
         # Build UI
         self.create_flower_ui()
@@ -51,40 +238,22 @@ class FlowerMigrationApp:
         style.theme_use('clam')
         
         # Configure custom styles
-        style.configure('Title.TLabel', 
-                       font=('Helvetica', 24, 'bold'),
-                       background=self.COLORS['cream'],
-                       foreground=self.COLORS['primary_orange'])
-        
-        style.configure('Subtitle.TLabel',
-                       font=('Helvetica', 14, 'bold'),
-                       background=self.COLORS['cream'],
-                       foreground=self.COLORS['deep_pink'])
-        
-        style.configure('Regular.TLabel',
-                       font=('Helvetica', 11),
-                       background=self.COLORS['cream'],
-                       foreground=self.COLORS['dark_text'])
-        
-        style.configure('ActionButton.TButton',
-                       font=('Helvetica', 11, 'bold'),
-                       padding=10)
-        
-        style.map('ActionButton.TButton',
-                 background=[('active', self.COLORS['deep_pink']),
-                            ('pressed', self.COLORS['primary_orange'])])
+        style.theme_settings('clam', self._STYLE_SPEC)
     
     def create_flower_ui(self):
         """Create the main flower-shaped UI layout"""
+        c = self.COLORS
+        cream = c['cream']
+        
         # Main container
-        main_frame = tk.Frame(self.root, bg=self.COLORS['cream'])
+        main_frame = tk.Frame(self.root, bg=cream)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Top Petal - Title
         self.create_title_petal(main_frame)
         
         # Middle Petals - Functionality sections
-        middle_frame = tk.Frame(main_frame, bg=self.COLORS['cream'])
+        middle_frame = tk.Frame(main_frame, bg=cream)
         middle_frame.pack(fill=tk.BOTH, expand=True, pady=20)
         
         # Left Petal - Source Selection
@@ -98,12 +267,16 @@ class FlowerMigrationApp:
         
     def create_title_petal(self, parent):
         """Create top petal with title"""
-        petal = tk.Frame(parent, bg=self.COLORS['light_orange'], 
-                        highlightbackground=self.COLORS['primary_orange'],
+        c = self.COLORS
+        primary_orange = c['primary_orange']
+        light_orange = c['light_orange']
+        
+        petal = tk.Frame(parent, bg=light_orange, 
+                        highlightbackground=primary_orange,
                         highlightthickness=3, relief=tk.RAISED)
         petal.pack(fill=tk.X, pady=10)
         
-        title_frame = tk.Frame(petal, bg=self.COLORS['light_orange'])
+        title_frame = tk.Frame(petal, bg=light_orange)
         title_frame.pack(fill=tk.BOTH, padx=20, pady=15)
         
         # Flower emoji and title
@@ -118,21 +291,27 @@ class FlowerMigrationApp:
         
     def create_source_petal(self, parent):
         """Create left petal for source selection"""
+        c = self.COLORS
+        cream = c['cream']
+        primary_orange = c['primary_orange']
+        rose_pink = c['rose_pink']
+        dark_text = c['dark_text']
+        
         # Create left and right frame layout
         if not hasattr(parent, '_petals_created'):
             parent._petals_created = True
             parent.pack_configure(fill=tk.BOTH, expand=True)
         
         # Left petal frame
-        left_frame = tk.Frame(parent, bg=self.COLORS['cream'])
+        left_frame = tk.Frame(parent, bg=cream)
         left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10)
         
-        petal = tk.Frame(left_frame, bg=self.COLORS['rose_pink'],
-                        highlightbackground=self.COLORS['primary_orange'],
+        petal = tk.Frame(left_frame, bg=rose_pink,
+                        highlightbackground=primary_orange,
                         highlightthickness=2, relief=tk.RAISED)
         petal.pack(fill=tk.BOTH, expand=True)
         
-        content = tk.Frame(petal, bg=self.COLORS['rose_pink'])
+        content = tk.Frame(petal, bg=rose_pink)
         content.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
         
         # Header
@@ -141,23 +320,23 @@ class FlowerMigrationApp:
         header.pack(pady=10)
         
         # Path display
-        path_frame = tk.Frame(content, bg=self.COLORS['cream'],
+        path_frame = tk.Frame(content, bg=cream,
                              relief=tk.SUNKEN, borderwidth=2)
         path_frame.pack(fill=tk.X, pady=10)
         
         path_label = tk.Label(path_frame, textvariable=self.source_path,
-                             bg=self.COLORS['cream'],
-                             fg=self.COLORS['dark_text'],
-                             font=('Helvetica', 9),
+                             bg=cream,
+                             fg=dark_text,
+                             font=FONT_PATH,
                              wraplength=180, justify=tk.LEFT)
         path_label.pack(fill=tk.BOTH, padx=8, pady=8)
         
         # Browse button
         browse_source_btn = tk.Button(content, text="Browse Source",
                                      command=self.browse_source,
-                                     bg=self.COLORS['primary_orange'],
+                                     bg=primary_orange,
                                      fg='white',
-                                     font=('Helvetica', 10, 'bold'),
+                                     font=FONT_BTN,
                                      relief=tk.RAISED,
                                      padx=10, pady=8,
                                      cursor='hand2')
@@ -167,16 +346,23 @@ class FlowerMigrationApp:
         
     def create_destination_petal(self, parent):
         """Create right petal for destination selection"""
+        c = self.COLORS
+        cream = c['cream']
+        primary_orange = c['primary_orange']
+        light_orange = c['light_orange']
+        dark_text = c['dark_text']
+        accent = c['accent']
+        
         # Right petal frame
-        right_frame = tk.Frame(parent, bg=self.COLORS['cream'])
+        right_frame = tk.Frame(parent, bg=cream)
         right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=10)
         
-        petal = tk.Frame(right_frame, bg=self.COLORS['light_orange'],
-                        highlightbackground=self.COLORS['primary_orange'],
+        petal = tk.Frame(right_frame, bg=light_orange,
+                        highlightbackground=primary_orange,
                         highlightthickness=2, relief=tk.RAISED)
         petal.pack(fill=tk.BOTH, expand=True)
         
-        content = tk.Frame(petal, bg=self.COLORS['light_orange'])
+        content = tk.Frame(petal, bg=light_orange)
         content.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
         
         # Header
@@ -185,23 +371,23 @@ class FlowerMigrationApp:
         header.pack(pady=10)
         
         # Path display
-        path_frame = tk.Frame(content, bg=self.COLORS['cream'],
+        path_frame = tk.Frame(content, bg=cream,
                              relief=tk.SUNKEN, borderwidth=2)
         path_frame.pack(fill=tk.X, pady=10)
         
         path_label = tk.Label(path_frame, textvariable=self.destination_path,
-                             bg=self.COLORS['cream'],
-                             fg=self.COLORS['dark_text'],
-                             font=('Helvetica', 9),
+                             bg=cream,
+                             fg=dark_text,
+                             font=FONT_PATH,
                              wraplength=180, justify=tk.LEFT)
         path_label.pack(fill=tk.BOTH, padx=8, pady=8)
         
         # Browse button
         browse_dest_btn = tk.Button(content, text="Browse Destination",
                                    command=self.browse_destination,
-                                   bg=self.COLORS['accent'],
+                                   bg=accent,
                                    fg='white',
-                                   font=('Helvetica', 10, 'bold'),
+                                   font=FONT_BTN,
                                    relief=tk.RAISED,
                                    padx=10, pady=8,
                                    cursor='hand2')
@@ -209,98 +395,115 @@ class FlowerMigrationApp:
         
         self.destination_path.set("Select a folder...")
         
- def create_actions_petals(self, parent):
-    """Create bottom petals for actions and progress"""
-    # Actions frame
-    actions_frame = tk.Frame(parent, bg=self.COLORS['cream'])
-    actions_frame.pack(fill=tk.X, pady=15)
-
-    # Migrate button petal
-    migrate_petal = tk.Frame(actions_frame, bg=self.COLORS['deep_pink'],
-                             highlightbackground=self.COLORS['primary_orange'],
-                             highlightthickness=2)
-    migrate_petal.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10)
-
-    migrate_btn = tk.Button(migrate_petal, text="🔄 Migrate Files",
-                            command=self.migrate_files,
-                            bg=self.COLORS['deep_pink'],
-                            fg='white',
-                            font=('Helvetica', 12, 'bold'),
-                            relief=tk.RAISED,
-                            padx=15, pady=15,
-                            cursor='hand2',
-                            activebackground=self.COLORS['primary_orange'])
-    migrate_btn.pack(fill=tk.BOTH, padx=5, pady=5)
-    self.migrate_btn = migrate_btn
-
-    # Backup button petal
-    backup_petal = tk.Frame(actions_frame, bg=self.COLORS['rose_pink'],
-                            highlightbackground=self.COLORS['primary_orange'],
-                            highlightthickness=2)
-    backup_petal.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=10)
-
-    backup_btn = tk.Button(backup_petal, text="💾 Create Backup",
-                           command=self.create_backup,
-                           bg=self.COLORS['rose_pink'],
-                           fg='white',
-                           font=('Helvetica', 12, 'bold'),
-                           relief=tk.RAISED,
-                           padx=15, pady=15,
-                           cursor='hand2',
-                           activebackground=self.COLORS['accent'])
-    backup_btn.pack(fill=tk.BOTH, padx=5, pady=5)
-    self.backup_btn = backup_btn
-
-    # ✅ New checkboxes for backup options
-    self.incremental_var = tk.BooleanVar()
-    self.compression_var = tk.BooleanVar()
-
-    tk.Checkbutton(backup_petal, text="Incremental Backup",
-                   variable=self.incremental_var,
-                   bg=self.COLORS['rose_pink'],
-                   fg=self.COLORS['dark_text'],
-                   font=('Helvetica', 10)).pack(anchor="w", padx=10, pady=2)
-
-    tk.Checkbutton(backup_petal, text="Compress Backup",
-                   variable=self.compression_var,
-                   bg=self.COLORS['rose_pink'],
-                   fg=self.COLORS['dark_text'],
-                   font=('Helvetica', 10)).pack(anchor="w", padx=10, pady=2)
+    def create_actions_petals(self, parent):
+        """Create bottom petals for actions and progress"""
+        c = self.COLORS
+        cream = c['cream']
+        primary_orange = c['primary_orange']
+        light_orange = c['light_orange']
+        deep_pink = c['deep_pink']
+        rose_pink = c['rose_pink']
+        dark_text = c['dark_text']
+        accent = c['accent']
+    
+        # Actions frame
+        actions_frame = tk.Frame(parent, bg=cream)
+        actions_frame.pack(fill=tk.X, pady=15)
+
+        # Migrate button petal
+        migrate_petal = tk.Frame(actions_frame, bg=deep_pink,
+                                 highlightbackground=primary_orange,
+                                 highlightthickness=2)
+        migrate_petal.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10)
+
+        migrate_btn = tk.Button(migrate_petal, text="🔄 Migrate Files",
+                                command=self.migrate_files,
+                                bg=deep_pink,
+                                fg='white',
+                                font=FONT_PETAL_BTN,
+                                relief=tk.RAISED,
+                                padx=15, pady=15,
+                                cursor='hand2',
+                                activebackground=primary_orange)
+        migrate_btn.pack(fill=tk.BOTH, padx=5, pady=5)
+        self.migrate_btn = migrate_btn
+
+        self.stream_var = tk.BooleanVar()
+
+        tk.Checkbutton(migrate_petal, text="Stream Small Files",
+                       variable=self.stream_var,
+                       bg=deep_pink,
+                       fg=dark_text,
+                       font=FONT_OPTION).pack(anchor="w", padx=10, pady=2)
+
+        self.move_var = tk.BooleanVar()
+
+        tk.Checkbutton(migrate_petal, text="Move (same disk)",
+                       variable=self.move_var,
+                       bg=deep_pink,
+                       fg=dark_text,
+                       font=FONT_OPTION).pack(anchor="w", padx=10, pady=2)
+
+        # Backup button petal
+        backup_petal = tk.Frame(actions_frame, bg=rose_pink,
+                                highlightbackground=primary_orange,
+                                highlightthickness=2)
+        backup_petal.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=10)
+
+        backup_btn = tk.Button(backup_petal, text="💾 Create Backup",
+                               command=self.create_backup,
+                               bg=rose_pink,
+                               fg='white',
+                               font=FONT_PETAL_BTN,
+                               relief=tk.RAISED,
+                               padx=15, pady=15,
+                               cursor='hand2',
+                               activebackground=accent)
+        backup_btn.pack(fill=tk.BOTH, padx=5, pady=5)
+        self.backup_btn = backup_btn
+
+        # ✅ New checkboxes for backup options
+        self.incremental_var = tk.BooleanVar()
+        self.compression_var = tk.BooleanVar()
+
+        tk.Checkbutton(backup_petal, text="Incremental Backup",
+                       variable=self.incremental_var,
+                       bg=rose_pink,
+                       fg=dark_text,
+                       font=FONT_OPTION).pack(anchor="w", padx=10, pady=2)
+
+        tk.Checkbutton(backup_petal, text="Compress Backup",
+                       variable=self.compression_var,
+                       bg=rose_pink,
+                       fg=dark_text,
+                       font=FONT_OPTION).pack(anchor="w", padx=10, pady=2)
 
         # Progress section
-        progress_frame = tk.Frame(parent, bg=self.COLORS['light_orange'],
-                                 highlightbackground=self.COLORS['primary_orange'],
+        progress_frame = tk.Frame(parent, bg=light_orange,
+                                 highlightbackground=primary_orange,
                                  highlightthickness=2, relief=tk.SUNKEN)
         progress_frame.pack(fill=tk.X, pady=15)
         
-        progress_content = tk.Frame(progress_frame, bg=self.COLORS['light_orange'])
+        progress_content = tk.Frame(progress_frame, bg=light_orange)
         progress_content.pack(fill=tk.BOTH, padx=15, pady=15)
         
         progress_label = ttk.Label(progress_content, text="📊 Progress",
                                   style='Subtitle.TLabel')
         progress_label.pack(pady=5)
         
-        # Progress bar
-        progress_style = ttk.Style()
-        progress_style.configure("orange.Horizontal.TProgressBar",
-                                background=self.COLORS['primary_orange'],
-                                troughcolor=self.COLORS['cream'],
-                                bordercolor=self.COLORS['primary_orange'],
-                                lightcolor=self.COLORS['light_orange'],
-                                darkcolor=self.COLORS['primary_orange'])
-        
+        # Progress bar (styled in setup_styles)
         self.progress_bar = ttk.Progressbar(progress_content, style="orange.Horizontal.TProgressBar",
                                            variable=self.progress_value,
                                            length=400, mode='determinate')
         self.progress_bar.pack(fill=tk.X, pady=10)
         
-       # Status label
+        # Status label
         self.status_label = tk.Label(
             progress_content,
             text="Ready to migrate or backup",
-            bg=self.COLORS['light_orange'],
-            fg=self.COLORS['dark_text'],
-            font=('Helvetica', 11, 'bold')
+            bg=light_orange,
+            fg=dark_text,
+            font=FONT_STATUS
         )
         self.status_label.pack(pady=5)
         
@@ -319,9 +522,19 @@ class FlowerMigrationApp:
             self.update_status(f"Destination selected: {os.path.basename(folder)}")
     
     def update_status(self, message):
-        """Update status message"""
+        """Update status message (safe to call from worker threads)"""
+        self.root.after(0, lambda: self.status_label.config(text=message))
+    
+    def _apply_progress(self, progress, message):
+        """Set the progress bar and status label together (main thread only)"""
+        self.progress_value.set(progress)
         self.status_label.config(text=message)
-        self.root.update_idletasks()
+    
+    def _finish_operation(self):
+        """Re-enable the action buttons once a worker finishes (main thread only)"""
+        self.is_running = False
+        self.migrate_btn.config(state=tk.NORMAL)
+        self.backup_btn.config(state=tk.NORMAL)
     
     def migrate_files(self):
         """Migrate files from source to destination"""
@@ -331,143 +544,281 @@ class FlowerMigrationApp:
         if not self._validate_paths(source, destination):
             return
         
-        if not messagebox.askyesno("Confirm Migration", 
-                                   f"Migrate files from:\n{source}\n\nTo:\n{destination}?"):
+        # Renaming is only a metadata update when both folders share a device
+        move = self.move_var.get() and self._same_device
+        verb = "Move" if move else "Migrate"
+        if not messagebox.askyesno(f"Confirm {verb}", 
+                                   f"{verb} files from:\n{source}\n\nTo:\n{destination}?"):
             return
         
         self.is_running = True
         self.migrate_btn.config(state=tk.DISABLED)
         self.backup_btn.config(state=tk.DISABLED)
         
-        thread = threading.Thread(target=self._perform_migration, 
-                                 args=(source, destination))
-        thread.daemon = True
-        thread.start()
+        self._executor.submit(self._perform_migration,
+                              source, destination, self.stream_var.get(), move)
     
-    def _perform_migration(self, source, destination):
-        """Perform file migration in separate thread"""
+    def _perform_migration(self, source, destination, stream=False, move=False):
+        """Perform file migration on the worker executor"""
         try:
-            files = list(Path(source).rglob('*'))
-            total_files = len([f for f in files if f.is_file()])
+            # Create every destination directory once, then copy in parallel:
+            # the copies release the GIL during their syscalls.
+            jobs = []
+            dest_dirs = []
+            join = os.path.join
+            for dirpath, _, filenames in os.walk(source):
+                if not filenames:
+                    continue
+                rel_dir = os.path.relpath(dirpath, source)
+                if rel_dir == os.curdir:
+                    jobs.extend((join(dirpath, name), join(destination, name), name)
+                                for name in filenames)
+                    continue
+                dest_dir = join(destination, rel_dir)
+                dest_dirs.append(dest_dir)
+                jobs.extend((join(dirpath, name), join(dest_dir, name), join(rel_dir, name))
+                            for name in filenames)
+            # Shortest first, so parents exist before their children and
+            # each makedirs stops after a single mkdir
+            for dest_dir in sorted(dest_dirs, key=len):
+                os.makedirs(dest_dir, exist_ok=True)
+            total_files = len(jobs)
             
             if total_files == 0:
                 self.update_status("No files to migrate")
-                self.is_running = False
-                self.migrate_btn.config(state=tk.NORMAL)
-                self.backup_btn.config(state=tk.NORMAL)
                 return
             
-            migrated = 0
-            for i, file_path in enumerate(files):
-                if file_path.is_file():
-                    rel_path = file_path.relative_to(source)
-                    dest_path = Path(destination) / rel_path
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(file_path, dest_path)
-                    
-                    migrated += 1
-                    progress = (migrated / total_files) * 100
-                    self.progress_value.set(progress)
-                    self.update_status(f"Migrating: {rel_path} ({migrated}/{total_files})")
+            if move:
+                migrated, skipped = asyncio.run_coroutine_threadsafe(
+                    self._copy_all(jobs, _move_file), self._get_loop()
+                ).result()
+            elif stream and self._should_stream(jobs):
+                migrated, skipped = self._stream_all(jobs, destination), 0
+            else:
+                migrated, skipped = asyncio.run_coroutine_threadsafe(
+                    self._copy_all(jobs), self._get_loop()
+                ).result()
             
-            self.update_status(f"✅ Migration completed! {migrated} files migrated.")
-            self.progress_value.set(100)
+            # Queued behind any pending progress update so it lands last
+            self.root.after(0, self._apply_progress, 100,
+                            f"✅ Migration completed! {migrated} files migrated, "
+                            f"{skipped} unchanged skipped.")
         
         except Exception as e:
             self.update_status(f"❌ Error: {str(e)}")
         
         finally:
-            self.is_running = False
-            self.migrate_btn.config(state=tk.NORMAL)
-            self.backup_btn.config(state=tk.NORMAL)
+            self.root.after(0, self._finish_operation)
+    
+    def _get_loop(self):
+        """Return the background event loop used for copy fanout, starting it on first use"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop.set_default_executor(
+                ThreadPoolExecutor(max_workers=MIGRATION_WORKERS, thread_name_prefix="copy")
+            )
+            threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        return self._loop
+    
+    async def _copy_all(self, jobs, copy_func=_copy_if_changed):
+        """Copy (source, destination, rel_path) jobs with MIGRATION_WORKERS workers
+        
+        copy_func(src, dst) returns False when it skipped the file.
+        
+        Returns:
+            Tuple of (files copied, unchanged files skipped)
+        """
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        for job in jobs:
+            queue.put_nowait(job)
+        total_files = len(jobs)
+        migrated = 0
+        skipped = 0
+        last_update = 0.0
+        
+        async def worker():
+            nonlocal migrated, skipped, last_update
+            while not queue.empty():
+                file_path, dest_path, rel_path = queue.get_nowait()
+                # File I/O blocks, so the copy itself runs on the loop's executor
+                if not await loop.run_in_executor(None, copy_func, file_path, dest_path):
+                    skipped += 1
+                migrated += 1
+                # Coalesce updates so the Tk event queue isn't flooded per file
+                now = time.monotonic()
+                if now - last_update >= PROGRESS_INTERVAL or migrated == total_files:
+                    last_update = now
+                    progress = (migrated / total_files) * 100
+                    message = f"Migrating: {rel_path} ({migrated}/{total_files})"
+                    self.root.after(0, self._apply_progress, progress, message)
+        
+        workers = [asyncio.ensure_future(worker())
+                   for _ in range(min(MIGRATION_WORKERS, total_files))]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            # Stop handing out further copies once one has failed
+            for task in workers:
+                task.cancel()
+            raise
+        return migrated - skipped, skipped
+    
+    @staticmethod
+    def _should_stream(jobs):
+        """Whether a job list is large enough and small-file enough to stream as tar"""
+        if len(jobs) < STREAM_MIN_FILES:
+            return False
+        total_size = sum(os.stat(file_path).st_size for file_path, _, _ in jobs)
+        return total_size / len(jobs) < STREAM_MAX_AVG_SIZE
+    
+    def _stream_all(self, jobs, destination):
+        """Migrate jobs through one tar stream instead of a copy per file
+        
+        A producer thread packs the source files into a pipe while this
+        thread unpacks them, so each side reads or writes one sequential
+        stream and nothing is staged on disk.
+        
+        Returns:
+            Number of files migrated
+        """
+        rfd, wfd = os.pipe()
+        
+        def produce():
+            with open(wfd, 'wb') as pipe_out, \
+                 tarfile.open(fileobj=pipe_out, mode='w|', bufsize=STREAM_BUF,
+                              dereference=True) as tar:
+                for file_path, _, rel_path in jobs:
+                    tar.add(file_path, arcname=rel_path, recursive=False)
+        
+        total_files = len(jobs)
+        migrated = 0
+        last_update = 0.0
+        extract_args = {'filter': 'fully_trusted'} if hasattr(tarfile, 'data_filter') else {}
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="tar") as producer:
+            packed = producer.submit(produce)
+            try:
+                with open(rfd, 'rb') as pipe_in, \
+                     tarfile.open(fileobj=pipe_in, mode='r|', bufsize=STREAM_BUF) as tar:
+                    for member in tar:
+                        tar.extract(member, destination, **extract_args)
+                        migrated += 1
+                        now = time.monotonic()
+                        if now - last_update >= PROGRESS_INTERVAL or migrated == total_files:
+                            last_update = now
+                            progress = (migrated / total_files) * 100
+                            message = f"Streaming: {member.name} ({migrated}/{total_files})"
+                            self.root.after(0, self._apply_progress, progress, message)
+            finally:
+                # A producer error truncates the stream; surface the real cause
+                packed.result()
+        return migrated
     
     def create_backup(self):
-    source = self.source_path.get()
-    destination = self.destination_path.get()
+        source = self.source_path.get()
+        destination = self.destination_path.get()
 
-    if not self._validate_paths(source, destination):
-        return
+        if not self._validate_paths(source, destination):
+            return
 
-    backup_name = f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    backup_path = os.path.join(destination, backup_name)
+        backup_name = f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        backup_path = os.path.join(destination, backup_name)
 
-    if not messagebox.askyesno("Confirm Backup",
-                               f"Create backup at:\n{backup_path}?"):
-        return
+        if not messagebox.askyesno("Confirm Backup",
+                                   f"Create backup at:\n{backup_path}?"):
+            return
 
-    self.is_running = True
-    self.migrate_btn.config(state=tk.DISABLED)
-    self.backup_btn.config(state=tk.DISABLED)
+        self.is_running = True
+        self.migrate_btn.config(state=tk.DISABLED)
+        self.backup_btn.config(state=tk.DISABLED)
 
-    # ✅ Pass checkbox values into backup thread
-    thread = threading.Thread(
-        target=self._perform_backup,
-        args=(source, backup_path, self.incremental_var.get(), self.compression_var.get())
-    )
-    thread.daemon = True
-    thread.start()
+        # ✅ Pass checkbox values into backup worker
+        self._executor.submit(
+            self._perform_backup,
+            source, backup_path, self.incremental_var.get(), self.compression_var.get()
+        )
 
-    from backup_engine import BackupEngine
-from notification_system import NotificationManager
+    def _perform_backup(self, source, backup_path, incremental=False, compression=False):
+        """Perform backup in separate thread with progress updates"""
+        try:
+            os.makedirs(backup_path, exist_ok=True)
 
-def _perform_backup(self, source, backup_path, incremental=False, compression=False):
-    """Perform backup in separate thread with progress updates"""
-    try:
-        os.makedirs(backup_path, exist_ok=True)
-
-        notification_manager = NotificationManager()
-        engine = BackupEngine(notification_manager)
-
-        # Progress callback for GUI
-        def gui_progress(processed, total, rel_path, skipped=False):
-            progress = (processed / total) * 100
-            self.progress_value.set(progress)
-            status = "Skipped" if skipped else "Backing up"
-            self.update_status(f"{status}: {rel_path} ({processed}/{total})")
-
-        # Run backup with callback
-        success = engine.backup_directory(
-            source,
-            backup_path,
-            incremental=incremental,
-            compression=compression,
-            progress_callback=gui_progress
-        )
+            notification_manager = NotificationManager()
+            engine = BackupEngine(notification_manager)
+
+            # Progress callback for GUI, coalesced to PROGRESS_INTERVAL
+            last_update = 0.0
 
-        if success and engine.stats:
-            stats = engine.stats
-            self.update_status(
-                f"✅ Backup completed! {stats.total_files} files, "
-                f"{BackupEngine._format_size(stats.total_size)}, "
-                f"Skipped: {stats.files_skipped}, Errors: {stats.errors}"
+            def gui_progress(processed, total, rel_path, skipped=False):
+                nonlocal last_update
+                now = time.monotonic()
+                if now - last_update < PROGRESS_INTERVAL and processed != total:
+                    return
+                last_update = now
+                progress = (processed / total) * 100
+                status = "Skipped" if skipped else "Backing up"
+                self.root.after(0, self._apply_progress, progress,
+                                f"{status}: {rel_path} ({processed}/{total})")
+
+            # Run backup with callback
+            success = engine.backup_directory(
+                source,
+                backup_path,
+                incremental=incremental,
+                compression=compression,
+                progress_callback=gui_progress
             )
-            self.progress_value.set(100)
-        else:
-            self.update_status("❌ Backup failed")
 
-    except Exception as e:
-        self.update_status(f"❌ Error: {str(e)}")
+            if success and engine.stats:
+                stats = engine.stats
+                self.root.after(
+                    0, self._apply_progress, 100,
+                    f"✅ Backup completed! {stats.total_files} files, "
+                    f"{BackupEngine._format_size(stats.total_size)}, "
+                    f"Skipped: {stats.files_skipped}, Errors: {stats.errors}"
+                )
+            else:
+                self.update_status("❌ Backup failed")
 
-    finally:
-        self.is_running = False
-        self.migrate_btn.config(state=tk.NORMAL)
-        self.backup_btn.config(state=tk.NORMAL)
+        except Exception as e:
+            self.update_status(f"❌ Error: {str(e)}")
+
+        finally:
+            self.root.after(0, self._finish_operation)
         
     def _validate_paths(self, source, destination):
-        """Validate source and destination paths"""
-        if source == "Select a folder..." or not os.path.exists(source):
+        """Validate source and destination paths
+        
+        Stats each path once and caches the results, along with whether
+        both sides live on the same device, for the operation that follows.
+        """
+        self._src_stat = self._stat_dir(source)
+        if self._src_stat is None:
             messagebox.showerror("Invalid Source", "Please select a valid source folder")
             return False
         
-        if destination == "Select a folder..." or not os.path.exists(destination):
+        self._dst_stat = self._stat_dir(destination)
+        if self._dst_stat is None:
             messagebox.showerror("Invalid Destination", "Please select a valid destination folder")
             return False
         
-        if source == destination:
+        if os.path.samestat(self._src_stat, self._dst_stat):
             messagebox.showerror("Same Path", "Source and destination must be different")
             return False
         
+        self._same_device = self._src_stat.st_dev == self._dst_stat.st_dev
         return True
+    
+    @staticmethod
+    def _stat_dir(path):
+        """Return the stat result for an existing directory, or None"""
+        if path == "Select a folder...":
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st if stat.S_ISDIR(st.st_mode) else None
 
 
 def main():
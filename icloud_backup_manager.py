@@ -9,9 +9,179 @@ import hashlib
 import time
 import logging
 import shutil
+import queue
+import threading
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Set
+from types import MappingProxyType
+from typing import Dict, List, Tuple, Optional, Set, Iterator
+
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:  # optional; SHA-256 is used instead
+    _blake3 = None
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used instead
+    orjson = None
+
+
+# Flags for one-shot file writes; O_BINARY keeps Windows from translating newlines
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# Serialized manifest bodies kept per manager, keyed by a digest of the input
+MANIFEST_CACHE_SIZE = 32
+
+# Attachment copies: bytes per copy_file_range request, and the userspace
+# buffer used where the kernel can't copy for us
+COPY_RANGE_CHUNK = 1 << 30
+COPY_BUFFER_SIZE = 1 << 20
+_HAS_COPY_FILE_RANGE = hasattr(os, 'copy_file_range')
+
+# Read size for content hashing; files from PIPELINE_HASH_MIN_SIZE up are read
+# on a separate thread so disk reads overlap with hashing
+HASH_BUFFER_SIZE = 1 << 20
+PIPELINE_HASH_MIN_SIZE = 64 << 20
+PIPELINE_QUEUE_DEPTH = 4
+_HAS_FADVISE = hasattr(os, 'posix_fadvise')
+
+# Manifest content digest: BLAKE3 (SIMD, several GB/s per core) when the
+# blake3 package is installed, else SHA-256, which most current CPUs accelerate
+DIGEST_ALGORITHM = 'blake3' if _blake3 is not None else 'sha256'
+
+# Conversations written concurrently; the work is file I/O, so oversubscribe the CPUs
+CONVERSATION_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Per-folder record of written conversations (filename -> [size, mtime_ns,
+# BLAKE2b-128 of the content]) so unchanged files are not rewritten
+CONVERSATION_MANIFEST = '.backup_manifest.json'
+
+
+def _suffix(name: str) -> str:
+    """Lower-cased extension of a file name, dot included, as Path(name).suffix gives."""
+    i = name.rfind('.')
+    return name[i:].lower() if 0 < i < len(name) - 1 else ''
+
+
+def _new_hasher(algorithm: str):
+    """Create a hash object for algorithm, including 'blake3' when available."""
+    if algorithm == 'blake3':
+        return _blake3()
+    return hashlib.new(algorithm)
+
+
+def _pipelined_digest(path: str, algorithm: str = DIGEST_ALGORITHM) -> str:
+    """
+    Hash a file while a reader thread fetches the next chunks.
+    
+    hashlib releases the GIL while hashing large buffers, so reading and
+    hashing run in parallel and the total time approaches the slower of
+    the two rather than their sum.
+    """
+    hasher = _new_hasher(algorithm)
+    chunks = queue.Queue(maxsize=PIPELINE_QUEUE_DEPTH)
+    errors = []
+    
+    def read():
+        try:
+            with open(path, 'rb', buffering=0) as f:
+                if _HAS_FADVISE:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                for chunk in iter(lambda: f.read(HASH_BUFFER_SIZE), b''):
+                    chunks.put(chunk)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            chunks.put(b'')
+    
+    reader = threading.Thread(target=read, daemon=True)
+    reader.start()
+    for chunk in iter(chunks.get, b''):
+        hasher.update(chunk)
+    reader.join()
+    if errors:
+        raise errors[0]
+    return hasher.hexdigest()
+
+
+def _file_digest(path: str, algorithm: str = DIGEST_ALGORITHM) -> str:
+    """
+    Digest of a file's contents as a hex string.
+    
+    Large files are hashed with a read-ahead thread; otherwise uses
+    hashlib.file_digest (Python 3.11+), which hashes straight from an
+    unbuffered file, or 1 MiB reads.
+    """
+    if os.stat(path).st_size >= PIPELINE_HASH_MIN_SIZE:
+        return _pipelined_digest(path, algorithm)
+    with open(path, 'rb', buffering=0) as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, lambda: _new_hasher(algorithm)).hexdigest()
+        hasher = _new_hasher(algorithm)
+        for chunk in iter(lambda: f.read(HASH_BUFFER_SIZE), b''):
+            hasher.update(chunk)
+        return hasher.hexdigest()
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """
+    Copy a file and its metadata like shutil.copy2.
+    
+    Uses os.copy_file_range on Linux so the data never passes through
+    userspace (and CoW filesystems can share extents); elsewhere, or if
+    the kernel refuses, copies through a 1 MiB buffer.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        copied = False
+        if _HAS_COPY_FILE_RANGE:
+            try:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), COPY_RANGE_CHUNK):
+                    pass
+                copied = True
+            except OSError:
+                # e.g. EXDEV on older kernels; start over in userspace
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+        if not copied:
+            shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+    shutil.copystat(src, dst)
+
+
+def _dumps_indented(data) -> bytes:
+    """
+    Serialize data as 2-space indented UTF-8 JSON.
+    
+    Uses orjson when installed, which encodes straight to bytes many times
+    faster than the pure-Python indenting encoder; the layout is the same,
+    though non-ASCII text is written as UTF-8 rather than \\u escapes.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _write_bytes(path: str, data: bytes) -> os.stat_result:
+    """
+    Write a complete file straight to its descriptor.
+    
+    The content is already fully built, so this skips the text and
+    buffered io layers (and their copies of the data) that open() puts
+    in front of the write.
+    
+    Returns:
+        Stat of the written file, taken before it is closed
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        return os.fstat(fd)
+    finally:
+        os.close(fd)
 
 
 class iCloudBackupManager:
@@ -26,6 +196,37 @@ class iCloudBackupManager:
     - Comprehensive backup manifests
     """
     
+    # Conversation topic -> filename: spaces become underscores, and so do
+    # path separators and ':' so a topic can't escape or break the folder
+    _TOPIC_TRANS = str.maketrans({' ': '_', '/': '_', '\\': '_', ':': '_'})
+    
+    # Per-content-type download steps; callers get a fresh list copy
+    _DOWNLOAD_INSTRUCTIONS = MappingProxyType({
+        'photos': (
+            "1. Go to iCloud.com and sign in",
+            "2. Click Photos",
+            "3. Select photos (Ctrl+A for all)",
+            "4. Click Download button (cloud icon)",
+            "5. Choose 'Download Originals' for full quality",
+            "6. Save to appropriate OneDrive folder"
+        ),
+        'videos': (
+            "1. Go to iCloud.com and sign in",
+            "2. Click Photos, then Videos tab",
+            "3. Select videos to download",
+            "4. Click Download button",
+            "5. Ensure original quality is selected",
+            "6. Save to Videos folder"
+        ),
+        'conversations': (
+            "1. Open conversation history in AI assistant",
+            "2. Copy conversation text",
+            "3. Save as .txt or .md file with date prefix",
+            "4. Save any attachments separately",
+            "5. Update conversation index"
+        )
+    })
+    
     def __init__(self, onedrive_path: str, config: Optional[Dict] = None):
         """
         Initialize iCloud backup manager.
@@ -35,9 +236,46 @@ class iCloudBackupManager:
             config: Optional configuration dictionary
         """
         self.onedrive_path = onedrive_path
+        # OneDrive path with its trailing separator, so relative folders can
+        # be appended directly instead of going through os.path.join
+        self._onedrive_prefix = os.path.join(onedrive_path, '')
         self.config = config or self._default_config()
         self.backup_stats = self._init_stats()
         self.logger = self._setup_logging()
+        
+        # Flattened config lookups for the per-file paths (read once; the
+        # config is not expected to change after construction)
+        quality_standards = self.config['quality_standards']
+        self._photo_min_sizes = quality_standards['photo_min_sizes']
+        self._video_min_bitrates = quality_standards['video_min_bitrates']
+        self._photo_exts = frozenset(self._photo_min_sizes)
+        folder_structure = self.config['folder_structure']
+        self._conv_root = folder_structure['conversations']
+        # Main backup categories
+        self._main_folders = (
+            f"{folder_structure['iphone_backup']}/Photos",
+            f"{folder_structure['iphone_backup']}/Videos",
+            f"{folder_structure['iphone_backup']}/Screenshots",
+            f"{folder_structure['iphone_backup']}/Live_Photos",
+            f"{folder_structure['icloud_backup']}/Photos",
+            f"{folder_structure['icloud_backup']}/Videos",
+            f"{folder_structure['conversations']}/Copilot",
+            f"{folder_structure['conversations']}/Office_Agent",
+            f"{folder_structure['conversations']}/ChatGPT",
+            f"{folder_structure['conversations']}/Other_AI",
+            f"{folder_structure['text_messages']}/Media",
+            f"{folder_structure['text_messages']}/Attachments",
+            "Backup_Reports",
+            "Download_Manifests"
+        )
+        # Photo and video directories that get year/month subfolders
+        self._date_roots = (
+            f"{folder_structure['iphone_backup']}/Photos",
+            f"{folder_structure['icloud_backup']}/Photos",
+            f"{folder_structure['iphone_backup']}/Videos",
+            f"{folder_structure['icloud_backup']}/Videos"
+        )
+        self._manifest_cache: Dict[bytes, bytes] = {}
     
     def _default_config(self) -> Dict:
         """Default configuration for iCloud backup manager."""
@@ -111,70 +349,75 @@ class iCloudBackupManager:
         
         created_paths = {}
         
-        # Main backup categories
-        main_folders = [
-            f"{self.config['folder_structure']['iphone_backup']}/Photos",
-            f"{self.config['folder_structure']['iphone_backup']}/Videos",
-            f"{self.config['folder_structure']['iphone_backup']}/Screenshots",
-            f"{self.config['folder_structure']['iphone_backup']}/Live_Photos",
-            f"{self.config['folder_structure']['icloud_backup']}/Photos",
-            f"{self.config['folder_structure']['icloud_backup']}/Videos",
-            f"{self.config['folder_structure']['conversations']}/Copilot",
-            f"{self.config['folder_structure']['conversations']}/Office_Agent",
-            f"{self.config['folder_structure']['conversations']}/ChatGPT",
-            f"{self.config['folder_structure']['conversations']}/Other_AI",
-            f"{self.config['folder_structure']['text_messages']}/Media",
-            f"{self.config['folder_structure']['text_messages']}/Attachments",
-            "Backup_Reports",
-            "Download_Manifests"
-        ]
+        main_folders = self._main_folders
+        now = datetime.now()
         
+        # Create date-based subfolders if enabled, in the same batch
+        folders = set(main_folders)
+        if self.config['backup_settings']['create_date_folders']:
+            folders.update(self._date_folders(now))
+        self._make_dirs(folders)
+        
+        prefix = self._onedrive_prefix
         for folder in main_folders:
-            folder_path = os.path.join(self.onedrive_path, folder)
-            os.makedirs(folder_path, exist_ok=True)
-            created_paths[folder] = folder_path
+            created_paths[folder] = prefix + folder
             self.logger.info(f"Created folder: {folder}")
         
-        # Create date-based subfolders if enabled
-        if self.config['backup_settings']['create_date_folders']:
-            self._create_date_folders(created_paths)
-        
         # Create setup documentation
-        self._create_setup_documentation()
+        self._create_setup_documentation(now)
         
         return created_paths
     
-    def _create_date_folders(self, base_paths: Dict[str, str]):
+    def _create_date_folders(self, now: Optional[datetime] = None):
         """Create date-based organization folders."""
-        current_year = datetime.now().year
+        self._make_dirs(self._date_folders(now))
+    
+    def _date_folders(self, now: Optional[datetime] = None) -> List[str]:
+        """Year/month folders under each photo and video directory, relative to the OneDrive path."""
+        current_year = (now or datetime.now()).year
+        base_paths = self._date_roots
         
-        # Create folders for current and previous 2 years
-        for year in range(current_year - 2, current_year + 1):
-            for month in range(1, 13):
-                date_folder = f"{year}/{month:02d}"
-                
-                # Create date folders in photo and video directories
-                photo_paths = [
-                    f"{self.config['folder_structure']['iphone_backup']}/Photos",
-                    f"{self.config['folder_structure']['icloud_backup']}/Photos"
-                ]
-                
-                video_paths = [
-                    f"{self.config['folder_structure']['iphone_backup']}/Videos",
-                    f"{self.config['folder_structure']['icloud_backup']}/Videos"
-                ]
-                
-                for base_path in photo_paths + video_paths:
-                    date_path = os.path.join(self.onedrive_path, base_path, date_folder)
-                    os.makedirs(date_path, exist_ok=True)
+        # Current and previous 2 years
+        return [
+            f"{base_path}/{year}/{month:02d}"
+            for year in range(current_year - 2, current_year + 1)
+            for month in range(1, 13)
+            for base_path in base_paths
+        ]
+    
+    def _make_dirs(self, folders) -> None:
+        """
+        Create folders relative to the OneDrive path, parents first.
+        
+        Every directory, ancestors included, gets exactly one mkdir and an
+        existing one is simply skipped, instead of makedirs re-probing the
+        whole chain for each leaf.
+        
+        Args:
+            folders: '/'-separated paths relative to the OneDrive path
+        """
+        needed = set()
+        for folder in folders:
+            while folder and folder not in needed:
+                needed.add(folder)
+                folder = folder.rpartition('/')[0]
+        
+        os.makedirs(self.onedrive_path, exist_ok=True)
+        prefix = self._onedrive_prefix
+        # A parent sorts before anything that starts with it
+        for folder in sorted(needed):
+            try:
+                os.mkdir(prefix + folder)
+            except FileExistsError:
+                pass
     
-    def _create_setup_documentation(self):
+    def _create_setup_documentation(self, now: datetime):
         """Create documentation for backup setup."""
         doc_content = f"""
 iCLOUD BACKUP SETUP GUIDE
 =========================
 
-Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Created: {now.strftime('%Y-%m-%d %H:%M:%S')}
 OneDrive Path: {self.onedrive_path}
 
 FOLDER STRUCTURE:
@@ -249,8 +492,7 @@ For questions or issues, refer to the backup verification tools.
 """
         
         doc_path = os.path.join(self.onedrive_path, "iCloud_Backup_Setup_Guide.txt")
-        with open(doc_path, 'w', encoding='utf-8') as f:
-            f.write(doc_content)
+        _write_bytes(doc_path, doc_content.encode('utf-8'))
         
         self.logger.info(f"Setup documentation created: {doc_path}")
     
@@ -265,44 +507,8 @@ For questions or issues, refer to the backup verification tools.
             Dictionary with quality verification results
         """
         try:
-            file_size = os.path.getsize(file_path)
-            file_ext = Path(file_path).suffix.lower()
-            
-            # Photo quality verification
-            if file_ext in self.config['quality_standards']['photo_min_sizes']:
-                min_size = self.config['quality_standards']['photo_min_sizes'][file_ext]
-                is_full_quality = file_size >= min_size
-                
-                return {
-                    'file_type': 'photo',
-                    'is_full_quality': is_full_quality,
-                    'file_size_mb': file_size / (1024 * 1024),
-                    'min_size_mb': min_size / (1024 * 1024),
-                    'quality_status': 'FULL' if is_full_quality else 'COMPRESSED'
-                }
-            
-            # Video quality verification (basic size check)
-            elif file_ext in self.config['quality_standards']['video_min_bitrates']:
-                min_bitrate = self.config['quality_standards']['video_min_bitrates'][file_ext]
-                # Assume minimum 30 seconds for basic quality check
-                min_expected_size = min_bitrate * 0.5  # 30 seconds
-                is_reasonable_quality = file_size >= min_expected_size
-                
-                return {
-                    'file_type': 'video',
-                    'is_full_quality': is_reasonable_quality,
-                    'file_size_mb': file_size / (1024 * 1024),
-                    'quality_status': 'FULL' if is_reasonable_quality else 'COMPRESSED'
-                }
-            
-            else:
-                return {
-                    'file_type': 'other',
-                    'is_full_quality': True,
-                    'file_size_mb': file_size / (1024 * 1024),
-                    'quality_status': 'UNKNOWN'
-                }
-        
+            file_size = os.stat(file_path).st_size
+            return self._quality_result(_suffix(os.path.basename(file_path)), file_size)
         except Exception as e:
             self.logger.error(f"Error verifying quality for {file_path}: {e}")
             return {
@@ -311,6 +517,81 @@ For questions or issues, refer to the backup verification tools.
                 'error': str(e)
             }
     
+    def verify_download_quality_batch(self, root: str) -> Iterator[Dict]:
+        """
+        Verify every downloaded file under a directory.
+        
+        Walks the tree with os.scandir so each file costs one stat (cached
+        on the DirEntry) and no Path objects.
+        
+        Args:
+            root: Directory of downloaded files
+            
+        Yields:
+            Quality verification results, each with a 'path' key
+        """
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                                continue
+                            if not entry.is_file():
+                                continue
+                            result = self._quality_result(_suffix(entry.name), entry.stat().st_size)
+                        except OSError as e:
+                            self.logger.error(f"Error verifying quality for {entry.path}: {e}")
+                            result = {
+                                'file_type': 'error',
+                                'is_full_quality': False,
+                                'error': str(e)
+                            }
+                        result['path'] = entry.path
+                        yield result
+            except OSError as e:
+                self.logger.error(f"Error scanning {directory}: {e}")
+    
+    def _quality_result(self, file_ext: str, file_size: int) -> Dict:
+        """Classify a file by extension and judge its quality from its size."""
+        # Photo quality verification
+        if file_ext in self._photo_exts:
+            min_size = self._photo_min_sizes[file_ext]
+            is_full_quality = file_size >= min_size
+            
+            return {
+                'file_type': 'photo',
+                'is_full_quality': is_full_quality,
+                'file_size_mb': file_size / (1024 * 1024),
+                'min_size_mb': min_size / (1024 * 1024),
+                'quality_status': 'FULL' if is_full_quality else 'COMPRESSED'
+            }
+        
+        # Video quality verification (basic size check)
+        elif file_ext in self._video_min_bitrates:
+            min_bitrate = self._video_min_bitrates[file_ext]
+            # Assume minimum 30 seconds for basic quality check
+            min_expected_size = min_bitrate * 0.5  # 30 seconds
+            is_reasonable_quality = file_size >= min_expected_size
+            
+            return {
+                'file_type': 'video',
+                'is_full_quality': is_reasonable_quality,
+                'file_size_mb': file_size / (1024 * 1024),
+                'quality_status': 'FULL' if is_reasonable_quality else 'COMPRESSED'
+            }
+        
+        else:
+            return {
+                'file_type': 'other',
+                'is_full_quality': True,
+                'file_size_mb': file_size / (1024 * 1024),
+                'quality_status': 'UNKNOWN'
+            }
+    
     def backup_conversations(self, conversation_type: str, conversations: List[Dict]) -> Dict:
         """
         Backup AI assistant conversations with metadata.
@@ -326,7 +607,7 @@ For questions or issues, refer to the backup verification tools.
         
         conversation_folder = os.path.join(
             self.onedrive_path, 
-            self.config['folder_structure']['conversations'],
+            self._conv_root,
             conversation_type.title()
         )
         
@@ -337,46 +618,192 @@ For questions or issues, refer to the backup verification tools.
             'errors': []
         }
         
-        for i, conversation in enumerate(conversations):
+        # Attachments share one folder, so create it once for the batch rather
+        # than per conversation; a missing conversation folder is left for
+        # each conversation write to report
+        if any('attachments' in conversation for conversation in conversations):
             try:
-                # Create conversation file
-                timestamp = conversation.get('timestamp', datetime.now().isoformat())
-                topic = conversation.get('topic', f'conversation_{i+1}')
-                filename = f"{timestamp[:10]}_{topic.replace(' ', '_')}.md"
-                
-                conversation_path = os.path.join(conversation_folder, filename)
-                
-                # Format conversation content
-                content = self._format_conversation(conversation)
-                
-                with open(conversation_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                
+                os.mkdir(os.path.join(conversation_folder, 'Attachments'))
+            except (FileExistsError, FileNotFoundError):
+                pass
+        
+        manifest_path = os.path.join(conversation_folder, CONVERSATION_MANIFEST)
+        manifest = self._load_conversation_manifest(manifest_path)
+        # Filename date for conversations without a timestamp of their own
+        now_iso = datetime.now().isoformat()
+        
+        # Conversations writing to a common path run in input order on one
+        # worker, so the last one still wins as it did sequentially
+        results = []
+        chains = self._collision_chains(conversations, now_iso)
+        if chains:
+            with ThreadPoolExecutor(max_workers=min(CONVERSATION_WORKERS, len(chains))) as executor:
+                futures = [
+                    executor.submit(self._backup_conversation_chain, chain, conversations,
+                                    conversation_folder, manifest, now_iso)
+                    for chain in chains
+                ]
+                for future in as_completed(futures):
+                    results.extend(future.result())
+        
+        # Merge per-conversation tallies; errors keep conversation order
+        manifest_changed = False
+        for i, written, size, attachments, error_msg, entry in sorted(results, key=lambda r: r[0]):
+            if written:
                 backup_stats['conversations_backed_up'] += 1
-                backup_stats['total_size'] += len(content.encode('utf-8'))
-                
-                # Save attachments if any
-                if 'attachments' in conversation:
-                    attachments_folder = os.path.join(conversation_folder, 'Attachments')
-                    os.makedirs(attachments_folder, exist_ok=True)
-                    
-                    for attachment in conversation['attachments']:
-                        if os.path.exists(attachment['path']):
-                            dest_path = os.path.join(attachments_folder, attachment['filename'])
-                            shutil.copy2(attachment['path'], dest_path)
-                            backup_stats['attachments_saved'] += 1
-            
-            except Exception as e:
-                error_msg = f"Error backing up conversation {i+1}: {str(e)}"
+                backup_stats['total_size'] += size
+            backup_stats['attachments_saved'] += attachments
+            if error_msg:
                 backup_stats['errors'].append(error_msg)
-                self.logger.error(error_msg)
+            if entry:
+                manifest[entry[0]] = entry[1]
+                manifest_changed = True
+        
+        if manifest_changed:
+            try:
+                self._write_json(manifest_path, manifest)
+            except OSError as e:
+                self.logger.warning(f"Could not save conversation manifest: {e}")
         
         self.backup_stats['conversations_backed_up'] += backup_stats['conversations_backed_up']
         return backup_stats
     
+    def _load_conversation_manifest(self, manifest_path: str) -> Dict[str, List]:
+        """Load a conversation folder's manifest; missing or unreadable means empty."""
+        try:
+            with open(manifest_path, 'rb') as f:
+                manifest = json.loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable conversation manifest: {e}")
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+    
+    def _conversation_filename(self, i: int, conversation: Dict, now_iso: str) -> str:
+        """File name a conversation is written under."""
+        timestamp = conversation.get('timestamp', now_iso)
+        topic = conversation.get('topic', f'conversation_{i+1}')
+        return timestamp[:10] + '_' + topic.translate(self._TOPIC_TRANS) + '.md'
+    
+    def _collision_chains(self, conversations: List[Dict], now_iso: str) -> List[List[int]]:
+        """
+        Group conversation indices that write to a common file.
+        
+        A conversation's files are its own and its attachments'; names are
+        compared case-insensitively, as OneDrive folders are.
+        
+        Returns:
+            Chains of indices in input order; conversations in different
+            chains never touch the same path
+        """
+        parent = list(range(len(conversations)))
+        
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        owners: Dict[str, int] = {}
+        for i, conversation in enumerate(conversations):
+            try:
+                paths = [self._conversation_filename(i, conversation, now_iso)]
+                paths += [os.path.join('Attachments', attachment['filename'])
+                          for attachment in conversation.get('attachments', ())]
+            except Exception:
+                # The conversation's own write reports the problem
+                continue
+            for path in paths:
+                first = owners.setdefault(path.lower(), i)
+                parent[find(i)] = find(first)
+        
+        chains: Dict[int, List[int]] = {}
+        for i in range(len(conversations)):
+            chains.setdefault(find(i), []).append(i)
+        return list(chains.values())
+    
+    def _backup_conversation_chain(self, chain: List[int], conversations: List[Dict],
+                                   conversation_folder: str, manifest: Dict[str, List],
+                                   now_iso: str) -> List[Tuple]:
+        """Back up a chain of conversations one after another; returns their results."""
+        return [self._backup_one_conversation(i, conversations[i], conversation_folder,
+                                              manifest, now_iso)
+                for i in chain]
+    
+    def _backup_one_conversation(self, i: int, conversation: Dict, conversation_folder: str,
+                                 manifest: Dict[str, List], now_iso: str) -> Tuple[int, bool, int, int, Optional[str], Optional[Tuple[str, List]]]:
+        """
+        Write one conversation and copy its attachments.
+        
+        Runs on a worker thread, so it tallies locally instead of touching
+        shared stats, and only reads the manifest.
+        
+        Args:
+            i: Position of the conversation in the batch
+            conversation: Conversation dictionary
+            conversation_folder: Folder the conversation is written to
+            manifest: Folder manifest; if the file on disk still has the
+                recorded size and mtime and the content digest is the same,
+                the write is skipped
+            now_iso: Timestamp used when the conversation has none
+        
+        Returns:
+            Tuple of (index, conversation written, bytes written,
+            attachments saved, error message or None, new manifest entry
+            as (filename, record) or None)
+        """
+        written, size, attachments_saved, entry = False, 0, 0, None
+        try:
+            # Create conversation file
+            filename = self._conversation_filename(i, conversation, now_iso)
+            
+            conversation_path = os.path.join(conversation_folder, filename)
+            
+            # Format conversation content
+            data = self._format_conversation(conversation).encode('utf-8')
+            
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+            record = manifest.get(filename)
+            unchanged = False
+            if record and record[2] == digest:
+                try:
+                    st = os.stat(conversation_path)
+                    unchanged = st.st_size == record[0] and st.st_mtime_ns == record[1]
+                except OSError:
+                    pass
+            
+            if not unchanged:
+                st = _write_bytes(conversation_path, data)
+                entry = (filename, [len(data), st.st_mtime_ns, digest])
+            
+            written, size = True, len(data)
+            
+            # Save attachments if any
+            if 'attachments' in conversation:
+                attachments_folder = os.path.join(conversation_folder, 'Attachments')
+                
+                for attachment in conversation['attachments']:
+                    dest_path = os.path.join(attachments_folder, attachment['filename'])
+                    # Opening the source is the existence check; no separate stat
+                    try:
+                        _fast_copy(attachment['path'], dest_path)
+                    except FileNotFoundError as e:
+                        if e.filename != attachment['path']:
+                            raise
+                        continue
+                    attachments_saved += 1
+        
+        except Exception as e:
+            error_msg = f"Error backing up conversation {i+1}: {str(e)}"
+            self.logger.error(error_msg)
+            return i, written, size, attachments_saved, error_msg, entry
+        
+        return i, written, size, attachments_saved, None, entry
+    
     def _format_conversation(self, conversation: Dict) -> str:
         """Format conversation data into readable markdown."""
-        content = f"""# {conversation.get('topic', 'Conversation')}
+        parts = [f"""# {conversation.get('topic', 'Conversation')}
 
 **Date**: {conversation.get('timestamp', 'Unknown')}
 **Type**: {conversation.get('type', 'AI Conversation')}
@@ -384,7 +811,8 @@ For questions or issues, refer to the backup verification tools.
 
 ---
 
-"""
+"""]
+        append = parts.append
         
         # Add conversation messages
         for message in conversation.get('messages', []):
@@ -392,92 +820,107 @@ For questions or issues, refer to the backup verification tools.
             timestamp = message.get('timestamp', '')
             text = message.get('text', '')
             
-            content += f"## {sender}"
+            append(f"## {sender}")
             if timestamp:
-                content += f" - {timestamp}"
-            content += f"\n\n{text}\n\n---\n\n"
+                append(f" - {timestamp}")
+            append(f"\n\n{text}\n\n---\n\n")
         
         # Add metadata
         if conversation.get('metadata'):
-            content += "## Metadata\n\n"
+            append("## Metadata\n\n")
             for key, value in conversation['metadata'].items():
-                content += f"- **{key}**: {value}\n"
+                append(f"- **{key}**: {value}\n")
         
-        return content
+        return ''.join(parts)
     
-    def create_download_manifest(self, content_type: str, file_list: List[str]) -> str:
+    def create_download_manifest(self, content_type: str, file_list: List[str],
+                                 include_checksums: bool = False) -> str:
         """
         Create manifest of files to download.
         
         Args:
             content_type: Type of content (photos, videos, etc.)
             file_list: List of file paths or URLs
+            include_checksums: Record size and content digest for entries that are
+                local files, so copies can be verified before originals
+                are deleted
             
         Returns:
             Path to created manifest file
         """
-        manifest = {
-            'created': datetime.now().isoformat(),
-            'content_type': content_type,
-            'total_files': len(file_list),
-            'files': [],
-            'download_instructions': self._get_download_instructions(content_type)
-        }
+        now = datetime.now()
+        created = now.isoformat()
+        
+        # Everything but the timestamp depends only on the inputs, so repeat
+        # calls reuse the serialized body; hashing the repr is far cheaper
+        # than the indented JSON encode. Checksummed manifests depend on file
+        # contents too, so they are never cached.
+        key = hashlib.blake2b(repr((content_type, file_list)).encode('utf-8'),
+                              digest_size=16).digest()
+        body = None if include_checksums else self._manifest_cache.get(key)
+        if body is None:
+            manifest = {
+                'content_type': content_type,
+                'total_files': len(file_list),
+                'files': [],
+                'download_instructions': self._get_download_instructions(content_type)
+            }
+            
+            for file_item in file_list:
+                if isinstance(file_item, str):
+                    entry = {
+                        'path': file_item,
+                        'status': 'pending',
+                        'size': None,
+                        'downloaded': False
+                    }
+                    if include_checksums and os.path.isfile(file_item):
+                        try:
+                            entry['size'] = os.stat(file_item).st_size
+                            entry['checksum'] = {
+                                'algo': DIGEST_ALGORITHM,
+                                'digest': _file_digest(file_item)
+                            }
+                        except OSError as e:
+                            self.logger.error(f"Error hashing {file_item}: {e}")
+                    manifest['files'].append(entry)
+                else:
+                    manifest['files'].append(file_item)
+            
+            body = _dumps_indented(manifest)
+            if not include_checksums:
+                if len(self._manifest_cache) >= MANIFEST_CACHE_SIZE:
+                    del self._manifest_cache[next(iter(self._manifest_cache))]
+                self._manifest_cache[key] = body
         
-        for file_item in file_list:
-            if isinstance(file_item, str):
-                manifest['files'].append({
-                    'path': file_item,
-                    'status': 'pending',
-                    'size': None,
-                    'downloaded': False
-                })
-            else:
-                manifest['files'].append(file_item)
-        
-        manifest_filename = f"{content_type}_download_manifest_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        manifest_filename = f"{content_type}_download_manifest_{now.strftime('%Y%m%d_%H%M%S')}.json"
         manifest_path = os.path.join(self.onedrive_path, "Download_Manifests", manifest_filename)
         
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
+        # 'created' leads the object, exactly where json.dumps would put it
+        _write_bytes(manifest_path, b'{\n  "created": "' + created.encode('ascii') + b'",' + body[1:])
         
         self.logger.info(f"Download manifest created: {manifest_path}")
         return manifest_path
     
+    def _write_json(self, path: str, data: Dict) -> None:
+        """
+        Write data as indented JSON in one write.
+        
+        json.dump streams through the pure-Python encoder in hundreds of
+        small writes; serializing up front and writing the encoded bytes
+        once is markedly cheaper for large manifests.
+        """
+        _write_bytes(path, _dumps_indented(data))
+    
     def _get_download_instructions(self, content_type: str) -> List[str]:
         """Get specific download instructions for content type."""
-        instructions = {
-            'photos': [
-                "1. Go to iCloud.com and sign in",
-                "2. Click Photos",
-                "3. Select photos (Ctrl+A for all)",
-                "4. Click Download button (cloud icon)",
-                "5. Choose 'Download Originals' for full quality",
-                "6. Save to appropriate OneDrive folder"
-            ],
-            'videos': [
-                "1. Go to iCloud.com and sign in",
-                "2. Click Photos, then Videos tab",
-                "3. Select videos to download",
-                "4. Click Download button",
-                "5. Ensure original quality is selected",
-                "6. Save to Videos folder"
-            ],
-            'conversations': [
-                "1. Open conversation history in AI assistant",
-                "2. Copy conversation text",
-                "3. Save as .txt or .md file with date prefix",
-                "4. Save any attachments separately",
-                "5. Update conversation index"
-            ]
-        }
-        
-        return instructions.get(content_type, ["Manual download required"])
+        return list(self._DOWNLOAD_INSTRUCTIONS.get(content_type, ("Manual download required",)))
     
     def generate_backup_report(self) -> Dict:
         """Generate comprehensive backup report."""
+        now = datetime.now()
         report = {
-            'report_date': datetime.now().isoformat(),
+            'report_date': now.isoformat(),
             'onedrive_path': self.onedrive_path,
             'backup_statistics': self.backup_stats,
             'folder_structure': self.config['folder_structure'],
@@ -513,10 +956,9 @@ For questions or issues, refer to the backup verification tools.
         
         # Save report
         report_path = os.path.join(self.onedrive_path, "Backup_Reports", 
-                                 f"icloud_backup_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+                                 f"icloud_backup_report_{now.strftime('%Y%m%d_%H%M%S')}.json")
         
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        self._write_json(report_path, report)
         
         self.logger.info(f"Backup report saved: {report_path}")
         return report
@@ -529,9 +971,12 @@ def main():
     if not onedrive_path:
         onedrive_path = os.path.join(os.path.expanduser("~"), "OneDrive")
     
-    if not os.path.exists(onedrive_path):
-        print(f"Creating OneDrive folder: {onedrive_path}")
-        os.makedirs(onedrive_path, exist_ok=True)
+    # Attempt the mkdir directly; an existing folder is the only failure to ignore
+    try:
+        os.makedirs(onedrive_path)
+        print(f"Created OneDrive folder: {onedrive_path}")
+    except FileExistsError:
+        pass
     
     # Initialize backup manager
     backup_manager = iCloudBackupManager(onedrive_path)
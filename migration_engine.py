@@ -8,11 +8,263 @@ import shutil
 import hashlib
 import json
 import time
+import atexit
+import ctypes
 import logging
+import logging.handlers
+import queue
+import mmap
+import re
+import socket
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Set
 
+try:
+    import blake3
+except ImportError:  # optional; SHA-256 is used instead
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used instead
+    orjson = None
+
+
+# Integrity hash: BLAKE3 (SIMD, multithreaded over large files) when the
+# blake3 package is installed, else SHA-256, which most current CPUs
+# accelerate. Hashes carry a short algorithm tag so stored values stay
+# decodable if the algorithm changes.
+HASH_ALGORITHM = 'blake3' if blake3 is not None else 'sha256'
+HASH_TAGS = {'blake3': 'b3', 'sha256': 's256', 'md5': 'md5'}
+
+# File hashing: files up to SINGLE_SHOT_THRESHOLD are read and hashed in one
+# call, files up to MMAP_MAX_SIZE are mapped and hashed in MMAP_SLICE pieces
+# (cache-sized, no copies into Python buffers), anything larger is streamed
+# in HASH_BUFFER_SIZE reads
+HASH_BUFFER_SIZE = 1 << 20
+SINGLE_SHOT_THRESHOLD = 8 << 20
+MMAP_MAX_SIZE = 1 << 30
+MMAP_SLICE = 4 << 20
+
+
+# Per-file errors are appended to this JSON Lines file in the destination
+# as they happen, instead of being collected in memory for the report
+ERROR_LOG_NAME = 'migration_errors.jsonl'
+
+# Storage detection: Win32 GetDriveTypeW codes worth probing, and how long
+# to wait for drive probes before giving up on the stragglers
+DRIVE_REMOVABLE = 2
+DRIVE_FIXED = 3
+DRIVE_PROBE_TIMEOUT = 2.0
+
+# Concurrent file copies per migrated folder (config 'io_workers' overrides);
+# the work is I/O-bound and the GIL is released while copying
+IO_WORKERS = 8
+
+# Bytes per copy_file_range request when copying migrated files
+COPY_RANGE_CHUNK = 1 << 30
+_HAS_COPY_FILE_RANGE = hasattr(os, 'copy_file_range')
+
+# Files from this size up are read with sequential-access hints and dropped
+# from the page cache once copied, so a large migration doesn't evict
+# everything else; smaller files aren't worth the extra syscalls
+FADVISE_MIN_SIZE = 64 << 20
+_HAS_FADVISE = hasattr(os, 'posix_fadvise')
+
+
+# Opt-in O_DIRECT copies of large files (config 'o_direct'): the data goes
+# disk -> aligned buffer -> disk without passing through the page cache.
+# Lengths are kept multiples of DIRECT_ALIGN, which covers 512-byte and 4K
+# logical blocks; mmap buffers are page-aligned.
+DIRECT_BUFFER_SIZE = 4 << 20
+DIRECT_ALIGN = 4096
+DIRECT_MIN_SIZE = 64 << 20
+_HAS_O_DIRECT = hasattr(os, 'O_DIRECT')
+
+
+def _direct_copy(src: str, dst: str) -> None:
+    """
+    Copy file data with O_DIRECT on both ends.
+    
+    The final partial block is written padded to the alignment and the
+    destination then truncated to the true length. Raises OSError (e.g.
+    EINVAL on filesystems without O_DIRECT) so the caller can fall back.
+    """
+    src_fd = os.open(src, os.O_RDONLY | os.O_DIRECT)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o666)
+        try:
+            with mmap.mmap(-1, DIRECT_BUFFER_SIZE) as buf:
+                total = 0
+                while True:
+                    n = os.readv(src_fd, [buf])
+                    if not n:
+                        break
+                    length = -(-n // DIRECT_ALIGN) * DIRECT_ALIGN
+                    with memoryview(buf) as view:
+                        if os.writev(dst_fd, [view[:length]]) != length:
+                            raise OSError("short O_DIRECT write")
+                    total += n
+                    if n % DIRECT_ALIGN:
+                        break
+                os.ftruncate(dst_fd, total)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+def _advise(fd: int, advice: int) -> None:
+    """posix_fadvise over the whole file, ignoring platforms and files that refuse it."""
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
+def _fast_copy(src: str, dst: str, size: Optional[int] = None, direct: bool = False) -> None:
+    """
+    Copy a file and its metadata like shutil.copy2.
+    
+    Uses os.copy_file_range on Linux, so the kernel copies the data (and
+    CoW filesystems can share extents instead); if that is unavailable or
+    refused, falls back to shutil.copyfile, which already uses sendfile,
+    fcopyfile or CopyFile2 where the platform has them.
+    
+    Args:
+        src: Source file path
+        dst: Destination file path
+        size: Source size if already known; large files get page cache hints
+        direct: Try an O_DIRECT copy first (Linux), bypassing the page cache
+    """
+    copied = False
+    if direct and _HAS_O_DIRECT:
+        try:
+            _direct_copy(src, dst)
+            copied = True
+        except OSError:
+            # Not supported here, or misaligned; copy normally instead
+            pass
+    if not copied and _HAS_COPY_FILE_RANGE:
+        advise = _HAS_FADVISE and size is not None and size >= FADVISE_MIN_SIZE
+        # Raw descriptors: open() would add an fstat, isatty ioctl and lseek
+        # per file for buffering this copy never uses
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                if advise:
+                    _advise(src_fd, os.POSIX_FADV_SEQUENTIAL)
+                try:
+                    while os.copy_file_range(src_fd, dst_fd, COPY_RANGE_CHUNK):
+                        pass
+                    copied = True
+                except OSError:
+                    # e.g. EXDEV on older kernels; copyfile starts over
+                    pass
+                if advise:
+                    _advise(src_fd, os.POSIX_FADV_DONTNEED)
+                    _advise(dst_fd, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _dumps_indented(data) -> bytes:
+    """
+    Serialize data as 2-space indented UTF-8 JSON.
+    
+    Uses orjson when installed, which encodes straight to bytes many times
+    faster than the pure-Python indenting encoder.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _jsonable(value):
+    """Copy of a config value with sets turned into sorted lists, so it can be serialized."""
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    return value
+
+
+class _ErrorLineFormatter(logging.Formatter):
+    """Formats error records as one JSON object per line: ts, file, err."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        line = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(),
+            'file': getattr(record, 'file', None),
+            'err': getattr(record, 'err', record.getMessage())
+        }
+        if orjson is not None:
+            return orjson.dumps(line).decode('utf-8')
+        return json.dumps(line)
+
+
+@dataclass(slots=True)
+class FolderStats:
+    """Counters for one migrated source folder."""
+    files_processed: int = 0
+    files_copied: int = 0
+    files_skipped: int = 0
+    total_size: int = 0
+    categories: Counter = field(default_factory=Counter)
+    error_count: int = 0
+
+    def to_dict(self):
+        stats = asdict(self)
+        stats['categories'] = dict(self.categories)
+        return stats
+
+
+@dataclass(slots=True)
+class MigrationStats:
+    """Totals across all folders of a migration run."""
+    files_processed: int = 0
+    files_copied: int = 0
+    files_skipped: int = 0
+    modern_files: int = 0
+    legacy_files: int = 0
+    unknown_files: int = 0
+    total_size: int = 0
+    error_count: int = 0
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+
+    def add(self, folder_stats: FolderStats):
+        """Fold one folder's counters into the totals."""
+        self.files_processed += folder_stats.files_processed
+        self.files_copied += folder_stats.files_copied
+        self.files_skipped += folder_stats.files_skipped
+        self.total_size += folder_stats.total_size
+        self.error_count += folder_stats.error_count
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def _suffix(file_path: str) -> str:
+    """Lower-cased extension of a path's file name, dot included, as Path(file_path).suffix gives."""
+    name = os.path.basename(file_path)
+    i = name.rfind('.')
+    return name[i:].lower() if 0 < i < len(name) - 1 else ''
+
 
 class MigrationEngine:
     """
@@ -31,32 +283,94 @@ class MigrationEngine:
         self.config = config or self._default_config()
         self.stats = self._init_stats()
         self.logger = self._setup_logging()
+        self._compile_extension_index()
+        # Destination folder -> names already in it (os.path.normcase'd)
+        self._dest_index: Dict[str, Set[str]] = {}
+        # Rendered static part of the backup manifest (config included),
+        # built on first use
+        self._manifest_body: Optional[bytes] = None
+        # Machine and account recorded in manifests, looked up once
+        self._host = os.environ.get('COMPUTERNAME') or socket.gethostname() or 'Unknown'
+        self._user = os.environ.get('USERNAME') or os.environ.get('USER')
+        if not self._user:
+            try:
+                self._user = os.getlogin()
+            except OSError:  # no controlling terminal, e.g. a service
+                self._user = 'unknown'
+        # Duplicate detection ('verify_hash'): (size, mtime_ns) -> paths
+        # migrated so far, and content hashes computed on collision
+        self._seen_by_meta: Dict[Tuple[int, int], List[str]] = {}
+        self._seen_by_hash: Dict[str, Optional[str]] = {}
+        
+    def _compile_extension_index(self):
+        """
+        Flatten the format tables into one extension -> (category, file_type) map.
         
+        Modern formats take precedence over legacy ones, and earlier
+        categories over later ones, as in the original sequential checks.
+        Skipped extensions map to (None, 'system') and win over both, so
+        categorize_file needs a single lookup. Skip lists are compiled here too.
+        """
+        ext_index = {}
+        for file_type in ('modern', 'legacy'):
+            for category, extensions in self.config[f'{file_type}_formats'].items():
+                for ext in extensions:
+                    ext_index.setdefault(sys.intern(ext), (category, file_type))
+        
+        # Destination folder label for every categorization the index can give
+        self._dest_labels = {
+            hit: self._dest_label(*hit)
+            for hit in set(ext_index.values()) | {('unknown', 'unknown')}
+        }
+        
+        self._skip_exts = frozenset(sys.intern(ext) for ext in self.config['skip_extensions'])
+        for ext in self._skip_exts:
+            ext_index[ext] = (None, 'system')
+        self._ext_index = ext_index
+        
+        # All skip-folder tokens in one alternation, so each path is scanned
+        # once in C rather than once per token
+        skip_folders = self.config['skip_folders']
+        self._skip_folder_re = (
+            re.compile('|'.join(re.escape(token) for token in sorted(skip_folders)))
+            if skip_folders else None
+        )
+    
     def _default_config(self) -> Dict:
         """Default configuration for migration engine."""
         return {
             'modern_formats': {
-                'documents': {'.pdf', '.doc', '.docx', '.txt', '.rtf', '.odt',
-                            '.xls', '.xlsx', '.csv', '.ppt', '.pptx', '.odp'},
-                'images': {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif',
-                          '.webp', '.svg', '.ico', '.raw', '.cr2', '.nef', '.dng'},
-                'videos': {'.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv', '.webm',
-                          '.m4v', '.3gp', '.mpg', '.mpeg', '.m2v', '.mts'},
-                'audio': {'.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a',
-                         '.opus', '.aiff', '.au', '.ra'},
-                'archives': {'.zip', '.rar', '.7z', '.tar', '.gz'}
+                'documents': frozenset({'.pdf', '.doc', '.docx', '.txt', '.rtf', '.odt',
+                                      '.xls', '.xlsx', '.csv', '.ppt', '.pptx', '.odp'}),
+                'images': frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif',
+                                    '.webp', '.svg', '.ico', '.raw', '.cr2', '.nef', '.dng'}),
+                'videos': frozenset({'.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv', '.webm',
+                                    '.m4v', '.3gp', '.mpg', '.mpeg', '.m2v', '.mts'}),
+                'audio': frozenset({'.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a',
+                                   '.opus', '.aiff', '.au', '.ra'}),
+                'archives': frozenset({'.zip', '.rar', '.7z', '.tar', '.gz'})
             },
             'legacy_formats': {
-                'legacy_documents': {'.wps', '.wpd', '.lwp', '.sxw', '.123', '.wk1', 
-                                   '.wk3', '.shw', '.prz', '.mdb', '.dbf'},
-                'legacy_images': {'.pcx', '.tga', '.psd', '.cdr', '.wmf', '.emf', 
-                                 '.pic', '.pict', '.sgi'},
-                'legacy_videos': {'.asf', '.rm', '.rmvb', '.vob', '.dat', '.divx', '.swf'},
-                'legacy_audio': {'.mid', '.midi', '.mod', '.s3m', '.voc', '.cda'},
-                'legacy_archives': {'.arj', '.lzh', '.cab', '.ace', '.sit'}
+                'legacy_documents': frozenset({'.wps', '.wpd', '.lwp', '.sxw', '.123', '.wk1', 
+                                             '.wk3', '.shw', '.prz', '.mdb', '.dbf'}),
+                'legacy_images': frozenset({'.pcx', '.tga', '.psd', '.cdr', '.wmf', '.emf', 
+                                           '.pic', '.pict', '.sgi'}),
+                'legacy_videos': frozenset({'.asf', '.rm', '.rmvb', '.vob', '.dat', '.divx', '.swf'}),
+                'legacy_audio': frozenset({'.mid', '.midi', '.mod', '.s3m', '.voc', '.cda'}),
+                'legacy_archives': frozenset({'.arj', '.lzh', '.cab', '.ace', '.sit'})
             },
-            'skip_extensions': {'.exe', '.msi', '.dll', '.sys', '.bat', '.cmd', '.tmp', '.log'},
-            'skip_folders': {'windows', 'program files', 'system32', 'temp', 'cache'},
+            'skip_extensions': frozenset({'.exe', '.msi', '.dll', '.sys', '.bat', '.cmd', '.tmp', '.log'}),
+            'skip_folders': frozenset({'windows', 'program files', 'system32', 'temp', 'cache'}),
+            'io_workers': IO_WORKERS,
+            # Copy files from o_direct_threshold bytes up with O_DIRECT (Linux)
+            'o_direct': False,
+            'o_direct_threshold': DIRECT_MIN_SIZE,
+            # Skip files whose content matches one already migrated; only
+            # files sharing size and mtime are ever hashed
+            'verify_hash': False,
+            # Print every per-file error to the console, not just a
+            # per-folder summary (the error log always gets them all)
+            'debug': False,
             'size_limits': {
                 'documents': 50 * 1024 * 1024,      # 50MB
                 'legacy_documents': 25 * 1024 * 1024, # 25MB
@@ -72,20 +386,9 @@ class MigrationEngine:
             }
         }
     
-    def _init_stats(self) -> Dict:
+    def _init_stats(self) -> MigrationStats:
         """Initialize statistics tracking."""
-        return {
-            'files_processed': 0,
-            'files_copied': 0,
-            'files_skipped': 0,
-            'modern_files': 0,
-            'legacy_files': 0,
-            'unknown_files': 0,
-            'total_size': 0,
-            'errors': [],
-            'start_time': None,
-            'end_time': None
-        }
+        return MigrationStats()
     
     def _setup_logging(self) -> logging.Logger:
         """Set up logging configuration."""
@@ -98,7 +401,18 @@ class MigrationEngine:
                 '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
             )
             handler.setFormatter(formatter)
-            logger.addHandler(handler)
+            
+            # Format and write on a background thread so the migration loop
+            # never waits on the console; records marked console=False
+            # (per-file errors outside debug mode) are dropped before queueing
+            log_queue = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(log_queue, handler)
+            listener.start()
+            atexit.register(listener.stop)
+            queue_handler = logging.handlers.QueueHandler(log_queue)
+            queue_handler.addFilter(lambda record: getattr(record, 'console', True))
+            logger.addHandler(queue_handler)
+            logger.propagate = False
         
         return logger
     
@@ -110,35 +424,83 @@ class MigrationEngine:
             List of dictionaries containing device information
         """
         devices = []
-        
-        # Check common drive letters on Windows
-        for letter in 'DEFGHIJKLMNOPQRSTUVWXYZ':
-            drive_path = f"{letter}:\\"
-            if os.path.exists(drive_path):
+        letters = self._candidate_drive_letters()
+        
+        # Probe drives concurrently; a drive that doesn't answer in time
+        # (e.g. a stalled mount) is left behind rather than blocking startup.
+        # Daemon threads, unlike executor workers, aren't joined at exit, so
+        # a hung probe can't hold the process open either.
+        if letters:
+            results = queue.SimpleQueue()
+            for letter in letters:
+                threading.Thread(
+                    target=lambda letter=letter: results.put((letter, self._probe_drive(letter))),
+                    name=f"probe-{letter}", daemon=True
+                ).start()
+            
+            probed = {}
+            deadline = time.monotonic() + DRIVE_PROBE_TIMEOUT
+            while len(probed) < len(letters):
                 try:
-                    # Test write access
-                    test_file = os.path.join(drive_path, '.migration_test')
-                    with open(test_file, 'w') as f:
-                        f.write('test')
-                    os.remove(test_file)
-                    
-                    # Get drive information
-                    total, used, free = shutil.disk_usage(drive_path)
-                    
-                    devices.append({
-                        'path': drive_path,
-                        'letter': letter,
-                        'total_gb': total / (1024**3),
-                        'free_gb': free / (1024**3),
-                        'used_gb': used / (1024**3)
-                    })
-                    
-                except (PermissionError, OSError):
-                    continue
+                    letter, device = results.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                probed[letter] = device
+            
+            for letter in letters:
+                if letter not in probed:
+                    self.logger.warning(f"Drive {letter}: did not respond, skipping")
+                elif probed[letter]:
+                    devices.append(probed[letter])
         
         self.logger.info(f"Detected {len(devices)} storage devices")
         return devices
     
+    def _candidate_drive_letters(self) -> List[str]:
+        """
+        Drive letters D-Z worth probing.
+        
+        On Windows one GetLogicalDrives call gives every mounted letter, and
+        only fixed and removable drives are kept; elsewhere, or if the API
+        is unavailable, each letter is checked for existence.
+        """
+        letters = 'DEFGHIJKLMNOPQRSTUVWXYZ'
+        try:
+            kernel32 = ctypes.windll.kernel32
+        except AttributeError:
+            return [letter for letter in letters if os.path.exists(f"{letter}:\\")]
+        
+        mask = kernel32.GetLogicalDrives()
+        return [
+            letter for letter in letters
+            if mask >> (ord(letter) - ord('A')) & 1
+            and kernel32.GetDriveTypeW(f"{letter}:\\") in (DRIVE_REMOVABLE, DRIVE_FIXED)
+        ]
+    
+    def _probe_drive(self, letter: str) -> Optional[Dict]:
+        """Check a drive is writable and report its space, or None if not usable."""
+        drive_path = f"{letter}:\\"
+        try:
+            # Test write access
+            test_file = os.path.join(drive_path, '.migration_test')
+            with open(test_file, 'w') as f:
+                f.write('test')
+            os.remove(test_file)
+            
+            # Get drive information
+            total, used, free = shutil.disk_usage(drive_path)
+            
+            return {
+                'path': drive_path,
+                'letter': letter,
+                'total_gb': total / (1024**3),
+                'free_gb': free / (1024**3),
+                'used_gb': used / (1024**3)
+            }
+        
+        except (PermissionError, OSError):
+            return None
+    
     def categorize_file(self, file_path: str) -> Tuple[Optional[str], str]:
         """
         Categorize file based on extension and content.
@@ -149,21 +511,12 @@ class MigrationEngine:
         Returns:
             Tuple of (category, file_type) where file_type is 'modern', 'legacy', or 'unknown'
         """
-        file_ext = Path(file_path).suffix.lower()
+        file_ext = _suffix(file_path)
         
-        # Skip system files
-        if file_ext in self.config['skip_extensions']:
-            return None, 'system'
-        
-        # Check modern formats
-        for category, extensions in self.config['modern_formats'].items():
-            if file_ext in extensions:
-                return category, 'modern'
-        
-        # Check legacy formats
-        for category, extensions in self.config['legacy_formats'].items():
-            if file_ext in extensions:
-                return category, 'legacy'
+        # System files, then modern, then legacy formats, in one lookup
+        hit = self._ext_index.get(file_ext)
+        if hit:
+            return hit
         
         # Unknown but potentially valuable file
         if file_ext and len(file_ext) <= 5:
@@ -173,8 +526,9 @@ class MigrationEngine:
     
     def should_skip_folder(self, folder_path: str) -> bool:
         """Check if folder should be skipped based on configuration."""
-        folder_lower = folder_path.lower()
-        return any(skip_folder in folder_lower for skip_folder in self.config['skip_folders'])
+        if self._skip_folder_re is None:
+            return False
+        return self._skip_folder_re.search(folder_path.lower()) is not None
     
     def validate_file_size(self, file_path: str, category: str) -> Tuple[bool, int]:
         """
@@ -195,13 +549,40 @@ class MigrationEngine:
             return False, 0
     
     def calculate_file_hash(self, file_path: str) -> Optional[str]:
-        """Calculate MD5 hash of file for integrity verification."""
+        """
+        Calculate a hash of file for integrity verification.
+        
+        Returns:
+            Tagged hex digest such as 's256:<hex>' (see HASH_ALGORITHM and
+            HASH_TAGS), or None if the file could not be read
+        """
         try:
-            hash_md5 = hashlib.md5()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            if blake3 is not None:
+                hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+                hasher.update_mmap(file_path)
+            else:
+                hasher = hashlib.sha256()
+                # Unbuffered: reads go straight into our own buffer
+                with open(file_path, "rb", buffering=0) as f:
+                    size = os.fstat(f.fileno()).st_size
+                    if size <= SINGLE_SHOT_THRESHOLD:
+                        hasher.update(f.read())
+                    elif size <= MMAP_MAX_SIZE:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            if hasattr(mm, 'madvise'):
+                                mm.madvise(mmap.MADV_SEQUENTIAL)
+                            with memoryview(mm) as view:
+                                for offset in range(0, len(mm), MMAP_SLICE):
+                                    hasher.update(view[offset:offset + MMAP_SLICE])
+                    else:
+                        buf = bytearray(HASH_BUFFER_SIZE)
+                        view = memoryview(buf)
+                        while True:
+                            n = f.readinto(buf)
+                            if not n:
+                                break
+                            hasher.update(view[:n])
+            return f"{HASH_TAGS[HASH_ALGORITHM]}:{hasher.hexdigest()}"
         except (OSError, PermissionError) as e:
             self.logger.warning(f"Could not hash file {file_path}: {e}")
             return None
@@ -236,9 +617,18 @@ class MigrationEngine:
             'Unknown_Files'
         ]
         
+        # One mkdir each under the folder just made; a new folder is known to
+        # be empty, so only pre-existing ones are listed for the name index
         for category in categories:
             category_path = os.path.join(backup_path, category)
-            os.makedirs(category_path, exist_ok=True)
+            try:
+                os.mkdir(category_path)
+            except FileExistsError:
+                if not os.path.isdir(category_path):
+                    raise
+                self._dest_names(category_path)
+            else:
+                self._dest_index[category_path] = set()
         
         # Create backup manifest
         self._create_backup_manifest(backup_path)
@@ -246,21 +636,119 @@ class MigrationEngine:
         self.logger.info(f"Created backup structure at {backup_path}")
         return backup_path
     
+    @staticmethod
+    def _dest_label(category: str, file_type: str) -> str:
+        """Backup folder name for a (category, file_type) from categorize_file."""
+        if file_type == 'legacy':
+            return f"Legacy_{category.title()}"
+        elif file_type == 'unknown':
+            return "Unknown_Files"
+        return category.title()
+    
+    def _content_hash(self, file_path: str) -> Optional[str]:
+        """calculate_file_hash, computed at most once per path."""
+        if file_path not in self._seen_by_hash:
+            self._seen_by_hash[file_path] = self.calculate_file_hash(file_path)
+        return self._seen_by_hash[file_path]
+    
+    def _is_duplicate(self, entry: os.DirEntry) -> bool:
+        """
+        Check whether a file's content was already migrated, recording it if not.
+        
+        Files are keyed by (size, mtime_ns) from the scandir stat; content is
+        only hashed when that key collides, so unique files are never read
+        twice.
+        
+        Args:
+            entry: Directory entry of the candidate file
+            
+        Returns:
+            True if an earlier migrated file has identical content
+        """
+        st = entry.stat()
+        seen = self._seen_by_meta.setdefault((st.st_size, st.st_mtime_ns), [])
+        if seen:
+            digest = self._content_hash(entry.path)
+            if digest is not None and any(self._content_hash(path) == digest for path in seen):
+                return True
+        seen.append(entry.path)
+        return False
+    
+    def _forget_migrated(self, entry: os.DirEntry) -> None:
+        """Undo _is_duplicate's record of a file whose copy failed."""
+        st = entry.stat()
+        seen = self._seen_by_meta.get((st.st_size, st.st_mtime_ns))
+        if seen and entry.path in seen:
+            seen.remove(entry.path)
+    
+    def _dest_names(self, dest_folder: str) -> Set[str]:
+        """
+        Names present in a destination folder, listed once and then kept current.
+        
+        Lets migrate_folder detect collisions with a set lookup instead of
+        a stat per file. Names are normcase'd so case-insensitive
+        filesystems collide the same way os.path.exists would.
+        """
+        names = self._dest_index.get(dest_folder)
+        if names is None:
+            try:
+                with os.scandir(dest_folder) as it:
+                    names = {os.path.normcase(entry.name) for entry in it}
+            except OSError:
+                names = set()
+            self._dest_index[dest_folder] = names
+        return names
+    
     def _create_backup_manifest(self, backup_path: str):
         """Create backup manifest with metadata."""
-        manifest = {
-            'created': datetime.now().isoformat(),
-            'backup_type': 'digital_migration',
-            'engine_version': '1.0.0',
-            'configuration': self.config,
-            'source_computer': os.getenv('COMPUTERNAME', 'Unknown'),
-            'user': os.getlogin(),
-            'files': {}
-        }
+        if self._manifest_body is None:
+            # Everything but the per-backup fields, rendered once; the
+            # outer braces are stripped so those fields can be spliced in
+            self._manifest_body = _dumps_indented({
+                'backup_type': 'digital_migration',
+                'engine_version': '1.0.0',
+                'hash_algorithm': HASH_ALGORITHM,
+                'configuration': _jsonable(self.config),
+            })[1:-2]
+        
+        manifest = b''.join((
+            b'{\n  "created": ', _dumps_indented(datetime.now().isoformat()), b',',
+            self._manifest_body,
+            b',\n  "source_computer": ', _dumps_indented(self._host),
+            b',\n  "user": ', _dumps_indented(self._user),
+            b',\n  "files": {}\n}',
+        ))
         
         manifest_path = os.path.join(backup_path, 'backup_manifest.json')
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
+        with open(manifest_path, 'wb') as f:
+            f.write(manifest)
+    
+    def _scan_tree(self, top: str):
+        """
+        Walk a tree top-down like os.walk, yielding DirEntry objects for files.
+        
+        The entries carry the stat data from directory enumeration, so
+        callers get file sizes without a stat per file. Skipped folders are
+        pruned, symlinked directories are not followed, and unreadable
+        directories are ignored, as os.walk does.
+        
+        Yields:
+            Tuple of (directory path, list of non-directory entries)
+        """
+        try:
+            with os.scandir(top) as it:
+                entries = list(it)
+        except OSError:
+            return
+        
+        dirs, files = [], []
+        for entry in entries:
+            (dirs if entry.is_dir() else files).append(entry)
+        yield top, files
+        
+        for entry in dirs:
+            if not entry.is_symlink() and not self.should_skip_folder(entry.path):
+                yield from self._scan_tree(entry.path)
     
     def migrate_folder(self, source: str, destination: str, folder_name: str) -> Dict:
         """
@@ -272,92 +760,153 @@ class MigrationEngine:
             folder_name: Name of folder being processed
             
         Returns:
-            Dictionary with migration statistics
+            Dictionary with migration statistics; errors are counted here
+            and written to ERROR_LOG_NAME in the destination
         """
+        return self._migrate_folder(source, destination, folder_name).to_dict()
+    
+    def _migrate_folder(self, source: str, destination: str, folder_name: str) -> FolderStats:
+        """migrate_folder, returning the counters without converting them."""
+        folder_stats = FolderStats()
+        
         if not os.path.exists(source):
             self.logger.warning(f"Source folder not found: {source}")
-            return {'files_processed': 0, 'files_copied': 0, 'errors': []}
+            return folder_stats
         
         self.logger.info(f"Processing folder: {folder_name}")
         
-        folder_stats = {
-            'files_processed': 0,
-            'files_copied': 0,
-            'files_skipped': 0,
-            'total_size': 0,
-            'categories': {},
-            'errors': []
-        }
-        
+        error_handler = self._attach_error_log(destination)
         try:
-            for root, dirs, files in os.walk(source):
-                # Skip system directories
-                dirs[:] = [d for d in dirs if not self.should_skip_folder(os.path.join(root, d))]
-                
-                # Safety limit
-                if folder_stats['files_processed'] >= self.config['safety_limits']['max_files_per_folder']:
-                    self.logger.warning(f"Reached file limit for {folder_name}")
-                    break
-                
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    folder_stats['files_processed'] += 1
+            self._migrate_tree(source, destination, folder_name, folder_stats)
+        finally:
+            self.logger.removeHandler(error_handler)
+            error_handler.close()
+        
+        if folder_stats.error_count and not self.config.get('debug', False):
+            self.logger.error(f"{folder_stats.error_count} errors in {folder_name}, see "
+                              f"{os.path.join(destination, ERROR_LOG_NAME)}")
+        
+        self.logger.info(f"Completed {folder_name}: {folder_stats.files_copied} files copied, "
+                        f"{folder_stats.total_size / (1024**2):.1f} MB")
+        
+        return folder_stats
+    
+    def _attach_error_log(self, destination: str) -> logging.Handler:
+        """Route error records that carry a 'file' to the destination's error log."""
+        handler = logging.FileHandler(os.path.join(destination, ERROR_LOG_NAME),
+                                      encoding='utf-8', delay=True)
+        handler.setLevel(logging.ERROR)
+        handler.addFilter(lambda record: hasattr(record, 'file'))
+        handler.setFormatter(_ErrorLineFormatter())
+        self.logger.addHandler(handler)
+        return handler
+    
+    def _log_error(self, folder_stats: FolderStats, error_msg: str, file_path: str, error: Exception):
+        """Count an error and log it to the error log, and to the console in debug mode."""
+        folder_stats.error_count += 1
+        self.logger.error(error_msg, extra={'file': file_path, 'err': str(error),
+                                            'console': self.config.get('debug', False)})
+    
+    def _migrate_tree(self, source: str, destination: str, folder_name: str, folder_stats: FolderStats):
+        """Walk, filter and copy one source folder, updating folder_stats in place."""
+        size_limits = self.config['size_limits']
+        progress_interval = self.config['safety_limits']['progress_update_interval']
+        verify_hash = self.config.get('verify_hash', False)
+        direct_threshold = (self.config.get('o_direct_threshold', DIRECT_MIN_SIZE)
+                            if self.config.get('o_direct', False) else None)
+        
+        # Files are filtered and assigned destinations here, in walk order;
+        # only the copies run on the pool. Destination names are claimed in
+        # the index up front so two same-named sources never race for one file.
+        pending = []
+        folder_error = None
+        # Destination label -> (folder path with trailing separator, name index)
+        targets: Dict[str, Tuple[str, Set[str]]] = {}
+        
+        with ThreadPoolExecutor(max_workers=self.config.get('io_workers', IO_WORKERS)) as pool:
+            try:
+                # System directories are pruned by _scan_tree
+                for root, files in self._scan_tree(source):
+                    # Safety limit
+                    if folder_stats.files_processed >= self.config['safety_limits']['max_files_per_folder']:
+                        self.logger.warning(f"Reached file limit for {folder_name}")
+                        break
                     
-                    try:
-                        # Categorize file
-                        category, file_type = self.categorize_file(file_path)
+                    for entry in files:
+                        file = entry.name
+                        file_path = entry.path
+                        folder_stats.files_processed += 1
                         
-                        if not category:
-                            folder_stats['files_skipped'] += 1
-                            continue
-                        
-                        # Validate file size
-                        size_valid, file_size = self.validate_file_size(file_path, category)
-                        if not size_valid:
-                            folder_stats['files_skipped'] += 1
-                            continue
-                        
-                        # Determine destination folder
-                        if file_type == 'legacy':
-                            dest_category = f"Legacy_{category.title()}"
-                        elif file_type == 'unknown':
-                            dest_category = "Unknown_Files"
-                        else:
-                            dest_category = category.title()
-                        
-                        # Copy file
-                        filename = os.path.basename(file_path)
-                        dest_folder = os.path.join(destination, dest_category)
-                        dest_file = os.path.join(dest_folder, filename)
-                        
-                        if not os.path.exists(dest_file):
-                            shutil.copy2(file_path, dest_file)
+                        try:
+                            # Categorize file
+                            category, file_type = self.categorize_file(file_path)
                             
-                            # Update statistics
-                            folder_stats['files_copied'] += 1
-                            folder_stats['total_size'] += file_size
-                            folder_stats['categories'][dest_category] = folder_stats['categories'].get(dest_category, 0) + 1
+                            if not category:
+                                folder_stats.files_skipped += 1
+                                continue
                             
-                            # Progress update
-                            if folder_stats['files_copied'] % self.config['safety_limits']['progress_update_interval'] == 0:
-                                self.logger.info(f"  Copied {folder_stats['files_copied']} files from {folder_name}")
-                        else:
-                            folder_stats['files_skipped'] += 1
-                    
-                    except Exception as e:
-                        error_msg = f"Error processing {file}: {str(e)}"
-                        folder_stats['errors'].append(error_msg)
-                        self.logger.error(error_msg)
-        
-        except Exception as e:
-            error_msg = f"Error processing folder {folder_name}: {str(e)}"
-            folder_stats['errors'].append(error_msg)
-            self.logger.error(error_msg)
-        
-        self.logger.info(f"Completed {folder_name}: {folder_stats['files_copied']} files copied, "
-                        f"{folder_stats['total_size'] / (1024**2):.1f} MB")
+                            # Validate file size, from the stat cached by scandir
+                            try:
+                                file_size = entry.stat().st_size
+                            except OSError:
+                                folder_stats.files_skipped += 1
+                                continue
+                            if file_size > size_limits.get(category, size_limits['unknown']):
+                                folder_stats.files_skipped += 1
+                                continue
+                            
+                            # Determine destination folder
+                            dest_category = self._dest_labels.get((category, file_type))
+                            if dest_category is None:
+                                dest_category = self._dest_label(category, file_type)
+                            target = targets.get(dest_category)
+                            if target is None:
+                                dest_folder = os.path.join(destination, dest_category)
+                                target = targets[dest_category] = (
+                                    os.path.join(dest_folder, ''), self._dest_names(dest_folder)
+                                )
+                            dest_prefix, dest_names = target
+                            
+                            # Copy file
+                            name_key = os.path.normcase(file)
+                            if name_key in dest_names or (verify_hash and self._is_duplicate(entry)):
+                                folder_stats.files_skipped += 1
+                            else:
+                                dest_names.add(name_key)
+                                direct = direct_threshold is not None and file_size >= direct_threshold
+                                future = pool.submit(_fast_copy, file_path, dest_prefix + file, file_size, direct)
+                                pending.append((future, entry, file_size, dest_category, dest_names, name_key))
+                        
+                        except Exception as e:
+                            self._log_error(folder_stats, f"Error processing {file}: {str(e)}", file_path, e)
+            
+            except Exception as e:
+                folder_error = e
+            
+            # Merge copy results in walk order
+            for future, entry, file_size, dest_category, dest_names, name_key in pending:
+                try:
+                    future.result()
+                except Exception as e:
+                    # Not copied, so a later migration may try this name and content again
+                    dest_names.discard(name_key)
+                    if verify_hash:
+                        self._forget_migrated(entry)
+                    self._log_error(folder_stats, f"Error processing {entry.name}: {str(e)}", entry.path, e)
+                    continue
+                
+                # Update statistics
+                folder_stats.files_copied += 1
+                folder_stats.total_size += file_size
+                folder_stats.categories[dest_category] += 1
+                
+                # Progress update
+                if folder_stats.files_copied % progress_interval == 0:
+                    self.logger.info(f"  Copied {folder_stats.files_copied} files from {folder_name}")
         
-        return folder_stats
+        if folder_error:
+            self._log_error(folder_stats, f"Error processing folder {folder_name}: {str(folder_error)}",
+                            source, folder_error)
     
     def run_migration(self, source_folders: Dict[str, str], destination: str, 
                      backup_name: str = None) -> Dict:
@@ -372,7 +921,7 @@ class MigrationEngine:
         Returns:
             Complete migration statistics
         """
-        self.stats['start_time'] = time.time()
+        self.stats.start_time = time.time()
         self.logger.info("Starting migration process")
         
         # Create backup structure
@@ -381,17 +930,13 @@ class MigrationEngine:
         # Process each source folder
         all_folder_stats = {}
         for folder_name, folder_path in source_folders.items():
-            folder_stats = self.migrate_folder(folder_path, backup_path, folder_name)
+            folder_stats = self._migrate_folder(folder_path, backup_path, folder_name)
             all_folder_stats[folder_name] = folder_stats
             
             # Update global statistics
-            self.stats['files_processed'] += folder_stats['files_processed']
-            self.stats['files_copied'] += folder_stats['files_copied']
-            self.stats['files_skipped'] += folder_stats['files_skipped']
-            self.stats['total_size'] += folder_stats['total_size']
-            self.stats['errors'].extend(folder_stats['errors'])
+            self.stats.add(folder_stats)
         
-        self.stats['end_time'] = time.time()
+        self.stats.end_time = time.time()
         
         # Generate final report
         report = self._generate_migration_report(backup_path, all_folder_stats)
@@ -399,29 +944,32 @@ class MigrationEngine:
         self.logger.info("Migration process completed")
         return report
     
-    def _generate_migration_report(self, backup_path: str, folder_stats: Dict) -> Dict:
+    def _generate_migration_report(self, backup_path: str,
+                                   folder_stats: Dict[str, FolderStats]) -> Dict:
         """Generate comprehensive migration report."""
-        duration = self.stats['end_time'] - self.stats['start_time']
+        stats = self.stats
+        duration = stats.end_time - stats.start_time
         
         report = {
             'backup_location': backup_path,
             'migration_summary': {
-                'total_files_processed': self.stats['files_processed'],
-                'total_files_copied': self.stats['files_copied'],
-                'total_files_skipped': self.stats['files_skipped'],
-                'total_size_gb': self.stats['total_size'] / (1024**3),
+                'total_files_processed': stats.files_processed,
+                'total_files_copied': stats.files_copied,
+                'total_files_skipped': stats.files_skipped,
+                'total_size_gb': stats.total_size / (1024**3),
                 'duration_minutes': duration / 60,
-                'success_rate': (self.stats['files_copied'] / max(self.stats['files_processed'], 1)) * 100
+                'success_rate': (stats.files_copied / max(stats.files_processed, 1)) * 100
             },
-            'folder_breakdown': folder_stats,
-            'errors': self.stats['errors'],
+            'folder_breakdown': {name: fs.to_dict() for name, fs in folder_stats.items()},
+            'error_count': stats.error_count,
+            'error_log': os.path.join(backup_path, ERROR_LOG_NAME) if stats.error_count else None,
             'timestamp': datetime.now().isoformat()
         }
         
         # Save report
         report_path = os.path.join(backup_path, 'migration_report.json')
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        with open(report_path, 'wb') as f:
+            f.write(_dumps_indented(report))
         
         return report
 
@@ -11,17 +11,28 @@ import smtplib
 import threading
 import queue
 import time
+import functools
+import copy
 import json
 import logging
+import operator
+import re
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable, Any
+from collections import defaultdict
+from typing import Dict, List, Optional, Callable, Any, Tuple
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from abc import ABC, abstractmethod
-import hashlib
-import random
+import secrets
+
+try:
+    import redis
+except ImportError:  # optional; only RedisQueue needs it
+    redis = None
 
 
 # Configure logging
@@ -31,6 +42,86 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Socket timeout for SMTP sessions, in seconds
+SMTP_TIMEOUT = 30
+# A session left unused this long is replaced rather than probed
+SMTP_IDLE_TIMEOUT = 60
+# Concurrent SMTP sessions per sender, and worker threads sending through them
+SMTP_POOL_SIZE = 4
+# Most notifications the worker takes into one delivery round
+NOTIFICATION_BATCH_SIZE = 50
+
+# Applied to every SQLite connection. With the WAL journal (set once, it is
+# stored in the database file) readers run alongside the single writer, and
+# synchronous=NORMAL only fsyncs at checkpoints rather than on every commit.
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",   # 256MB
+    "PRAGMA cache_size=-64000",     # 64MB
+    "PRAGMA busy_timeout=5000",
+)
+# Open SQLite connections kept per database, shared by all threads
+SQLITE_POOL_SIZE = 8
+# Most due notifications the worker loads from the database per pass
+READY_QUERY_LIMIT = 500
+# Audit events are buffered and written together once this many are
+# waiting or the oldest is this many seconds old
+AUDIT_FLUSH_SIZE = 100
+AUDIT_FLUSH_INTERVAL = 1.0
+# Rows archived per transaction by cleanup_old_notifications
+CLEANUP_BATCH_SIZE = 1000
+
+# Notifications table; created_at, sent_at and next_retry hold UTC epoch
+# seconds, and version goes up by one on every write to the row
+NOTIFICATIONS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id TEXT PRIMARY KEY,
+        level TEXT NOT NULL,
+        subject TEXT NOT NULL,
+        body TEXT NOT NULL,
+        recipients TEXT NOT NULL,
+        status TEXT NOT NULL,
+        created_at INTEGER NOT NULL,
+        sent_at INTEGER,
+        retry_count INTEGER DEFAULT 0,
+        max_retries INTEGER DEFAULT 3,
+        next_retry INTEGER,
+        error_message TEXT,
+        metadata TEXT,
+        version INTEGER NOT NULL DEFAULT 0
+    )
+"""
+# Reference point for those epoch seconds
+_EPOCH = datetime(1970, 1, 1)
+
+# A {{variable}} placeholder in a notification template
+TEMPLATE_PLACEHOLDER = re.compile(r"\{\{(.*?)\}\}")
+
+# Joins a notification's recipients in the database; the ASCII unit
+# separator cannot occur in an email address
+RECIPIENT_SEPARATOR = "\x1f"
+
+# Longest a RedisQueue.get blocks, so a stopping worker notices promptly
+REDIS_BLOCK_LIMIT = 1.0
+
+# Rendered messages kept for retries and repeated alerts
+MESSAGE_CACHE_SIZE = 256
+# Distinct events whose matching rules AlertRuleManager remembers
+RULE_EVAL_CACHE_SIZE = 1024
+# Serialized notifications NotificationSystem.get_notification remembers
+NOTIFICATION_CACHE_SIZE = 1024
+
+# Comparisons allowed in AlertRule.threshold
+THRESHOLD_OPERATORS = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
 
 class NotificationLevel(Enum):
     """Notification severity levels"""
@@ -68,32 +159,47 @@ class NotificationTemplate:
     variables: List[str] = field(default_factory=list)
     
     def render(self, context: Dict[str, Any]) -> tuple[str, str]:
-        """Render template with context variables"""
-        subject = self.subject
-        body = self.body
+        """Render template with context variables, in one pass over each string"""
+        values = {var: str(value) for var, value in context.items()}
         
-        for var, value in context.items():
-            placeholder = f"{{{{{var}}}}}"
-            subject = subject.replace(placeholder, str(value))
-            body = body.replace(placeholder, str(value))
+        def substitute(match: re.Match) -> str:
+            # Placeholders without a context value are left as they are
+            return values.get(match.group(1), match.group(0))
         
-        return subject, body
+        return (TEMPLATE_PLACEHOLDER.sub(substitute, self.subject),
+                TEMPLATE_PLACEHOLDER.sub(substitute, self.body))
 
 
 @dataclass
 class AlertRule:
-    """Rule for triggering alerts"""
+    """
+    Rule for triggering alerts.
+    
+    event_type limits the rule to events with that 'event_type', so other
+    events never evaluate it. threshold, a (field, operator, value) tuple
+    such as ('value', '>', 85), is compared directly instead of calling
+    condition; condition may then be None.
+    """
     name: str
     rule_type: AlertRuleType
-    condition: Callable[[Dict[str, Any]], bool]
+    condition: Optional[Callable[[Dict[str, Any]], bool]]
     notification_level: NotificationLevel
     recipients: List[str]
     enabled: bool = True
     description: str = ""
+    event_type: str = ""
+    threshold: Optional[Tuple[str, str, float]] = None
+    
+    def __post_init__(self):
+        self._compare = THRESHOLD_OPERATORS[self.threshold[1]] if self.threshold else None
     
     def matches(self, event_data: Dict[str, Any]) -> bool:
         """Check if event matches rule condition"""
         try:
+            if self._compare is not None:
+                field_name, _, limit = self.threshold
+                value = event_data.get(field_name)
+                return value is not None and self._compare(float(value), limit)
             return self.condition(event_data)
         except Exception as e:
             logger.error(f"Error evaluating rule '{self.name}': {e}")
@@ -126,6 +232,17 @@ class Notification:
         data['sent_at'] = self.sent_at.isoformat() if self.sent_at else None
         data['next_retry'] = self.next_retry.isoformat() if self.next_retry else None
         return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Notification':
+        """Build a notification from to_dict() output"""
+        data = dict(data)
+        data['level'] = NotificationLevel(data['level'])
+        data['status'] = NotificationStatus(data['status'])
+        data['created_at'] = datetime.fromisoformat(data['created_at'])
+        for key in ('sent_at', 'next_retry'):
+            data[key] = datetime.fromisoformat(data[key]) if data.get(key) else None
+        return cls(**data)
 
 
 class NotificationDatabase:
@@ -133,35 +250,65 @@ class NotificationDatabase:
     
     def __init__(self, db_path: str = "notifications.db"):
         self.db_path = db_path
-        self.lock = threading.Lock()
+        # Configured connections reused across calls and threads, opened on
+        # first checkout (None marks a slot not yet connected)
+        self._pool: queue.LifoQueue = queue.LifoQueue()
+        for _ in range(SQLITE_POOL_SIZE):
+            self._pool.put(None)
+        # Audit rows not yet written, and when the first of them was added
+        self._audit_buffer: List[tuple] = []
+        self._audit_since = 0.0
+        self._audit_lock = threading.Lock()
         self._init_database()
     
+    @staticmethod
+    def _configure(conn: sqlite3.Connection):
+        """Apply the per-connection pragmas"""
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a configured connection to the database"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._configure(conn)
+        return conn
+    
+    @contextmanager
+    def _conn(self):
+        """Check out a pooled connection; its transaction commits on success and rolls back on error"""
+        conn = self._pool.get()
+        try:
+            if conn is None:
+                conn = self._connect()
+            with conn:
+                yield conn
+        finally:
+            self._pool.put(conn)
+    
+    def close(self):
+        """Write buffered audit events and close idle pooled connections"""
+        self.flush_audit_events()
+        idle = []
+        while True:
+            try:
+                idle.append(self._pool.get_nowait())
+            except queue.Empty:
+                break
+        for conn in idle:
+            if conn is not None:
+                conn.close()
+            self._pool.put(None)
+    
     def _init_database(self):
         """Initialize database schema"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
             cursor = conn.cursor()
             
-            # Notifications table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS notifications (
-                    id TEXT PRIMARY KEY,
-                    level TEXT NOT NULL,
-                    subject TEXT NOT NULL,
-                    body TEXT NOT NULL,
-                    recipients TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    sent_at TEXT,
-                    retry_count INTEGER DEFAULT 0,
-                    max_retries INTEGER DEFAULT 3,
-                    next_retry TEXT,
-                    error_message TEXT,
-                    metadata TEXT,
-                    INDEX idx_status (status),
-                    INDEX idx_created_at (created_at),
-                    INDEX idx_level (level)
-                )
-            """)
+            # Notifications table; times are Unix epoch seconds (UTC)
+            cursor.execute(NOTIFICATIONS_TABLE_SQL.format(table="notifications"))
+            self._migrate_timestamps(cursor)
+            self._migrate_version(cursor)
             
             # Alert rules table
             cursor.execute("""
@@ -174,8 +321,7 @@ class NotificationDatabase:
                     recipients TEXT NOT NULL,
                     notification_level TEXT NOT NULL,
                     condition_json TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    INDEX idx_enabled (enabled)
+                    created_at TEXT NOT NULL
                 )
             """)
             
@@ -191,37 +337,103 @@ class NotificationDatabase:
                 )
             """)
             
+            # Indexes; status + created_at serves the pending scan and the
+            # per-status listings, which filter on status and sort by time
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_notif_status_created
+                ON notifications(status, created_at)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_notif_ready
+                ON notifications(next_retry) WHERE status IN ('PENDING', 'RETRYING')
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_notif_created_at
+                ON notifications(created_at)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_notif_level
+                ON notifications(level)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_rules_enabled
+                ON alert_rules(enabled)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_audit_notif
+                ON notification_audit(notification_id)
+            """)
+            
             conn.commit()
     
+    @staticmethod
+    def _migrate_timestamps(cursor: sqlite3.Cursor):
+        """Rebuild a notifications table created with ISO text times to hold epoch seconds"""
+        columns = {row[1]: row[2] for row in cursor.execute("PRAGMA table_info(notifications)")}
+        if columns.get('created_at', '').upper() != 'TEXT':
+            return
+        
+        # A TEXT column would store the integers back as text, so copy into
+        # a new table and swap it in
+        cursor.execute(NOTIFICATIONS_TABLE_SQL.format(table="notifications_new"))
+        cursor.execute("""
+            INSERT INTO notifications_new
+            (id, level, subject, body, recipients, status, created_at,
+             sent_at, retry_count, max_retries, next_retry, error_message, metadata)
+            SELECT id, level, subject, body, recipients, status,
+                   CAST(strftime('%s', created_at) AS INTEGER),
+                   CAST(strftime('%s', sent_at) AS INTEGER),
+                   retry_count, max_retries,
+                   CAST(strftime('%s', next_retry) AS INTEGER),
+                   error_message, metadata
+            FROM notifications
+        """)
+        cursor.execute("DROP TABLE notifications")
+        cursor.execute("ALTER TABLE notifications_new RENAME TO notifications")
+        logger.info("Converted notification timestamps to epoch seconds")
+    
+    @staticmethod
+    def _migrate_version(cursor: sqlite3.Cursor):
+        """Add the version column to a notifications table created without it"""
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(notifications)")}
+        if 'version' not in columns:
+            cursor.execute("ALTER TABLE notifications ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+    
     def save_notification(self, notification: Notification) -> bool:
         """Save notification to database"""
+        return self.save_notifications([notification])
+    
+    def save_notifications(self, notifications: List[Notification]) -> bool:
+        """Save several notifications in one transaction, with a single commit"""
         try:
-            with self.lock:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO notifications
-                        (id, level, subject, body, recipients, status, created_at, 
-                         sent_at, retry_count, max_retries, next_retry, error_message, metadata)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        notification.id,
-                        notification.level.value,
-                        notification.subject,
-                        notification.body,
-                        json.dumps(notification.recipients),
-                        notification.status.value,
-                        notification.created_at.isoformat(),
-                        notification.sent_at.isoformat() if notification.sent_at else None,
-                        notification.retry_count,
-                        notification.max_retries,
-                        notification.next_retry.isoformat() if notification.next_retry else None,
-                        notification.error_message,
-                        json.dumps(notification.metadata)
-                    ))
-                    
-                    conn.commit()
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO notifications
+                    (id, level, subject, body, recipients, status, created_at, 
+                     sent_at, retry_count, max_retries, next_retry, error_message, metadata,
+                     version)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+                            COALESCE((SELECT version FROM notifications WHERE id = ?), 0) + 1)
+                """, [(
+                    notification.id,
+                    notification.level.value,
+                    notification.subject,
+                    notification.body,
+                    RECIPIENT_SEPARATOR.join(notification.recipients),
+                    notification.status.value,
+                    self._to_epoch(notification.created_at),
+                    self._to_epoch(notification.sent_at),
+                    notification.retry_count,
+                    notification.max_retries,
+                    self._to_epoch(notification.next_retry),
+                    notification.error_message,
+                    json.dumps(notification.metadata),
+                    notification.id
+                ) for notification in notifications])
+                
+                conn.commit()
             return True
         except Exception as e:
             logger.error(f"Error saving notification: {e}")
@@ -230,54 +442,143 @@ class NotificationDatabase:
     def get_notification(self, notification_id: str) -> Optional[Notification]:
         """Retrieve notification from database"""
         try:
-            with self.lock:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT * FROM notifications WHERE id = ?", (notification_id,))
-                    row = cursor.fetchone()
-                    
-                    if row:
-                        return self._row_to_notification(row)
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT * FROM notifications WHERE id = ?", (notification_id,))
+                row = cursor.fetchone()
+                
+                if row:
+                    return self._row_to_notification(row)
         except Exception as e:
             logger.error(f"Error retrieving notification: {e}")
         
         return None
     
+    def get_notification_version(self, notification_id: str) -> Optional[int]:
+        """Get a notification's version, which changes whenever it is written; None if not found"""
+        try:
+            with self._conn() as conn:
+                row = conn.execute("SELECT version FROM notifications WHERE id = ?",
+                                   (notification_id,)).fetchone()
+                if row:
+                    return row[0]
+        except Exception as e:
+            logger.error(f"Error retrieving notification version: {e}")
+        
+        return None
+    
     def get_pending_notifications(self) -> List[Notification]:
         """Get pending and retrying notifications"""
         try:
-            with self.lock:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        SELECT * FROM notifications 
-                        WHERE status IN (?, ?) 
-                        ORDER BY created_at ASC
-                    """, (NotificationStatus.PENDING.value, NotificationStatus.RETRYING.value))
-                    
-                    rows = cursor.fetchall()
-                    return [self._row_to_notification(row) for row in rows]
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT * FROM notifications 
+                    WHERE status IN (?, ?) 
+                    ORDER BY created_at ASC
+                """, (NotificationStatus.PENDING.value, NotificationStatus.RETRYING.value))
+                
+                rows = cursor.fetchall()
+                return [self._row_to_notification(row) for row in rows]
         except Exception as e:
             logger.error(f"Error retrieving pending notifications: {e}")
         
         return []
     
+    def get_ready_notifications(self, now: Optional[datetime] = None,
+                                limit: int = READY_QUERY_LIMIT) -> List[Notification]:
+        """Get pending and retrying notifications whose retry time has arrived by now (default: utcnow)"""
+        try:
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT * FROM notifications 
+                    WHERE status IN (?, ?) 
+                      AND (next_retry IS NULL OR next_retry <= ?)
+                    ORDER BY created_at ASC
+                    LIMIT ?
+                """, (NotificationStatus.PENDING.value, NotificationStatus.RETRYING.value,
+                      self._to_epoch(now or datetime.utcnow()), limit))
+                
+                rows = cursor.fetchall()
+                return [self._row_to_notification(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Error retrieving ready notifications: {e}")
+        
+        return []
+    
+    def get_next_retry_time(self) -> Optional[datetime]:
+        """Get the earliest retry time scheduled for a pending or retrying notification"""
+        try:
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT MIN(next_retry) FROM notifications 
+                    WHERE status IN (?, ?) AND next_retry IS NOT NULL
+                """, (NotificationStatus.PENDING.value, NotificationStatus.RETRYING.value))
+                
+                row = cursor.fetchone()
+                if row and row[0] is not None:
+                    return self._from_epoch(row[0])
+        except Exception as e:
+            logger.error(f"Error retrieving next retry time: {e}")
+        
+        return None
+    
     def get_notifications_by_status(self, status: NotificationStatus, 
                                     limit: int = 100) -> List[Notification]:
         """Get notifications by status"""
         try:
-            with self.lock:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        SELECT * FROM notifications 
-                        WHERE status = ? 
-                        ORDER BY created_at DESC 
-                        LIMIT ?
-                    """, (status.value, limit))
-                    
-                    rows = cursor.fetchall()
-                    return [self._row_to_notification(row) for row in rows]
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT * FROM notifications 
+                    WHERE status = ? 
+                    ORDER BY created_at DESC 
+                    LIMIT ?
+                """, (status.value, limit))
+                
+                rows = cursor.fetchall()
+                return [self._row_to_notification(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Error retrieving notifications by status: {e}")
+        
+        return []
+    
+    def get_notifications_by_status_as_dicts(self, status: NotificationStatus,
+                                             limit: int = 100) -> List[Dict]:
+        """Get notifications by status as Notification.to_dict() dicts, without building Notifications"""
+        try:
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT id, level, subject, body, recipients, status,
+                           strftime('%Y-%m-%dT%H:%M:%S', created_at, 'unixepoch'),
+                           strftime('%Y-%m-%dT%H:%M:%S', sent_at, 'unixepoch'),
+                           retry_count, max_retries,
+                           strftime('%Y-%m-%dT%H:%M:%S', next_retry, 'unixepoch'),
+                           error_message, metadata
+                    FROM notifications 
+                    WHERE status = ? 
+                    ORDER BY created_at DESC 
+                    LIMIT ?
+                """, (status.value, limit))
+                
+                return [{
+                    'id': row[0],
+                    'level': row[1],
+                    'subject': row[2],
+                    'body': row[3],
+                    'recipients': self._split_recipients(row[4]),
+                    'status': row[5],
+                    'created_at': row[6],
+                    'sent_at': row[7],
+                    'retry_count': row[8],
+                    'max_retries': row[9],
+                    'next_retry': row[10],
+                    'error_message': row[11],
+                    'metadata': json.loads(row[12]) if row[12] else {}
+                } for row in cursor]
         except Exception as e:
             logger.error(f"Error retrieving notifications by status: {e}")
         
@@ -285,27 +586,66 @@ class NotificationDatabase:
     
     def log_audit_event(self, notification_id: str, event: str, 
                        details: Optional[Dict] = None) -> bool:
-        """Log audit event for notification"""
+        """Log audit event for notification; buffered, see flush_audit_events"""
+        row = (
+            notification_id,
+            event,
+            datetime.utcnow().isoformat(),
+            json.dumps(details) if details else None
+        )
+        with self._audit_lock:
+            if not self._audit_buffer:
+                self._audit_since = time.monotonic()
+            self._audit_buffer.append(row)
+            due = (len(self._audit_buffer) >= AUDIT_FLUSH_SIZE
+                   or time.monotonic() - self._audit_since >= AUDIT_FLUSH_INTERVAL)
+        
+        return self.flush_audit_events() if due else True
+    
+    def flush_audit_events(self) -> bool:
+        """Write buffered audit events in one transaction"""
+        with self._audit_lock:
+            rows, self._audit_buffer = self._audit_buffer, []
+        if not rows:
+            return True
+        
         try:
-            with self.lock:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        INSERT INTO notification_audit
-                        (notification_id, event, timestamp, details)
-                        VALUES (?, ?, ?, ?)
-                    """, (
-                        notification_id,
-                        event,
-                        datetime.utcnow().isoformat(),
-                        json.dumps(details) if details else None
-                    ))
-                    conn.commit()
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                cursor.executemany("""
+                    INSERT INTO notification_audit
+                    (notification_id, event, timestamp, details)
+                    VALUES (?, ?, ?, ?)
+                """, rows)
+                conn.commit()
             return True
         except Exception as e:
             logger.error(f"Error logging audit event: {e}")
             return False
     
+    @staticmethod
+    def _split_recipients(text: str) -> List[str]:
+        """Recipients column to a list; rows written before the separator format hold JSON"""
+        if not text:
+            return []
+        if text[0] == '[':
+            return json.loads(text)
+        return text.split(RECIPIENT_SEPARATOR)
+    
+    @staticmethod
+    def _to_epoch(value: Optional[datetime]) -> Optional[int]:
+        """Naive UTC datetime to whole epoch seconds"""
+        if value is None:
+            return None
+        return (value - _EPOCH) // timedelta(seconds=1)
+    
+    @staticmethod
+    def _from_epoch(value: Optional[int]) -> Optional[datetime]:
+        """Epoch seconds to a naive UTC datetime"""
+        if value is None:
+            return None
+        return _EPOCH + timedelta(seconds=value)
+    
     @staticmethod
     def _row_to_notification(row: tuple) -> Notification:
         """Convert database row to Notification object"""
@@ -314,88 +654,207 @@ class NotificationDatabase:
             level=NotificationLevel(row[1]),
             subject=row[2],
             body=row[3],
-            recipients=json.loads(row[4]),
+            recipients=NotificationDatabase._split_recipients(row[4]),
             status=NotificationStatus(row[5]),
-            created_at=datetime.fromisoformat(row[6]),
-            sent_at=datetime.fromisoformat(row[7]) if row[7] else None,
+            created_at=NotificationDatabase._from_epoch(row[6]),
+            sent_at=NotificationDatabase._from_epoch(row[7]),
             retry_count=row[8],
             max_retries=row[9],
-            next_retry=datetime.fromisoformat(row[10]) if row[10] else None,
+            next_retry=NotificationDatabase._from_epoch(row[10]),
             error_message=row[11],
             metadata=json.loads(row[12]) if row[12] else {}
         )
     
     def cleanup_old_notifications(self, days: int = 30) -> int:
         """Archive and remove old notifications"""
+        archived = 0
         try:
-            cutoff_date = (datetime.utcnow() - timedelta(days=days)).isoformat()
+            cutoff_date = self._to_epoch(datetime.utcnow() - timedelta(days=days))
             
-            with self.lock:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    # Archive old notifications
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                
+                # Archive old notifications a batch per transaction, so
+                # other writers get the database between batches
+                while True:
                     cursor.execute("""
                         UPDATE notifications 
-                        SET status = ? 
-                        WHERE created_at < ? AND status = ?
-                    """, (NotificationStatus.ARCHIVED.value, cutoff_date, 
-                          NotificationStatus.SENT.value))
-                    
+                        SET status = ?, version = version + 1 
+                        WHERE id IN (
+                            SELECT id FROM notifications 
+                            WHERE status = ? AND created_at < ? 
+                            ORDER BY created_at 
+                            LIMIT ?
+                        )
+                    """, (NotificationStatus.ARCHIVED.value, NotificationStatus.SENT.value,
+                          cutoff_date, CLEANUP_BATCH_SIZE))
                     conn.commit()
-                    return cursor.rowcount
+                    
+                    if cursor.rowcount <= 0:
+                        break
+                    archived += cursor.rowcount
         except Exception as e:
             logger.error(f"Error cleaning up old notifications: {e}")
         
-        return 0
+        return archived
+
+
+@functools.lru_cache(maxsize=MESSAGE_CACHE_SIZE)
+def build_message(from_address: str, to_addresses: Tuple[str, ...], subject: str, body: str,
+                  is_html: bool = True) -> bytes:
+    """Render an email to wire format; cached, so a retried notification is not re-encoded"""
+    msg = MIMEMultipart('alternative')
+    msg['Subject'] = subject
+    msg['From'] = from_address
+    msg['To'] = ', '.join(to_addresses)
+    
+    # Attach body
+    mime_type = 'html' if is_html else 'plain'
+    msg.attach(MIMEText(body, mime_type))
+    return msg.as_bytes()
+
+
+class SMTPConnectionPool:
+    """Bounded pool of authenticated SMTP sessions shared by sending threads"""
+    
+    def __init__(self, smtp_host: str, smtp_port: int, username: str, password: str,
+                 use_tls: bool = True, size: int = SMTP_POOL_SIZE):
+        self.smtp_host = smtp_host
+        self.smtp_port = smtp_port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.size = size
+        # One slot per allowed session as (session or None, last used);
+        # sessions are opened on first checkout. LIFO keeps reusing the
+        # warmest session and lets surplus ones go idle and expire.
+        self._slots: queue.LifoQueue = queue.LifoQueue()
+        for _ in range(size):
+            self._slots.put((None, 0.0))
+    
+    def connect(self) -> smtplib.SMTP:
+        """Open a new authenticated session"""
+        conn = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=SMTP_TIMEOUT)
+        try:
+            if self.use_tls:
+                conn.starttls()
+            conn.login(self.username, self.password)
+        except Exception:
+            conn.close()
+            raise
+        return conn
+    
+    def get(self) -> smtplib.SMTP:
+        """Check out a live session, blocking while all slots are in use"""
+        conn, last_used = self._slots.get()
+        try:
+            if conn is not None:
+                if time.monotonic() - last_used <= SMTP_IDLE_TIMEOUT:
+                    try:
+                        if conn.noop()[0] == 250:
+                            return conn
+                    except (smtplib.SMTPException, OSError):
+                        pass
+                self._quit(conn)
+            return self.connect()
+        except Exception:
+            self._slots.put((None, 0.0))
+            raise
+    
+    def put(self, conn: Optional[smtplib.SMTP]):
+        """Return a session checked out with get(); None frees the slot"""
+        self._slots.put((conn, time.monotonic()))
+    
+    def close(self):
+        """Close idle sessions; sessions still checked out are left to their users"""
+        idle = []
+        while True:
+            try:
+                idle.append(self._slots.get_nowait())
+            except queue.Empty:
+                break
+        for conn, _ in idle:
+            if conn is not None:
+                self._quit(conn)
+            self._slots.put((None, 0.0))
+    
+    @staticmethod
+    def _quit(conn: smtplib.SMTP):
+        """End a session, politely if the server is still there"""
+        try:
+            conn.quit()
+        except (smtplib.SMTPException, OSError):
+            conn.close()
 
 
 class SMTPEmailSender:
     """SMTP email sender for notifications"""
     
     def __init__(self, smtp_host: str, smtp_port: int, username: str, password: str,
-                 use_tls: bool = True, from_address: str = None):
+                 use_tls: bool = True, from_address: str = None,
+                 pool_size: int = SMTP_POOL_SIZE):
         self.smtp_host = smtp_host
         self.smtp_port = smtp_port
         self.username = username
         self.password = password
         self.use_tls = use_tls
         self.from_address = from_address or username
-        self.lock = threading.Lock()
+        # Authenticated sessions kept open between sends
+        self.pool = SMTPConnectionPool(smtp_host, smtp_port, username, password,
+                                       use_tls, pool_size)
+    
+    def close(self):
+        """Close open SMTP sessions"""
+        self.pool.close()
     
     def send_email(self, to_addresses: List[str], subject: str, body: str,
                    is_html: bool = True) -> tuple[bool, Optional[str]]:
-        """Send email via SMTP"""
+        """
+        Send email via SMTP on a pooled session; safe to call from several threads.
+        
+        When the server accepts some recipients but refuses others, the email
+        counts as sent and the error names the refused addresses.
+        """
+        conn = None
+        checked_out = False
         try:
-            with self.lock:
-                msg = MIMEMultipart('alternative')
-                msg['Subject'] = subject
-                msg['From'] = self.from_address
-                msg['To'] = ', '.join(to_addresses)
-                
-                # Attach body
-                mime_type = 'html' if is_html else 'plain'
-                msg.attach(MIMEText(body, mime_type))
-                
-                # Send email
-                with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                    if self.use_tls:
-                        server.starttls()
-                    
-                    server.login(self.username, self.password)
-                    server.sendmail(self.from_address, to_addresses, msg.as_string())
-                
-                logger.info(f"Email sent to {', '.join(to_addresses)}")
-                return True, None
+            payload = build_message(self.from_address, tuple(to_addresses), subject, body, is_html)
+            
+            # Send email; a session the server dropped since the health
+            # check is replaced once
+            conn = self.pool.get()
+            checked_out = True
+            try:
+                refused = conn.sendmail(self.from_address, to_addresses, payload)
+            except smtplib.SMTPServerDisconnected:
+                conn.close()
+                conn = None
+                conn = self.pool.connect()
+                refused = conn.sendmail(self.from_address, to_addresses, payload)
+            
+            if refused:
+                error_msg = f"Recipients refused: {', '.join(refused)}"
+                logger.warning(error_msg)
+                return True, error_msg
+            
+            logger.info(f"Email sent to {', '.join(to_addresses)}")
+            return True, None
         
         except smtplib.SMTPException as e:
             error_msg = f"SMTP error: {str(e)}"
             logger.error(error_msg)
             return False, error_msg
         except Exception as e:
+            # Socket-level failure; the session cannot be trusted any more
+            if conn is not None:
+                conn.close()
+                conn = None
             error_msg = f"Email sending error: {str(e)}"
             logger.error(error_msg)
             return False, error_msg
+        finally:
+            if checked_out:
+                self.pool.put(conn)
 
 
 class NotificationTemplateManager:
@@ -403,6 +862,8 @@ class NotificationTemplateManager:
     
     def __init__(self):
         self.templates: Dict[str, NotificationTemplate] = {}
+        # Template names for list_templates; rebuilt after a registration
+        self._names: Optional[List[str]] = None
         self._initialize_default_templates()
     
     def _initialize_default_templates(self):
@@ -509,6 +970,7 @@ class NotificationTemplateManager:
     def register_template(self, template: NotificationTemplate):
         """Register a notification template"""
         self.templates[template.name] = template
+        self._names = None
         logger.info(f"Template registered: {template.name}")
     
     def get_template(self, name: str) -> Optional[NotificationTemplate]:
@@ -517,7 +979,9 @@ class NotificationTemplateManager:
     
     def list_templates(self) -> List[str]:
         """List all registered templates"""
-        return list(self.templates.keys())
+        if self._names is None:
+            self._names = list(self.templates.keys())
+        return list(self._names)
 
 
 class AlertRuleManager:
@@ -526,11 +990,27 @@ class AlertRuleManager:
     def __init__(self, db: NotificationDatabase):
         self.db = db
         self.rules: Dict[str, AlertRule] = {}
+        # Rules by the event_type they apply to; "" holds rules for any event
+        self._by_event_type: Dict[str, List[AlertRule]] = defaultdict(list)
+        # Matching rules per distinct event; cleared whenever the rules change
+        self._eval_cache = functools.lru_cache(maxsize=RULE_EVAL_CACHE_SIZE)(self._evaluate_items)
+        # Serialized rules for rule_summaries; rebuilt after a change
+        self._summaries: Optional[List[Dict]] = None
+    
+    def _rules_changed(self):
+        """Drop everything derived from the rules"""
+        self._eval_cache.cache_clear()
+        self._summaries = None
     
     def register_rule(self, rule: AlertRule) -> bool:
         """Register an alert rule"""
         try:
+            replaced = self.rules.get(rule.name)
+            if replaced is not None:
+                self._by_event_type[replaced.event_type].remove(replaced)
             self.rules[rule.name] = rule
+            self._by_event_type[rule.event_type].append(rule)
+            self._rules_changed()
             logger.info(f"Alert rule registered: {rule.name}")
             return True
         except Exception as e:
@@ -549,11 +1029,27 @@ class AlertRuleManager:
         """Get enabled rules"""
         return [r for r in self.rules.values() if r.enabled]
     
+    def rule_summaries(self) -> List[Dict]:
+        """Name, type, state, description and level of every rule"""
+        if self._summaries is None:
+            self._summaries = [
+                {
+                    'name': r.name,
+                    'type': r.rule_type.value,
+                    'enabled': r.enabled,
+                    'description': r.description,
+                    'notification_level': r.notification_level.value
+                }
+                for r in self.rules.values()
+            ]
+        return list(self._summaries)
+    
     def disable_rule(self, name: str) -> bool:
         """Disable a rule"""
         rule = self.get_rule(name)
         if rule:
             rule.enabled = False
+            self._rules_changed()
             return True
         return False
     
@@ -562,27 +1058,120 @@ class AlertRuleManager:
         rule = self.get_rule(name)
         if rule:
             rule.enabled = True
+            self._rules_changed()
             return True
         return False
     
     def evaluate_event(self, event_data: Dict[str, Any]) -> List[AlertRule]:
-        """Evaluate event against all enabled rules"""
+        """
+        Evaluate event against the enabled rules for its event type, then those for any event.
+        
+        Repeated identical events are answered from a bounded cache, so rule
+        conditions must depend only on the event. Events with unhashable
+        values are always evaluated.
+        """
+        try:
+            key = frozenset(event_data.items())
+        except TypeError:
+            return self._evaluate(event_data)
+        return list(self._eval_cache(key))
+    
+    def _evaluate_items(self, items: frozenset) -> Tuple[AlertRule, ...]:
+        return tuple(self._evaluate(dict(items)))
+    
+    def _evaluate(self, event_data: Dict[str, Any]) -> List[AlertRule]:
+        # Untyped events only reach the "" rules, which are evaluated below anyway
+        event_type = event_data.get('event_type')
+        try:
+            candidates = self._by_event_type.get(event_type, []) if event_type else []
+        except TypeError:
+            # An unhashable event_type can't name a typed rule
+            candidates = []
         matched_rules = []
-        for rule in self.get_enabled_rules():
-            if rule.matches(event_data):
-                matched_rules.append(rule)
+        for rules in (candidates, self._by_event_type['']):
+            for rule in rules:
+                if rule.enabled and rule.matches(event_data):
+                    matched_rules.append(rule)
         return matched_rules
 
 
+class NotificationQueue(ABC):
+    """Queue feeding notifications to NotificationWorker"""
+    
+    @abstractmethod
+    def put(self, notification: Optional[Notification]):
+        """Add a notification; None only wakes a waiting consumer"""
+    
+    @abstractmethod
+    def get(self, timeout: Optional[float] = None) -> Optional[Notification]:
+        """Take the next notification, raising queue.Empty after timeout seconds"""
+    
+    def get_nowait(self) -> Optional[Notification]:
+        """Take the next notification if one is waiting, else raise queue.Empty"""
+        return self.get(timeout=0)
+
+
+class InMemoryQueue(NotificationQueue):
+    """In-process queue; notifications are only seen by this process's worker"""
+    
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+    
+    def put(self, notification: Optional[Notification]):
+        self._queue.put(notification)
+    
+    def get(self, timeout: Optional[float] = None) -> Optional[Notification]:
+        if timeout == 0:
+            return self._queue.get_nowait()
+        return self._queue.get(timeout=timeout)
+
+
+class RedisQueue(NotificationQueue):
+    """
+    Redis list shared by workers in any number of processes or machines.
+    
+    Notifications travel as JSON from Notification.to_dict(), so consumers
+    can be scaled on the list's length.
+    """
+    
+    def __init__(self, url: str = "redis://localhost:6379/0", key: str = "notifications"):
+        if redis is None:
+            raise ImportError("RedisQueue requires the 'redis' package")
+        self.client = redis.Redis.from_url(url)
+        self.key = key
+    
+    def put(self, notification: Optional[Notification]):
+        # Wake-ups are local; get() never blocks past REDIS_BLOCK_LIMIT
+        if notification is not None:
+            self.client.rpush(self.key, json.dumps(notification.to_dict()))
+    
+    def get(self, timeout: Optional[float] = None) -> Optional[Notification]:
+        if timeout == 0:
+            payload = self.client.lpop(self.key)
+        else:
+            limit = REDIS_BLOCK_LIMIT if timeout is None else min(timeout, REDIS_BLOCK_LIMIT)
+            item = self.client.blpop([self.key], timeout=limit)
+            payload = item[1] if item else None
+        if payload is None:
+            raise queue.Empty
+        return Notification.from_dict(json.loads(payload))
+
+
 class NotificationWorker:
     """Background worker thread for processing notifications"""
     
     def __init__(self, db: NotificationDatabase, email_sender: Optional[SMTPEmailSender] = None,
-                 process_interval: int = 5):
+                 process_interval: int = 5, send_workers: int = SMTP_POOL_SIZE,
+                 batch_size: int = NOTIFICATION_BATCH_SIZE,
+                 queue_backend: Optional[NotificationQueue] = None):
         self.db = db
         self.email_sender = email_sender
         self.process_interval = process_interval
-        self.queue: queue.Queue = queue.Queue()
+        # Threads delivering notifications concurrently, one pooled SMTP
+        # session each
+        self.send_workers = send_workers
+        self.batch_size = batch_size
+        self.queue: NotificationQueue = queue_backend or InMemoryQueue()
         self.running = False
         self.thread: Optional[threading.Thread] = None
         self.stats = {
@@ -591,6 +1180,7 @@ class NotificationWorker:
             'retried': 0,
             'processed': 0
         }
+        self.stats_lock = threading.Lock()
     
     def start(self):
         """Start worker thread"""
@@ -606,8 +1196,12 @@ class NotificationWorker:
     def stop(self):
         """Stop worker thread"""
         self.running = False
+        # Wake the loop if it is waiting on the queue
+        self.queue.put(None)
         if self.thread:
             self.thread.join(timeout=10)
+        if self.email_sender:
+            self.email_sender.close()
         logger.info("Notification worker stopped")
     
     def add_notification(self, notification: Notification):
@@ -615,44 +1209,139 @@ class NotificationWorker:
         self.queue.put(notification)
     
     def _worker_loop(self):
-        """Main worker loop"""
-        while self.running:
-            try:
-                # Process queue items
+        """
+        Main worker loop; notifications are delivered in parallel on a thread pool.
+        
+        The loop blocks on the queue, so new notifications go out as soon as
+        they are added. The database is only read when the earliest scheduled
+        retry is due, or every process_interval if no retry is scheduled, and
+        never without an email sender, since nothing stored could be sent.
+        """
+        # Monotonic time of the next database pass; the first runs at once
+        # to pick up notifications left over from a previous run
+        next_scan = 0.0
+        with ThreadPoolExecutor(max_workers=self.send_workers,
+                                thread_name_prefix='notification-sender') as executor:
+            while self.running:
                 try:
-                    notification = self.queue.get(timeout=1)
-                    self._process_notification(notification)
-                except queue.Empty:
-                    pass
-                
-                # Process pending notifications from database
-                pending = self.db.get_pending_notifications()
-                for notification in pending:
-                    # Check if retry time has arrived
-                    if notification.next_retry and notification.next_retry > datetime.utcnow():
+                    # Process queue items: wait for one, then take whatever
+                    # else is already queued, up to a batch
+                    batch = []
+                    timeout = max(0.1, next_scan - time.monotonic()) if self.email_sender else None
+                    try:
+                        batch.append(self.queue.get(timeout=timeout))
+                        while len(batch) < self.batch_size:
+                            batch.append(self.queue.get_nowait())
+                    except queue.Empty:
+                        pass
+                    # None only wakes the loop
+                    processed = self._deliver(executor, [n for n in batch if n is not None])
+                    next_scan = min(next_scan, self._retry_deadline(processed))
+                    
+                    if self.email_sender is None or time.monotonic() < next_scan:
                         continue
                     
-                    self._process_notification(notification)
+                    # Process pending notifications from database whose
+                    # retry time has arrived
+                    due = self.db.get_ready_notifications()
+                    self._deliver(executor, due)
+                    next_scan = self._retry_deadline()
                 
-                time.sleep(self.process_interval)
+                except Exception as e:
+                    logger.error(f"Error in worker loop: {e}")
+                    time.sleep(self.process_interval)
+                    next_scan = 0.0
+    
+    def _retry_deadline(self, notifications: Optional[List[Notification]] = None) -> float:
+        """
+        Monotonic time by which the database should next be read.
+        
+        Args:
+            notifications: Just-processed notifications to take retry times
+                from; by default the earliest retry in the database is used
             
-            except Exception as e:
-                logger.error(f"Error in worker loop: {e}")
-                time.sleep(self.process_interval)
+        Returns:
+            The earliest retry time, or process_interval from now if no
+            retry is scheduled
+        """
+        if notifications is None:
+            next_retry = self.db.get_next_retry_time()
+        else:
+            next_retry = min((n.next_retry for n in notifications
+                              if n.status == NotificationStatus.RETRYING and n.next_retry),
+                             default=None)
+        
+        if next_retry is None:
+            return time.monotonic() + self.process_interval
+        return time.monotonic() + (next_retry - datetime.utcnow()).total_seconds()
+    
+    def _count(self, stat: str):
+        """Increment a statistic; called from the sender threads"""
+        with self.stats_lock:
+            self.stats[stat] += 1
+    
+    def _deliver(self, executor: ThreadPoolExecutor,
+                 notifications: List[Notification]) -> List[Notification]:
+        """Send notifications batch by batch, one email per group of identical messages; returns those updated"""
+        updated = []
+        for start in range(0, len(notifications), self.batch_size):
+            groups = self._group_identical(notifications[start:start + self.batch_size])
+            processed = [n for group in executor.map(self._process_group, groups) for n in group]
+            self._save_processed(processed)
+            updated.extend(processed)
+        return updated
+    
+    @staticmethod
+    def _group_identical(notifications: List[Notification]) -> List[List[Notification]]:
+        """Group notifications with the same subject, body and recipients, in first-seen order"""
+        groups: Dict[tuple, List[Notification]] = {}
+        for notification in notifications:
+            key = (notification.subject, notification.body, tuple(notification.recipients))
+            groups.setdefault(key, []).append(notification)
+        return list(groups.values())
     
     def _process_notification(self, notification: Notification):
         """Process a single notification"""
+        self._save_processed(self._process_group([notification]))
+    
+    def _save_processed(self, processed: List[Notification]):
+        """Persist updated notifications in one transaction and count them"""
+        if processed and self.db.save_notifications(processed):
+            with self.stats_lock:
+                self.stats['processed'] += len(processed)
+        self.db.flush_audit_events()
+    
+    def _process_group(self, group: List[Notification]) -> List[Notification]:
+        """Send notifications sharing one message as a single email; returns those updated"""
         try:
-            if notification.status == NotificationStatus.SENT:
-                return
+            group = [n for n in group if n.status != NotificationStatus.SENT]
+            if not group:
+                return []
             
-            # Send notification
-            success = self._send_notification(notification)
+            # Retrying cannot help without a sender; fail at once
+            if self.email_sender is None:
+                for notification in group:
+                    notification.status = NotificationStatus.FAILED
+                    notification.error_message = "Email sender not configured"
+                    self._count('failed')
+                logger.warning(f"Email sender not configured; {len(group)} notification(s) failed")
+                return group
             
+            # Send notification
+            success = self._send_notification(group)
+        except Exception as e:
+            logger.error(f"Error processing notification: {e}")
+            return []
+        
+        return [n for n in group if self._record_outcome(n, success)]
+    
+    def _record_outcome(self, notification: Notification, success: bool) -> bool:
+        """Update and count a notification after a send attempt; False if that failed"""
+        try:
             if success:
                 notification.status = NotificationStatus.SENT
                 notification.sent_at = datetime.utcnow()
-                self.stats['sent'] += 1
+                self._count('sent')
                 self.db.log_audit_event(notification.id, "SENT", {"timestamp": datetime.utcnow().isoformat()})
             else:
                 # Handle retry logic
@@ -662,59 +1351,65 @@ class NotificationWorker:
                     # Exponential backoff: wait 2^retry_count minutes
                     backoff_minutes = min(2 ** notification.retry_count, 60)
                     notification.next_retry = datetime.utcnow() + timedelta(minutes=backoff_minutes)
-                    self.stats['retried'] += 1
+                    self._count('retried')
                     logger.info(f"Notification {notification.id} scheduled for retry in {backoff_minutes} minutes")
                 else:
                     notification.status = NotificationStatus.FAILED
-                    self.stats['failed'] += 1
+                    self._count('failed')
                     logger.error(f"Notification {notification.id} failed after {notification.max_retries} retries")
-            
-            # Save updated notification
-            self.db.save_notification(notification)
-            self.stats['processed'] += 1
+            return True
         
         except Exception as e:
             logger.error(f"Error processing notification: {e}")
+            return False
     
-    def _send_notification(self, notification: Notification) -> bool:
-        """Send notification (email)"""
+    def _send_notification(self, group: List[Notification]) -> bool:
+        """Send one email for notifications sharing subject, body and recipients"""
         if not self.email_sender:
             logger.warning("Email sender not configured")
             return False
         
+        # Each address once, in first-seen order
+        recipients = list(dict.fromkeys(group[0].recipients))
+        
         try:
             success, error = self.email_sender.send_email(
-                to_addresses=notification.recipients,
-                subject=notification.subject,
-                body=notification.body,
+                to_addresses=recipients,
+                subject=group[0].subject,
+                body=group[0].body,
                 is_html=True
             )
-            
-            if not success:
-                notification.error_message = error
-            
-            return success
         except Exception as e:
-            notification.error_message = str(e)
+            success, error = False, str(e)
             logger.error(f"Error sending notification: {e}")
-            return False
+        
+        # A sent email may still carry the refused recipients in error
+        if error is not None:
+            for notification in group:
+                notification.error_message = error
+        
+        return success
     
     def get_stats(self) -> Dict[str, int]:
         """Get worker statistics"""
-        return self.stats.copy()
+        with self.stats_lock:
+            return self.stats.copy()
 
 
 class NotificationSystem:
     """Main notification system coordinator"""
     
     def __init__(self, db_path: str = "notifications.db", 
-                 email_config: Optional[Dict] = None):
+                 email_config: Optional[Dict] = None,
+                 queue_backend: Optional[NotificationQueue] = None):
         self.db = NotificationDatabase(db_path)
         self.template_manager = NotificationTemplateManager()
         self.rule_manager = AlertRuleManager(self.db)
         
-        # Initialize email sender if configured
+        # Initialize email sender if configured; 'concurrency' sets both the
+        # SMTP sessions held open and the threads sending through them
         self.email_sender: Optional[SMTPEmailSender] = None
+        concurrency = (email_config or {}).get('concurrency', SMTP_POOL_SIZE)
         if email_config:
             self.email_sender = SMTPEmailSender(
                 smtp_host=email_config['host'],
@@ -722,11 +1417,17 @@ class NotificationSystem:
                 username=email_config['username'],
                 password=email_config['password'],
                 use_tls=email_config.get('use_tls', True),
-                from_address=email_config.get('from_address')
+                from_address=email_config.get('from_address'),
+                pool_size=concurrency
             )
         
         # Initialize worker
-        self.worker = NotificationWorker(self.db, self.email_sender)
+        self.worker = NotificationWorker(self.db, self.email_sender, send_workers=concurrency,
+                                         queue_backend=queue_backend)
+        
+        # Serialized notifications by (id, version); a new version misses
+        self._notification_cache = functools.lru_cache(maxsize=NOTIFICATION_CACHE_SIZE)(
+            self._load_notification_dict)
     
     def start(self):
         """Start notification system"""
@@ -736,13 +1437,12 @@ class NotificationSystem:
     def stop(self):
         """Stop notification system"""
         self.worker.stop()
+        self.db.close()
         logger.info("Notification system stopped")
     
     def generate_notification_id(self) -> str:
         """Generate unique notification ID"""
-        timestamp = datetime.utcnow().isoformat()
-        random_suffix = hashlib.md5(f"{timestamp}{random.random()}".encode()).hexdigest()[:8]
-        return f"notif_{int(datetime.utcnow().timestamp())}_{random_suffix}"
+        return f"notif_{int(time.time())}_{secrets.token_hex(4)}"
     
     def send_notification(self, level: NotificationLevel, recipients: List[str],
                          subject: str, body: str, metadata: Dict = None) -> str:
@@ -799,15 +1499,24 @@ class NotificationSystem:
         return notification_ids
     
     def get_notification(self, notification_id: str) -> Optional[Dict]:
-        """Get notification details"""
+        """Get notification details; unchanged notifications are served from a cache
+        
+        Returns a deep copy, so callers can't mutate the cached recipients or metadata.
+        """
+        version = self.db.get_notification_version(notification_id)
+        if version is None:
+            return None
+        data = self._notification_cache(notification_id, version)
+        return copy.deepcopy(data) if data else None
+    
+    def _load_notification_dict(self, notification_id: str, version: int) -> Optional[Dict]:
         notification = self.db.get_notification(notification_id)
         return notification.to_dict() if notification else None
     
     def get_notifications_by_status(self, status: NotificationStatus, 
                                    limit: int = 100) -> List[Dict]:
         """Get notifications by status"""
-        notifications = self.db.get_notifications_by_status(status, limit)
-        return [n.to_dict() for n in notifications]
+        return self.db.get_notifications_by_status_as_dicts(status, limit)
     
     def get_worker_stats(self) -> Dict:
         """Get worker statistics"""
@@ -831,16 +1540,7 @@ class NotificationSystem:
     
     def list_alert_rules(self) -> List[Dict]:
         """List alert rules"""
-        return [
-            {
-                'name': r.name,
-                'type': r.rule_type.value,
-                'enabled': r.enabled,
-                'description': r.description,
-                'notification_level': r.notification_level.value
-            }
-            for r in self.rule_manager.list_rules()
-        ]
+        return self.rule_manager.rule_summaries()
 
 
 # Example usage and initialization
@@ -869,7 +1569,8 @@ if __name__ == "__main__":
         condition=migration_failure_condition,
         notification_level=NotificationLevel.CRITICAL,
         recipients=['admin@example.com'],
-        description="Alert when migration operation fails"
+        description="Alert when migration operation fails",
+        event_type='migration_failed'
     )
     system.register_alert_rule(migration_error_rule)
     
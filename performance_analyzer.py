@@ -13,10 +13,35 @@ Date: 2025-12-08
 import time
 import psutil
 import os
-from typing import Dict, List, Tuple, Optional
+import sys
+import mmap
+from array import array
+from typing import Dict, List, Tuple, Optional, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Test files are written and read through one reusable buffer of this size
+SPEED_TEST_CHUNK = 1024 * 1024
+# Chunks handed to the kernel per writev call where available
+SPEED_TEST_CHUNKS_PER_WRITE = 16
+
+# /proc/meminfo, opened on first use and read with pread from then on
+_meminfo_fd: Optional[int] = None
+
+# Rules framing generate_report and its sections
+REPORT_RULE = "=" * 60
+SECTION_RULE = "-" * 40
+
 
 @dataclass
 class PerformanceMetrics:
@@ -29,11 +54,70 @@ class PerformanceMetrics:
     memory_available_mb: float
 
 
+@dataclass(slots=True)
+class MemorySnapshot:
+    """System memory usage at one moment"""
+    total_mb: float
+    used_mb: float
+    available_mb: float
+    percent: float
+    used_percent: float
+    
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            'total_mb': self.total_mb,
+            'used_mb': self.used_mb,
+            'available_mb': self.available_mb,
+            'percent': self.percent,
+            'used_percent': self.used_percent
+        }
+
+
+@dataclass(slots=True)
+class TransferAnalysis:
+    """Result of PerformanceAnalyzer.analyze; other time units derive from seconds"""
+    data_size_gb: float
+    drive_speed_mbps: float
+    seconds: float
+    estimated_completion: datetime
+    memory: Optional[MemorySnapshot]
+    metrics: PerformanceMetrics
+    
+    @property
+    def minutes(self) -> float:
+        return self.seconds / 60
+    
+    @property
+    def hours(self) -> float:
+        return self.seconds / 3600
+    
+    @property
+    def days(self) -> float:
+        return self.seconds / 86400
+    
+    def to_dict(self) -> Dict:
+        """The dictionary returned by PerformanceAnalyzer.analyze_transfer"""
+        return {
+            'data_size_gb': self.data_size_gb,
+            'drive_speed_mbps': self.drive_speed_mbps,
+            'transfer_times': {
+                'seconds': self.seconds,
+                'minutes': self.minutes,
+                'hours': self.hours,
+                'days': self.days
+            },
+            'estimated_completion': self.estimated_completion.isoformat(),
+            'memory_usage': self.memory.to_dict() if self.memory else {},
+            'metrics': self.metrics
+        }
+
+
 class DriveSpeedAnalyzer:
     """Analyzer for drive read/write speeds"""
     
     def __init__(self):
-        self.measurements: List[float] = []
+        # Unboxed doubles: 8 bytes a sample instead of a float object each
+        self.measurements: array = array('d')
     
     def measure_write_speed(self, file_path: str, data_size_mb: int = 100) -> float:
         """
@@ -47,68 +131,129 @@ class DriveSpeedAnalyzer:
             Write speed in MB/s
         """
         try:
-            test_data = b'0' * (data_size_mb * 1024 * 1024)
-            
-            start_time = time.time()
-            with open(file_path, 'wb') as f:
-                f.write(test_data)
-            write_time = time.time() - start_time
+            start_time = time.perf_counter()
+            self._write_test_file(file_path, data_size_mb)
+            write_time = time.perf_counter() - start_time
             
             speed = data_size_mb / write_time if write_time > 0 else 0
             self.measurements.append(speed)
             
             # Cleanup
-            if os.path.exists(file_path):
-                os.remove(file_path)
+            try:
+                os.unlink(file_path)
+            except FileNotFoundError:
+                pass
             
             return speed
         except Exception as e:
             print(f"Error measuring write speed: {e}")
             return 0.0
     
-    def measure_read_speed(self, file_path: str, data_size_mb: int = 100) -> float:
+    def measure_read_speed(self, file_path: str, data_size_mb: int = 100,
+                           reuse: bool = False) -> float:
         """
         Measure drive read speed by reading test data.
         
+        The test file is evicted from the page cache and read back with
+        O_DIRECT (Linux) or F_NOCACHE (macOS), so the speed is the device's
+        rather than memory's where the OS and filesystem allow it.
+        
         Args:
             file_path: Path to test file
             data_size_mb: Size of test data in MB
+            reuse: Keep the test file afterwards, and read an existing file of
+                data_size_mb instead of writing it again, for repeated runs
             
         Returns:
             Read speed in MB/s
         """
         try:
-            # First write test file
-            test_data = b'0' * (data_size_mb * 1024 * 1024)
-            with open(file_path, 'wb') as f:
-                f.write(test_data)
+            # First write test file, unless a reusable one is already there
+            try:
+                existing = os.stat(file_path).st_size if reuse else None
+            except FileNotFoundError:
+                existing = None
+            if existing != data_size_mb * SPEED_TEST_CHUNK:
+                self._write_test_file(file_path, data_size_mb)
             
-            # Then measure read speed
-            start_time = time.time()
-            with open(file_path, 'rb') as f:
-                while f.read(1024 * 1024):  # Read in 1MB chunks
+            # Then measure read speed, reading 1MB chunks into one
+            # page-aligned buffer as O_DIRECT requires
+            start_time = time.perf_counter()
+            with mmap.mmap(-1, SPEED_TEST_CHUNK) as buffer, \
+                    open(self._open_uncached(file_path), 'rb', buffering=0) as f:
+                while f.readinto(buffer):
                     pass
-            read_time = time.time() - start_time
+            read_time = time.perf_counter() - start_time
             
             speed = data_size_mb / read_time if read_time > 0 else 0
             self.measurements.append(speed)
             
             # Cleanup
-            if os.path.exists(file_path):
-                os.remove(file_path)
+            if not reuse:
+                try:
+                    os.unlink(file_path)
+                except FileNotFoundError:
+                    pass
             
             return speed
         except Exception as e:
             print(f"Error measuring read speed: {e}")
             return 0.0
     
+    @staticmethod
+    def _write_test_file(file_path: str, data_size_mb: int):
+        """Write data_size_mb of zeros from a single 1MB buffer, flush them to the drive and drop them from the page cache"""
+        buffer = memoryview(bytearray(SPEED_TEST_CHUNK))
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            if hasattr(os, 'writev'):
+                full, rest = divmod(data_size_mb, SPEED_TEST_CHUNKS_PER_WRITE)
+                buffers = [buffer] * SPEED_TEST_CHUNKS_PER_WRITE
+                for _ in range(full):
+                    os.writev(fd, buffers)
+                if rest:
+                    os.writev(fd, buffers[:rest])
+            else:
+                for _ in range(data_size_mb):
+                    os.write(fd, buffer)
+            os.fsync(fd)
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def _open_uncached(file_path: str) -> int:
+        """Open file_path for reading past the page cache where supported; returns the fd"""
+        flags = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+        if hasattr(os, 'O_DIRECT'):
+            try:
+                return os.open(file_path, flags | os.O_DIRECT)
+            except OSError:
+                pass  # Filesystem without O_DIRECT support, e.g. tmpfs
+        fd = os.open(file_path, flags)
+        if hasattr(os, 'posix_fadvise'):
+            # A reused file may still be cached from its last read
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        if fcntl is not None and hasattr(fcntl, 'F_NOCACHE'):
+            fcntl.fcntl(fd, fcntl.F_NOCACHE, 1)
+        return fd
+    
     def get_average_speed(self) -> float:
         """Get average drive speed from all measurements"""
-        return sum(self.measurements) / len(self.measurements) if self.measurements else 0.0
+        if not self.measurements:
+            return 0.0
+        if np is not None:
+            return float(np.frombuffer(self.measurements, dtype=np.float64).mean())
+        return sum(self.measurements) / len(self.measurements)
     
     def get_peak_speed(self) -> float:
         """Get peak drive speed from all measurements"""
-        return max(self.measurements) if self.measurements else 0.0
+        if not self.measurements:
+            return 0.0
+        if np is not None:
+            return float(np.frombuffer(self.measurements, dtype=np.float64).max())
+        return max(self.measurements)
 
 
 class TransferTimeCalculator:
@@ -147,6 +292,38 @@ class TransferTimeCalculator:
             'days': transfer_seconds / 86400
         }
     
+    @staticmethod
+    def calculate_transfer_time_batch(
+        data_sizes_gb: Sequence[float],
+        speeds_mbps: Sequence[float]
+    ) -> Tuple[Sequence[float], Sequence[float], Sequence[float], Sequence[float]]:
+        """
+        Calculate transfer times for many (size, speed) pairs at once.
+        
+        Vectorized with NumPy when it is installed, so planners comparing
+        thousands of candidates avoid a dict per pair.
+        
+        Args:
+            data_sizes_gb: Sizes of data to transfer in GB
+            speeds_mbps: Transfer speeds in MB/s, paired with data_sizes_gb
+            
+        Returns:
+            Seconds, minutes, hours and days per pair; infinite where the
+            speed is not positive. NumPy arrays if NumPy is available,
+            otherwise lists
+        """
+        if np is not None:
+            sizes = np.asarray(data_sizes_gb, dtype=np.float64)
+            speeds = np.asarray(speeds_mbps, dtype=np.float64)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                seconds = np.where(speeds > 0, sizes * 1024 / speeds, np.inf)
+            return seconds, seconds / 60, seconds / 3600, seconds / 86400
+        
+        seconds = [size * 1024 / speed if speed > 0 else float('inf')
+                   for size, speed in zip(data_sizes_gb, speeds_mbps)]
+        return (seconds, [t / 60 for t in seconds], [t / 3600 for t in seconds],
+                [t / 86400 for t in seconds])
+    
     @staticmethod
     def estimate_completion_time(
         data_size_gb: float,
@@ -167,10 +344,33 @@ class TransferTimeCalculator:
         if start_time is None:
             start_time = datetime.now()
         
-        times = TransferTimeCalculator.calculate_transfer_time(data_size_gb, speed_mbps)
-        duration = timedelta(seconds=times['seconds'])
+        seconds = data_size_gb * 1024 / speed_mbps if speed_mbps > 0 else float('inf')
+        return start_time + timedelta(seconds=seconds)
+    
+    @staticmethod
+    def estimate_completion_time_batch(
+        data_sizes_gb: Sequence[float],
+        speeds_mbps: Sequence[float],
+        start_time: Optional[datetime] = None
+    ) -> List[Optional[datetime]]:
+        """
+        Estimate completion times for many (size, speed) pairs at once.
         
-        return start_time + duration
+        Args:
+            data_sizes_gb: Sizes of data to transfer in GB
+            speeds_mbps: Transfer speeds in MB/s, paired with data_sizes_gb
+            start_time: Start time of the transfers (defaults to now)
+            
+        Returns:
+            Estimated completion datetime per pair; None where the speed is
+            not positive
+        """
+        if start_time is None:
+            start_time = datetime.now()
+        
+        seconds, _, _, _ = TransferTimeCalculator.calculate_transfer_time_batch(data_sizes_gb, speeds_mbps)
+        return [start_time + timedelta(seconds=float(t)) if t != float('inf') else None
+                for t in seconds]
 
 
 class MemoryUsageAnalyzer:
@@ -178,6 +378,12 @@ class MemoryUsageAnalyzer:
     
     def __init__(self):
         self.history: List[PerformanceMetrics] = []
+        # Linux reads /proc/meminfo directly; psutil elsewhere
+        self._read_memory = self._read_meminfo if sys.platform.startswith('linux') else self._read_psutil
+        # Running total, peak and minimum of memory_usage_percent over history
+        self._percent_total = 0.0
+        self._percent_peak = 0.0
+        self._percent_min = 0.0
     
     def get_current_memory_usage(self) -> Dict[str, float]:
         """
@@ -186,18 +392,61 @@ class MemoryUsageAnalyzer:
         Returns:
             Dictionary with memory usage information
         """
+        snapshot = self.get_memory_snapshot()
+        return snapshot.to_dict() if snapshot else {}
+    
+    def get_memory_snapshot(self) -> Optional[MemorySnapshot]:
+        """
+        Get current memory usage without building a dictionary.
+        
+        Returns:
+            MemorySnapshot, or None if memory usage could not be read
+        """
         try:
-            memory_info = psutil.virtual_memory()
-            return {
-                'total_mb': memory_info.total / (1024 * 1024),
-                'used_mb': memory_info.used / (1024 * 1024),
-                'available_mb': memory_info.available / (1024 * 1024),
-                'percent': memory_info.percent,
-                'used_percent': (memory_info.used / memory_info.total) * 100
-            }
+            return self._read_memory()
         except Exception as e:
             print(f"Error getting memory usage: {e}")
-            return {}
+            return None
+    
+    @staticmethod
+    def _read_psutil() -> MemorySnapshot:
+        memory_info = psutil.virtual_memory()
+        return MemorySnapshot(
+            total_mb=memory_info.total / (1024 * 1024),
+            used_mb=memory_info.used / (1024 * 1024),
+            available_mb=memory_info.available / (1024 * 1024),
+            percent=memory_info.percent,
+            used_percent=(memory_info.used / memory_info.total) * 100
+        )
+    
+    def _read_meminfo(self) -> MemorySnapshot:
+        """
+        Read MemTotal and MemAvailable with one pread of /proc/meminfo.
+        
+        Used is total minus available, as psutil computes it. Falls back to
+        psutil for good if /proc/meminfo is unreadable or lacks the fields.
+        """
+        global _meminfo_fd
+        try:
+            if _meminfo_fd is None:
+                _meminfo_fd = os.open('/proc/meminfo', os.O_RDONLY)
+            data = os.pread(_meminfo_fd, 8192, 0)
+            start = data.index(b'MemTotal:') + 9
+            total_kb = int(data[start:data.index(b'kB', start)])
+            start = data.index(b'MemAvailable:') + 13
+            available_kb = int(data[start:data.index(b'kB', start)])
+        except (OSError, ValueError):
+            self._read_memory = self._read_psutil
+            return self._read_psutil()
+        
+        used_kb = total_kb - available_kb
+        return MemorySnapshot(
+            total_mb=total_kb / 1024,
+            used_mb=used_kb / 1024,
+            available_mb=available_kb / 1024,
+            percent=round(used_kb / total_kb * 100, 1),
+            used_percent=used_kb / total_kb * 100
+        )
     
     def get_process_memory_usage(self, pid: Optional[int] = None) -> Dict[str, float]:
         """
@@ -228,7 +477,8 @@ class MemoryUsageAnalyzer:
     def record_metrics(
         self,
         drive_speed_mbps: float,
-        transfer_time_seconds: float
+        transfer_time_seconds: float,
+        snapshot: Optional[MemorySnapshot] = None
     ) -> PerformanceMetrics:
         """
         Record performance metrics snapshot.
@@ -236,21 +486,31 @@ class MemoryUsageAnalyzer:
         Args:
             drive_speed_mbps: Current drive speed in MB/s
             transfer_time_seconds: Current transfer time in seconds
+            snapshot: Memory usage to record (defaults to a fresh reading)
             
         Returns:
             PerformanceMetrics object
         """
-        memory_usage = self.get_current_memory_usage()
+        if snapshot is None:
+            snapshot = self.get_memory_snapshot()
         
         metrics = PerformanceMetrics(
             timestamp=datetime.now(),
             drive_speed_mbps=drive_speed_mbps,
             transfer_time_seconds=transfer_time_seconds,
-            memory_usage_percent=memory_usage.get('percent', 0),
-            memory_used_mb=memory_usage.get('used_mb', 0),
-            memory_available_mb=memory_usage.get('available_mb', 0)
+            memory_usage_percent=snapshot.percent if snapshot else 0,
+            memory_used_mb=snapshot.used_mb if snapshot else 0,
+            memory_available_mb=snapshot.available_mb if snapshot else 0
         )
         
+        percent = metrics.memory_usage_percent
+        if not self.history:
+            self._percent_total = 0.0
+            self._percent_peak = self._percent_min = percent
+        self._percent_total += percent
+        self._percent_peak = max(self._percent_peak, percent)
+        self._percent_min = min(self._percent_min, percent)
+        
         self.history.append(metrics)
         return metrics
     
@@ -258,18 +518,19 @@ class MemoryUsageAnalyzer:
         """
         Get aggregated memory statistics from recorded history.
         
+        The aggregates are kept up to date by record_metrics, so this does
+        not walk the history.
+        
         Returns:
             Dictionary with memory statistics
         """
         if not self.history:
             return {}
         
-        memory_usages = [m.memory_usage_percent for m in self.history]
-        
         return {
-            'average_percent': sum(memory_usages) / len(memory_usages),
-            'peak_percent': max(memory_usages),
-            'min_percent': min(memory_usages),
+            'average_percent': self._percent_total / len(self.history),
+            'peak_percent': self._percent_peak,
+            'min_percent': self._percent_min,
             'latest_percent': self.history[-1].memory_usage_percent
         }
 
@@ -297,37 +558,55 @@ class PerformanceAnalyzer:
         Returns:
             Dictionary with complete analysis
         """
+        analysis = self.analyze(data_size_gb, drive_speed_mbps)
+        if analysis is None:
+            return {'error': 'No drive speed available. Run drive speed tests first.'}
+        return analysis.to_dict()
+    
+    def analyze(
+        self,
+        data_size_gb: float,
+        drive_speed_mbps: Optional[float] = None
+    ) -> Optional[TransferAnalysis]:
+        """
+        Perform complete transfer analysis without building dictionaries.
+        
+        Args:
+            data_size_gb: Size of data to transfer in GB
+            drive_speed_mbps: Drive speed (if None, uses average from measurements)
+            
+        Returns:
+            TransferAnalysis, or None if no drive speed is available
+        """
         if drive_speed_mbps is None:
             drive_speed_mbps = self.drive_analyzer.get_average_speed()
         
         if drive_speed_mbps == 0:
-            return {'error': 'No drive speed available. Run drive speed tests first.'}
+            return None
         
-        transfer_times = self.transfer_calculator.calculate_transfer_time(
-            data_size_gb,
-            drive_speed_mbps
-        )
+        seconds = data_size_gb * 1024 / drive_speed_mbps if drive_speed_mbps > 0 else float('inf')
         
         completion_time = self.transfer_calculator.estimate_completion_time(
             data_size_gb,
             drive_speed_mbps
         )
         
-        memory_usage = self.memory_analyzer.get_current_memory_usage()
+        snapshot = self.memory_analyzer.get_memory_snapshot()
         
         metrics = self.memory_analyzer.record_metrics(
             drive_speed_mbps,
-            transfer_times['seconds']
+            seconds,
+            snapshot
         )
         
-        return {
-            'data_size_gb': data_size_gb,
-            'drive_speed_mbps': drive_speed_mbps,
-            'transfer_times': transfer_times,
-            'estimated_completion': completion_time.isoformat(),
-            'memory_usage': memory_usage,
-            'metrics': metrics
-        }
+        return TransferAnalysis(
+            data_size_gb=data_size_gb,
+            drive_speed_mbps=drive_speed_mbps,
+            seconds=seconds,
+            estimated_completion=completion_time,
+            memory=snapshot,
+            metrics=metrics
+        )
     
     def generate_report(self) -> str:
         """
@@ -336,30 +615,37 @@ class PerformanceAnalyzer:
         Returns:
             Formatted performance report
         """
-        report = "=" * 60 + "\n"
-        report += "PERFORMANCE ANALYSIS REPORT\n"
-        report += "=" * 60 + "\n\n"
+        lines = [
+            REPORT_RULE,
+            "PERFORMANCE ANALYSIS REPORT",
+            REPORT_RULE,
+            ""
+        ]
         
         # Drive Speed Report
-        report += "DRIVE SPEED ANALYSIS\n"
-        report += "-" * 40 + "\n"
         avg_speed = self.drive_analyzer.get_average_speed()
         peak_speed = self.drive_analyzer.get_peak_speed()
-        report += f"Average Speed: {avg_speed:.2f} MB/s\n"
-        report += f"Peak Speed: {peak_speed:.2f} MB/s\n"
-        report += f"Total Measurements: {len(self.drive_analyzer.measurements)}\n\n"
+        lines += [
+            "DRIVE SPEED ANALYSIS",
+            SECTION_RULE,
+            f"Average Speed: {avg_speed:.2f} MB/s",
+            f"Peak Speed: {peak_speed:.2f} MB/s",
+            f"Total Measurements: {len(self.drive_analyzer.measurements)}",
+            ""
+        ]
         
         # Memory Usage Report
-        report += "MEMORY USAGE ANALYSIS\n"
-        report += "-" * 40 + "\n"
+        lines += ["MEMORY USAGE ANALYSIS", SECTION_RULE]
         memory_stats = self.memory_analyzer.get_memory_stats()
         if memory_stats:
-            report += f"Average Usage: {memory_stats.get('average_percent', 0):.2f}%\n"
-            report += f"Peak Usage: {memory_stats.get('peak_percent', 0):.2f}%\n"
-            report += f"Minimum Usage: {memory_stats.get('min_percent', 0):.2f}%\n"
+            lines += [
+                f"Average Usage: {memory_stats.get('average_percent', 0):.2f}%",
+                f"Peak Usage: {memory_stats.get('peak_percent', 0):.2f}%",
+                f"Minimum Usage: {memory_stats.get('min_percent', 0):.2f}%"
+            ]
         
-        report += "\n" + "=" * 60 + "\n"
-        return report
+        lines += ["", REPORT_RULE, ""]
+        return "\n".join(lines)
 
 
 if __name__ == "__main__":
@@ -5,8 +5,10 @@ This module implements automated backup scheduling using APScheduler.
 It provides functionality to schedule, manage, and execute backups at specified intervals.
 """
 
+import functools
 import logging
 import os
+import time
 from datetime import datetime
 from typing import Optional, Callable, Dict, Any
 
@@ -14,6 +16,10 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.jobstores.base import JobLookupError
+from apscheduler.events import (
+    EVENT_SCHEDULER_START, EVENT_ALL_JOBS_REMOVED, EVENT_JOB_ADDED, EVENT_JOB_REMOVED,
+    EVENT_JOB_MODIFIED, EVENT_JOB_SUBMITTED, EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED
+)
 
 
 # Configure logging
@@ -24,6 +30,12 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _cron_trigger(cron_expression: str) -> CronTrigger:
+    """Parse a crontab expression once; triggers hold no per-job state, so jobs can share them."""
+    return CronTrigger.from_crontab(cron_expression)
+
+
 class ScheduledBackupManager:
     """
     Manages scheduled backups using APScheduler.
@@ -45,9 +57,40 @@ class ScheduledBackupManager:
         """
         self.backup_dir = backup_dir or './backups'
         self.scheduler = BackgroundScheduler()
+        # Status entry per job id, kept current by scheduler events while running
+        self._job_mirror: Dict[str, Dict[str, Any]] = {}
+        self.scheduler.add_listener(
+            self._on_job_event,
+            EVENT_SCHEDULER_START | EVENT_ALL_JOBS_REMOVED | EVENT_JOB_ADDED | EVENT_JOB_REMOVED
+            | EVENT_JOB_MODIFIED | EVENT_JOB_SUBMITTED | EVENT_JOB_MAX_INSTANCES | EVENT_JOB_MISSED
+        )
         self._ensure_backup_dir()
         logger.info(f"Initialized ScheduledBackupManager with backup directory: {self.backup_dir}")
     
+    @staticmethod
+    def _job_view(job) -> Dict[str, Any]:
+        """Status entry for a job."""
+        return {
+            'id': job.id,
+            'name': job.name,
+            'trigger': str(job.trigger),
+            # Jobs added before start() have no next run time yet
+            'next_run_time': getattr(job, 'next_run_time', None)
+        }
+    
+    def _on_job_event(self, event) -> None:
+        """Update the job mirror from a scheduler event."""
+        if event.code in (EVENT_SCHEDULER_START, EVENT_ALL_JOBS_REMOVED):
+            self._job_mirror = {job.id: self._job_view(job) for job in self.scheduler.get_jobs()}
+            return
+        
+        # Submitted, missed and skipped runs fire after next_run_time has moved on
+        job = None if event.code == EVENT_JOB_REMOVED else self.scheduler.get_job(event.job_id)
+        if job is None:
+            self._job_mirror.pop(event.job_id, None)
+        else:
+            self._job_mirror[job.id] = self._job_view(job)
+    
     def _ensure_backup_dir(self) -> None:
         """Ensure the backup directory exists."""
         if not os.path.exists(self.backup_dir):
@@ -141,7 +184,7 @@ class ScheduledBackupManager:
         try:
             self.scheduler.add_job(
                 backup_func,
-                trigger=CronTrigger.from_crontab(cron_expression),
+                trigger=_cron_trigger(cron_expression),
                 id=job_id,
                 args=args,
                 kwargs=kwargs,
@@ -249,7 +292,7 @@ class ScheduledBackupManager:
             if trigger_type == "interval":
                 trigger = IntervalTrigger(**trigger_args)
             elif trigger_type == "cron":
-                trigger = CronTrigger.from_crontab(trigger_args.get('cron_expression'))
+                trigger = _cron_trigger(trigger_args.get('cron_expression'))
             else:
                 raise ValueError(f"Unknown trigger type: {trigger_type}")
             
@@ -267,23 +310,22 @@ class ScheduledBackupManager:
         """
         Get the current status of the scheduler.
         
+        While the scheduler runs, jobs are reported from a mirror kept up to
+        date by scheduler events rather than read from the job stores.
+        
         Returns:
             A dictionary containing scheduler status information.
         """
-        jobs = self.scheduler.get_jobs()
+        if self.scheduler.running:
+            jobs = [dict(view) for view in list(self._job_mirror.values())]
+        else:
+            jobs = [self._job_view(job) for job in self.scheduler.get_jobs()]
+        
         return {
             'running': self.scheduler.running,
             'paused': self.scheduler.state == 'paused',
             'total_jobs': len(jobs),
-            'jobs': [
-                {
-                    'id': job.id,
-                    'name': job.name,
-                    'trigger': str(job.trigger),
-                    'next_run_time': job.next_run_time
-                }
-                for job in jobs
-            ],
+            'jobs': jobs,
             'backup_directory': self.backup_dir,
             'timestamp': datetime.utcnow().isoformat()
         }
@@ -305,12 +347,16 @@ def default_backup_function(backup_dir: str) -> None:
     Args:
         backup_dir: The directory where backup should be stored.
     """
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    backup_file = os.path.join(backup_dir, f"backup_{timestamp}.txt")
+    now = time.gmtime()
+    backup_file = os.path.join(backup_dir, f"backup_{time.strftime('%Y%m%d_%H%M%S', now)}.txt")
+    payload = f"Backup created at {time.strftime('%Y-%m-%dT%H:%M:%SZ', now)}\n".encode('ascii')
     
     try:
-        with open(backup_file, 'w') as f:
-            f.write(f"Backup created at {datetime.utcnow().isoformat()}\n")
+        fd = os.open(backup_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
         logger.info(f"Backup completed: {backup_file}")
     except Exception as e:
         logger.error(f"Backup failed: {str(e)}")